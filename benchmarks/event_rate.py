@@ -0,0 +1,81 @@
+"""Measures the rate at which the change callback of a widget is called while a client sends
+a burst of change events, e.g. while a slider is dragged, with and without an event window
+(see `Widget.set_event_window`).
+
+The client side `RateLimit` bounds the events sent by the browser to one per `wait` seconds,
+the numbers below show what reaches the callback of the server for a given rate of events.
+
+    python benchmarks/event_rate.py --events 2000 --rate 1000 --windows 0 0.05 0.1
+"""
+import argparse
+import threading
+import time
+
+from widgets4py.base import Widget
+
+
+class ThreadRunner:
+    """Runs the background tasks of the widget on threads, like `SocketIO` does with the
+    threading async mode"""
+
+    def start_background_task(self, target, *args, **kwargs):
+        thread = threading.Thread(target=target, args=args, kwargs=kwargs, daemon=True)
+        thread.start()
+        return thread
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class BenchWidget(Widget):
+
+    _runner = None
+
+    def __init__(self, name):
+        Widget.__init__(self, name)
+        self._runner = ThreadRunner()
+
+    def _get_socket_io(self):
+        return self._runner
+
+
+def run(events, rate, window):
+    """Fires `events` change events at `rate` events per second and returns the number of
+    callbacks, the seconds taken and the last value seen by the callback"""
+    widget = BenchWidget('slider')
+    if window:
+        widget.set_event_window(window)
+    calls = []
+
+    def on_change(name, props):
+        calls.append(props['value'])
+
+    interval = 1.0 / rate
+    start = time.monotonic()
+    for value in range(events):
+        widget._run_coalesced(on_change, widget.get_name(), {'value': value})
+        delay = start + (value + 1) * interval - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    # Lets the last window end
+    time.sleep(window * 2 if window else 0)
+    elapsed = time.monotonic() - start
+    return calls.__len__(), elapsed, calls[-1] if calls.__len__() > 0 else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument('--events', type=int, default=2000, help="number of change events")
+    parser.add_argument('--rate', type=float, default=1000, help="change events per second")
+    parser.add_argument('--windows', type=float, nargs='+', default=[0, 0.05, 0.1],
+                        help="event windows in seconds, 0 for none")
+    args = parser.parse_args()
+    print("%-10s %10s %10s %12s %10s" % ('window', 'events', 'callbacks', 'callbacks/s', 'last'))
+    for window in args.windows:
+        count, elapsed, last = run(args.events, args.rate, window)
+        print("%-10s %10d %10d %12.1f %10s" % (window or 'none', args.events, count,
+                                                count / elapsed, last))
+
+
+if __name__ == '__main__':
+    main()
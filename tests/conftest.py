@@ -0,0 +1,35 @@
+import pytest
+
+
+class FakeSocketIO:
+    """Stands in for the `SocketIO` server of the websocket widgets. The emitted messages
+    are recorded and the background tasks are kept until the test runs them"""
+
+    def __init__(self):
+        self.emitted = []
+        self.recipients = []
+        self.tasks = []
+
+    def on_namespace(self, namespace):
+        pass
+
+    def start_background_task(self, target, *args):
+        self.tasks.append((target, args))
+
+    def sleep(self, seconds):
+        pass
+
+    def emit(self, event, data, namespace=None, to=None):
+        self.emitted.append((event, data, namespace))
+        self.recipients.append(to)
+
+    def run_tasks(self):
+        """Runs the background tasks started so far, including the ones they start"""
+        while self.tasks.__len__() > 0:
+            target, args = self.tasks.pop(0)
+            target(*args)
+
+
+@pytest.fixture
+def socket_io():
+    return FakeSocketIO()
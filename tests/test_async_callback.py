@@ -0,0 +1,26 @@
+import asyncio
+import threading
+
+import pytest
+
+flask = pytest.importorskip('flask')
+
+from widgets4py.base import Widget  # noqa: E402
+
+
+def test_coroutine_runs_within_the_request_context():
+    app = flask.Flask(__name__)
+    widget = Widget('widget')
+    paths = []
+    done = threading.Event()
+
+    async def callback():
+        paths.append(flask.request.path)
+        await asyncio.sleep(0)
+        paths.append(flask.request.path)
+        done.set()
+
+    with app.test_request_context('/event'):
+        widget._run_callback(callback)
+    assert done.wait(5)
+    assert paths == ['/event', '/event']
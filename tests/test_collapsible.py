@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip('flask_socketio')
+
+from widgets4py.base import Widget  # noqa: E402
+from widgets4py.websocket.jqmobile.ui import Collapsible, CollapsibleSet  # noqa: E402
+
+
+class CountingWidget(Widget):
+
+    renders = 0
+
+    def render(self):
+        self.renders += 1
+        return "<p id='" + self._name + "'></p>"
+
+
+def test_deferred_collapsible_renders_only_header(socket_io):
+    col = Collapsible('col', 'Title', socket_io, deferred=True)
+    col.add(CountingWidget('child'))
+    content = col.render()
+    assert "_head'>Title</h4>" in content
+    assert "id='child'" not in content
+    assert 'load_content' in content
+
+
+def test_expanded_collapsible_renders_content(socket_io):
+    col = Collapsible('col', 'Title', socket_io, deferred=True, is_collapsed=False)
+    col.add(CountingWidget('child'))
+    assert "id='child'" in col.render()
+
+
+def test_render_content_is_cached_until_changed(socket_io):
+    col = Collapsible('col', 'Title', socket_io, deferred=True)
+    child = CountingWidget('child')
+    col.add(child)
+    first = col.render_content()
+    assert col.render_content() is first
+    assert child.renders == 1
+    child.invalidate()
+    col.render_content()
+    assert child.renders == 2
+
+
+def test_items_use_deferred_of_the_set(socket_io):
+    first = Collapsible('first', 'First', socket_io)
+    second = Collapsible('second', 'Second', socket_io, deferred=False)
+    CollapsibleSet('set', None, socket_io, items=[first, second], deferred=True)
+    assert first._is_deferred()
+    assert not second._is_deferred()
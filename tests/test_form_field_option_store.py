@@ -0,0 +1,30 @@
+from widgets4py.polling.w2ui.ui import FormFieldOptionStore
+
+
+def test_prefix_search_ignores_case():
+    store = FormFieldOptionStore(['Berlin', 'bern', 'Boston', 'Athens'])
+    assert [opt['text'] for opt in store.search('BER')] == ['Berlin', 'bern']
+    assert store.search('x') == []
+
+
+def test_items_are_sorted():
+    store = FormFieldOptionStore([{'id': 2, 'text': 'b'}, {'id': 1, 'text': 'A'}])
+    assert [opt['id'] for opt in store.items] == [1, 2]
+
+
+def test_max_results():
+    store = FormFieldOptionStore(['a' + str(num) for num in range(10)], max_results=3)
+    assert store.search('a').__len__() == 3
+    assert store.search('a', max_results=2).__len__() == 2
+    # Never more than the max results of the store
+    assert store.search('a', max_results=20).__len__() == 3
+
+
+def test_search_cache():
+    store = FormFieldOptionStore(['ab', 'ac', 'b'], cache_size=1)
+    first = store.search('a')
+    assert store.search('A') is first
+    store.search('b')
+    assert store._cache.__len__() == 1
+    store.items = ['ad']
+    assert [opt['text'] for opt in store.search('a')] == ['ad']
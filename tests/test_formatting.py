@@ -0,0 +1,57 @@
+import pytest
+
+from widgets4py.formatting import TabularFormatter, escape_column
+
+
+def test_escape_column():
+    assert escape_column(['<b>', 'a&b', 1]) == ['&lt;b&gt;', 'a&amp;b', '1']
+    assert escape_column(['<b>'], escape=False) == ['<b>']
+    assert escape_column([]) == []
+
+
+def test_escape_column_with_separator_in_cell():
+    assert escape_column(['a\x00<', 'b']) == ['a\x00&lt;', 'b']
+
+
+def test_escape_column_format():
+    assert escape_column([1.5, 2], fmt='{:.2f}'.format) == ['1.50', '2.00']
+
+
+def test_format_rows_pads_short_rows():
+    formatter = TabularFormatter()
+    assert formatter.format_rows([[1, '<'], [2]]) == [('1', '&lt;'), ('2', '')]
+
+
+def test_format_rows_without_cells():
+    formatter = TabularFormatter()
+    assert formatter.format_rows([[], []]) == [(), ()]
+    assert formatter.format_rows([]) == []
+
+
+def test_format_column_cache():
+    formatter = TabularFormatter(formats={0: lambda value: value.upper()})
+    cells = formatter.format_column(0, ['a', 'b'])
+    assert formatter.format_column(0, ['a', 'b']) is cells
+    assert formatter.format_column(0, ['a', 'c']) == ['A', 'C']
+    formatter.escape = False
+    assert formatter._cache == {}
+
+
+def test_format_column_cache_holds_every_page():
+    formatter = TabularFormatter(cache_size=2)
+    first = formatter.format_column(0, ['a', 'b'])
+    second = formatter.format_column(0, ['c', 'd'])
+    assert formatter.format_column(0, ['a', 'b']) is first
+    assert formatter.format_column(0, ['c', 'd']) is second
+    formatter.format_column(0, ['e', 'f'])
+    assert formatter._cache.__len__() == 2
+    assert formatter.format_column(1, [['x']]) == ["[&#x27;x&#x27;]"]
+
+
+def test_dropdown_without_title_shows_the_value():
+    flask = pytest.importorskip('flask')
+    from widgets4py.polling.html5.app_ui import DropDown
+    from widgets4py.polling.html5.web_ui import DropDown as SelectList
+    for dropdown in (DropDown('dd', app=flask.Flask(__name__)), SelectList('sl')):
+        dropdown.add_option('opt', None)
+        assert ">opt</option>" in dropdown.render()
@@ -0,0 +1,52 @@
+from widgets4py.polling.w2ui.ui import GridRecord, GridRecordCollection
+
+
+def _collection(count):
+    coll = GridRecordCollection()
+    for num in range(count):
+        coll.add(GridRecord({'qty': num}))
+    return coll
+
+
+def test_recids_are_stable_and_never_reused():
+    coll = _collection(3)
+    assert [rec.record['recid'] for rec in coll.records] == [1, 2, 3]
+    coll.remove_records([3])
+    coll.add(GridRecord({'qty': 10}))
+    assert coll.get(3) is None
+    assert coll.get(4).record['qty'] == 10
+
+
+def test_removed_records_leave_tombstones():
+    coll = _collection(10)
+    coll.remove_records([2, 5])
+    assert coll.count == 8
+    assert coll.get(2) is None
+    assert coll.get(6).record['qty'] == 5
+    assert 'null' not in coll.render()
+    assert [rec.record['recid'] for rec in coll.records] == [1, 3, 4, 6, 7, 8, 9, 10]
+
+
+def test_tombstones_are_compacted():
+    coll = _collection(100)
+    coll.remove_records(list(range(1, 70)))
+    # Compacted once the tombstones make up half of the collection
+    assert None not in coll._records
+    assert coll.count == 31
+    assert coll.get(70).record['qty'] == 69
+    coll.update(70, {'qty': -1})
+    assert coll.get(70).record['qty'] == -1
+
+
+def test_records_with_own_recids():
+    coll = GridRecordCollection([GridRecord({'recid': 'a'}), GridRecord({'recid': 7})])
+    coll.add(GridRecord({'qty': 1}))
+    assert coll.get('a') is not None
+    assert coll.get(8).record['qty'] == 1
+
+
+def test_reading_records_does_not_compact():
+    coll = _collection(4)
+    coll.remove_records([2])
+    assert [rec.record['recid'] for rec in coll.records] == [1, 3, 4]
+    assert coll._records[1] is None
@@ -0,0 +1,29 @@
+from widgets4py.polling.w2ui.ui import GridColumnSummary, GridRecord
+
+
+def test_summary_is_updated_incrementally():
+    summaries = {func: GridColumnSummary('qty', func) for func in ('sum', 'count', 'min', 'max', 'mean')}
+    values = [4, 1, 7]
+    for summary in summaries.values():
+        summary.rebuild(values)
+        summary.add(10)
+        summary.add(None)
+    records = [GridRecord({'qty': value}) for value in values + [10]]
+    assert summaries['sum'].value(records) == 22
+    assert summaries['count'].value(records) == 4
+    assert summaries['min'].value(records) == 1
+    assert summaries['max'].value(records) == 10
+    assert summaries['mean'].value(records) == 5.5
+
+
+def test_summary_rescans_after_removing_min_or_max():
+    summary = GridColumnSummary('qty', 'max')
+    summary.rebuild([1, 5, 3])
+    summary.remove(5)
+    records = [GridRecord({'qty': 1}), None, GridRecord({'qty': 3})]
+    assert summary.value(records) == 3
+
+
+def test_summary_of_empty_column():
+    summary = GridColumnSummary('qty', 'mean')
+    assert summary.value([]) is None
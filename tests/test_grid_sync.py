@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip('flask_socketio')
+
+from widgets4py.websocket.w2ui.ui import (Grid, GridColumn, GridColumnCollection,  # noqa: E402
+                                          GridRecord, GridRecordCollection)
+
+
+def test_batched_record_commands_are_all_sent(socket_io):
+    grid = Grid('grid', 'Grid', GridColumnCollection([GridColumn('a', 'A', '100%')]), socket_io,
+                row_collection=GridRecordCollection())
+    grid.get_sessions().add('sid')
+    with grid.batch():
+        grid.add_record(GridRecord({'a': 1}))
+        grid.add_record(GridRecord({'a': 2}))
+        grid.select_all_records()
+    socket_io.run_tasks()
+    sent = [data for event, data, namespace in socket_io.emitted]
+    assert [data['cmd'] for data in sent] == ['ADD-RECORD', 'ADD-RECORD', 'SELECT-ALL']
+    assert [data['value']['a'] for data in sent[:2]] == [1, 2]
+
+
+def test_records_can_be_changed_without_collection(socket_io):
+    grid = Grid('grid', 'Grid', GridColumnCollection([GridColumn('a', 'A', '100%')]), socket_io)
+    grid.get_sessions().add('sid')
+    grid.update_records({1: {'a': 2}})
+    grid.remove_records([1])
+    socket_io.run_tasks()
+    assert [data['cmd'] for event, data, namespace in socket_io.emitted] == ['UPDATE-RECORDS', 'REMOVE-RECORDS']
+
+
+def test_stream_task_ends_when_idle(socket_io):
+    grid = Grid('grid', 'Grid', GridColumnCollection([GridColumn('a', 'A', '100%')]), socket_io)
+    grid.add_records([GridRecord({'a': 1})])
+    grid.stream_cells(1, {'a': 2})
+    grid.stream_cells(1, {'a': 3})
+    assert [task for task, args in socket_io.tasks].count(grid._flush_stream) == 1
+    socket_io.run_tasks()
+    merges = [data for event, data, namespace in socket_io.emitted if data['cmd'] == 'MERGE-RECORDS']
+    assert merges == [{'cmd': 'MERGE-RECORDS', 'value': [[1, {'a': 3}]]}]
+    # The task has ended, the next change starts a new one
+    grid.stream_cells(1, {'a': 4})
+    assert [task for task, args in socket_io.tasks] == [grid._flush_stream]
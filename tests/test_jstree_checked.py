@@ -0,0 +1,65 @@
+import pytest
+
+flask = pytest.importorskip('flask')
+
+from widgets4py.polling.jstree.ui import JSTree, JSTreeNode, _encode_ranges  # noqa: E402
+
+
+def make_tree():
+    tree = JSTree('tree')
+    parent = JSTreeNode('parent', 'Parent', child_nodes=[JSTreeNode('a', 'A'), JSTreeNode('b', 'B')])
+    tree.add(parent)
+    tree.add(JSTreeNode('other', 'Other'))
+    return tree
+
+
+def post_checked(tree, checked, loaded):
+    app = flask.Flask(__name__)
+    form = {'checked': flask.json.dumps(_encode_ranges(checked)),
+            'loaded': flask.json.dumps(_encode_ranges(loaded))}
+    with app.test_request_context(method='POST', data=form):
+        tree._process_checked_callback()
+
+
+def bit(tree, node_id):
+    return 1 << tree.get_node(node_id)._index
+
+
+def test_client_state_merges_over_loaded_nodes():
+    tree = make_tree()
+    tree.check_node('other')
+    # The client has loaded the parent and its children only, nothing is checked there
+    post_checked(tree, bit(tree, 'a'), bit(tree, 'parent') | bit(tree, 'a') | bit(tree, 'b'))
+    assert sorted(tree.get_checked()) == ['a', 'other']
+
+
+def test_three_state_updates_parents():
+    tree = make_tree()
+    tree.check_node('a')
+    assert not tree.is_checked('parent')
+    tree.check_node('b')
+    assert tree.is_checked('parent')
+    tree.uncheck_node('a')
+    assert not tree.is_checked('parent')
+
+
+def test_lazy_data_carries_checked_state():
+    tree = make_tree()
+    tree.check_node('a')
+    data = tree.get_node('a').get_data()
+    assert data['state']['checked'] and data['state']['selected']
+    assert 'checked' not in tree.get_node('b').get_data()['state']
+
+
+def test_indexes_are_reused_after_deletion_is_delivered():
+    tree = make_tree()
+    tree.get_changes()
+    index = tree.get_node('other')._index
+    tree.remove(tree.get_node('other'))
+    tree.add(JSTreeNode('first', 'First'))
+    # The client has not got the deletion yet
+    assert tree.get_node('first')._index != index
+    tree.get_changes()
+    tree.add(JSTreeNode('second', 'Second'))
+    assert tree.get_node('second')._index == index
+    assert not tree.is_checked('second')
@@ -0,0 +1,17 @@
+from widgets4py.polling.jstree.ui import _encode_ranges, _decode_ranges
+
+
+def test_encode_empty_bitset():
+    assert _encode_ranges(0) == []
+    assert _decode_ranges([]) == 0
+
+
+def test_encode_ranges():
+    # Nodes 0, 1, 2, 5 and 7 are checked
+    bits = 0b10100111
+    assert _encode_ranges(bits) == [0, 3, 5, 6, 7, 8]
+
+
+def test_round_trip():
+    for bits in (1, 0b10, 0b1011, (1 << 100) - 1, (1 << 100) | 1, 0b110011001110001):
+        assert _decode_ranges(_encode_ranges(bits)) == bits
@@ -0,0 +1,62 @@
+from widgets4py.base import Outbox, Widget
+
+
+def _widget(name):
+    widget = Widget(name)
+    widget.get_sessions().add('sid')
+    return widget
+
+
+def test_superseded_property_changes_are_dropped(socket_io):
+    outbox = Outbox(socket_io)
+    widget = _widget('w')
+    for value in range(3):
+        outbox.put(widget, 'sync', {'cmd': 'value', 'value': value}, '/w', key='value')
+    outbox.put(widget, 'sync', {'cmd': 'title', 'value': 't'}, '/w', key='title')
+    socket_io.run_tasks()
+    assert socket_io.emitted == [('sync', {'cmd': 'value', 'value': 2}, '/w'),
+                                 ('sync', {'cmd': 'title', 'value': 't'}, '/w')]
+
+
+def test_messages_without_key_are_all_sent(socket_io):
+    outbox = Outbox(socket_io)
+    widget = _widget('w')
+    for recid in range(3):
+        outbox.put(widget, 'sync', {'cmd': 'ADD-RECORD', 'value': recid}, '/w')
+    socket_io.run_tasks()
+    assert [data['value'] for event, data, namespace in socket_io.emitted] == [0, 1, 2]
+
+
+def test_single_background_task(socket_io):
+    outbox = Outbox(socket_io)
+    widget = _widget('w')
+    outbox.put(widget, 'sync', {}, '/w')
+    outbox.put(widget, 'sync', {}, '/w')
+    assert socket_io.tasks.__len__() == 1
+    socket_io.run_tasks()
+    outbox.put(widget, 'sync', {}, '/w')
+    assert socket_io.tasks.__len__() == 1
+
+
+def test_widgets_without_sessions_are_skipped(socket_io):
+    outbox = Outbox(socket_io)
+    outbox.put(Widget('w'), 'sync', {}, '/w')
+    socket_io.run_tasks()
+    assert socket_io.emitted == []
+
+
+def test_batch_collapses_property_changes(socket_io):
+    widget = _widget('w')
+    widget._socket_io = socket_io
+    with widget.batch():
+        widget._emit('sync', {'cmd': 'a', 'value': 1}, namespace='/w', key='a')
+        widget._emit('sync', {'cmd': 'a', 'value': 2}, namespace='/w', key='a')
+        widget._emit('sync', {'cmd': 'b', 'value': 3}, namespace='/w', key='b')
+        widget._emit('sync', {'cmd': 'ADD', 'value': 4}, namespace='/w')
+        widget._emit('sync', {'cmd': 'ADD', 'value': 5}, namespace='/w')
+    assert socket_io.emitted == []
+    socket_io.run_tasks()
+    assert socket_io.emitted == [('sync', {'cmd': 'batch', 'value': [{'cmd': 'a', 'value': 2},
+                                                                      {'cmd': 'b', 'value': 3}]}, '/w'),
+                                 ('sync', {'cmd': 'ADD', 'value': 4}, '/w'),
+                                 ('sync', {'cmd': 'ADD', 'value': 5}, '/w')]
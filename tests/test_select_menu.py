@@ -0,0 +1,13 @@
+import pytest
+
+pytest.importorskip('flask_socketio')
+
+from widgets4py.websocket.jqmobile.ui import SelectMenu  # noqa: E402
+
+
+def test_large_options_keep_the_selected_flags(socket_io):
+    options = [{'option_value': value, 'option_title': value.upper(), 'selected': value in ('b', 'c'),
+                'disabled': False, 'opt_group': None} for value in ('a', 'b', 'c')]
+    menu = SelectMenu('menu', socket_io, options=options, large_options=True)
+    assert menu.selected_values == ['b', 'c']
+    assert menu.option_store.__len__() == 3
@@ -0,0 +1,19 @@
+from widgets4py.polling.w2ui.ui import Sidebar, SidebarNode
+
+
+def _sidebar():
+    group = SidebarNode('group', 'Group', nodes=[SidebarNode('leaf', 'Leaf', is_leaf=True)])
+    return Sidebar('sidebar', nodes=[group], lazy_load=True)
+
+
+def test_lazy_group_renders_its_header_only():
+    sidebar = _sidebar()
+    assert sidebar._render_items(sidebar._child_widgets)[0]['plus']
+    assert sidebar.get_children('group')[0]['id'] == 'leaf'
+
+
+def test_loading_children_leaves_the_shared_node_collapsed():
+    sidebar = _sidebar()
+    sidebar.get_children('group')
+    # Other clients still get the group collapsed
+    assert sidebar._render_items(sidebar._child_widgets)[0]['plus']
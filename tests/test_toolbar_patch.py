@@ -0,0 +1,62 @@
+import pytest
+
+flask = pytest.importorskip('flask')
+
+from widgets4py.polling.w2ui.ui import ToolbarButton, ToolbarClientState  # noqa: E402
+
+
+def _items(*names):
+    return {name: ToolbarButton(name, name) for name in names}
+
+
+def test_patch_holds_only_items_changed_for_the_client():
+    items = _items('a', 'b')
+    client = ToolbarClientState({name: item.get_state() for name, item in items.items()})
+    assert client.next_patch(items) is None
+    items['a'].hidden = True
+    client.mark_dirty('a')
+    assert client.next_patch(items) == {'hide': ['a'], 'rev': 1}
+    # Changed back before the client acknowledged the patch
+    items['a'].hidden = False
+    client.mark_dirty('a')
+    assert client.next_patch(items) == {'show': ['a'], 'rev': 2}
+
+
+def test_lost_patches_are_diffed_again():
+    items = _items('a')
+    client = ToolbarClientState({'a': items['a'].get_state()})
+    items['a'].disabled = True
+    client.mark_dirty('a')
+    client.next_patch(items)
+    client.ack(0, resend=True)
+    assert client.next_patch(items) == {'disable': ['a'], 'rev': 2}
+
+
+def test_unacknowledged_patches_are_capped():
+    items = _items('a')
+    client = ToolbarClientState({'a': items['a'].get_state()}, max_sent=4)
+    for num in range(10):
+        items['a'].checked = num % 2 == 0
+        client.mark_dirty('a')
+        client.next_patch(items)
+    assert client._sent.__len__() == 4
+
+
+def test_websocket_toolbar_patches_each_client(socket_io):
+    pytest.importorskip('flask_socketio')
+    from widgets4py.websocket.w2ui.ui import Toolbar, ToolbarButton as Button
+    toolbar = Toolbar('toolbar', socket_io, items=[Button('a', 'A'), Button('b', 'B')])
+    toolbar.render()
+    app = flask.Flask(__name__)
+    for sid in ('one', 'two'):
+        with app.test_request_context():
+            flask.request.sid = sid
+            toolbar.on_connect()
+    toolbar.hide_item('a')
+    assert socket_io.recipients == ['one', 'two']
+    assert [data['value'] for event, data, namespace in socket_io.emitted] == [{'hide': ['a'], 'rev': 1}] * 2
+    with app.test_request_context():
+        flask.request.sid = 'two'
+        toolbar.on_disconnect()
+    toolbar.disable_item('b')
+    assert socket_io.recipients == ['one', 'two', 'one']
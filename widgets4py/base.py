@@ -5,6 +5,152 @@ Author: Ajeet Singh
 Date: 06/24/2019
 """
 from enum import Enum
+from collections import deque, OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock, Thread
+from flask import has_request_context, copy_current_request_context, request
+from flask.globals import request_ctx
+import asyncio
+import inspect
+import logging
+import time
+try:
+    from flask_socketio import emit
+except ImportError:
+    # Only the websocket widgets emit messages, the polling widgets run without Flask-SocketIO
+    emit = None
+
+
+class Outbox:
+    """A thread-safe queue of the messages sent by the widgets outside of a Socket.IO event,
+    e.g. by a background job updating a progress bar. The queue is drained by a single
+    background task of the `SocketIO` server, which is started when a message is queued and
+    stops once the queue is empty. A queued property change which is superseded by a newer
+    one before it is sent is dropped, and the messages of a widget are sent at most once in
+    the push interval of the widget
+    """
+
+    _socket_io = None
+    _interval = None
+    _lock = None
+    _pending = None
+    _next_push = None
+    _running = None
+
+    def __init__(self, socket_io, interval=0.05):
+        """Below are the parameters of this class
+
+            Args:
+                socket_io (SocketIO): The server used to emit the messages
+                interval (float): Seconds the background task sleeps between the rounds
+        """
+        self._socket_io = socket_io
+        self._interval = interval
+        self._lock = Lock()
+        self._pending = OrderedDict()
+        self._next_push = {}
+        self._running = False
+
+    def put(self, widget, event, data, namespace=None, key=None):
+        """Queues a message of the widget, see `Widget._emit` for the arguments"""
+        with self._lock:
+            self._pending[(event, namespace, key if key is not None else object())] = (widget, data)
+            if not self._running:
+                self._running = True
+                self._socket_io.start_background_task(self._drain)
+
+    def _take_ready(self):
+        now = time.monotonic()
+        ready = []
+        with self._lock:
+            for msg_key, (widget, data) in list(self._pending.items()):
+                if self._next_push.get(widget, 0) <= now:
+                    del self._pending[msg_key]
+                    ready.append((msg_key, widget, data))
+            for msg_key, widget, data in ready:
+                if widget.get_push_interval() is not None:
+                    self._next_push[widget] = now + widget.get_push_interval()
+            if ready.__len__() == 0 and self._pending.__len__() == 0:
+                self._running = False
+        return ready
+
+    def _drain(self):
+        while True:
+            self._socket_io.sleep(self._interval)
+            ready = self._take_ready()
+            if ready.__len__() == 0 and not self._running:
+                return
+            for (event, namespace, key), widget, data in ready:
+                if widget.get_sessions().__len__() == 0:
+                    # No client has the widget mounted
+                    continue
+                try:
+                    self._socket_io.emit(event, data, namespace=namespace)
+                except Exception:
+                    logging.getLogger(__name__).exception("Failed to push '%s' of widget '%s'",
+                                                          event, widget.get_name())
+
+
+_outboxes = {}
+_outboxes_lock = Lock()
+
+
+def get_outbox(socket_io):
+    """Returns the `Outbox` of the `SocketIO` server, created on the first call"""
+    with _outboxes_lock:
+        outbox = _outboxes.get(id(socket_io))
+        if outbox is None:
+            outbox = Outbox(socket_io)
+            _outboxes[id(socket_io)] = outbox
+    return outbox
+
+
+def _call(callback, *args):
+    # Runs the callback on a worker of the executor, coroutines are run to completion
+    result = callback(*args)
+    if inspect.iscoroutine(result):
+        result = asyncio.run(result)
+    return result
+
+
+_event_loop = None
+_event_loop_lock = Lock()
+
+
+def set_event_loop(loop):
+    """Sets the running asyncio event loop on which the coroutine callbacks of the widgets
+    are scheduled, for example the loop of an async server
+
+        Args:
+            loop (AbstractEventLoop): A running event loop
+    """
+    global _event_loop
+    _event_loop = loop
+
+
+def get_event_loop():
+    """Returns the asyncio event loop on which the coroutine callbacks of the widgets are
+    scheduled. If no loop was set using `set_event_loop`, a loop is started on a daemon
+    thread the first time it is required
+    """
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            Thread(target=_event_loop.run_forever, daemon=True).start()
+    return _event_loop
+
+
+async def _in_request_context(coro, ctx):
+    # The task running the coroutine has its own copy of the context variables, so the
+    # request context is pushed once for all the steps of the coroutine and is seen by no
+    # other task. The coroutine can use `request` and `emit` like a plain callback does
+    ctx.push()
+    try:
+        return await coro
+    finally:
+        ctx.pop()
 
 
 class Widget:
@@ -56,6 +202,23 @@ class Widget:
 
     _root_widget = None
 
+    _executor = None
+    _max_concurrency = None
+    _running_callbacks = None
+    _pending_callbacks = None
+    _callback_lock = None
+
+    _batch_depth = 0
+    _batched = None
+    _revision = 0
+
+    _sessions = None
+    _push_interval = None
+
+    _event_window = None
+    _coalesced = None
+    _coalesce_lock = None
+
     def __init__(self, name, desc=None, tag=None, prop=None, style=None, attr=None, css_cls=None):
         """The default constructor have the following arguments...
 
@@ -123,6 +286,257 @@ class Widget:
         """
         return self._name
 
+    def set_executor(self, executor, max_concurrency=None):
+        """Runs the event callbacks of this widget on the passed executor instead of the
+        request or socket handler which received the event. The handler returns right
+        away and the changes made by the callback reach the client through the widget's
+        usual sync channel. Coroutine callbacks are run to completion on the worker
+
+            Args:
+                executor (Executor): An executor from `concurrent.futures`, `None` to run
+                                    the callbacks inline again. Callbacks submitted to a
+                                    process pool are not bound to the request and should
+                                    be picklable
+                max_concurrency (int): Maximum number of callbacks of this widget running at
+                                    the same time, further callbacks wait for their turn.
+                                    Defaults to 1, i.e. the callbacks run in the order of
+                                    the events
+        """
+        self._executor = executor
+        if max_concurrency is not None:
+            self._max_concurrency = max_concurrency
+        else:
+            self._max_concurrency = 1
+        self._running_callbacks = 0
+        self._pending_callbacks = deque()
+        self._callback_lock = Lock()
+
+    def _run_callback(self, callback, *args):
+        """Calls the callback with the passed args and returns its result. If an executor is
+        set, the callback is submitted to it and `None` is returned. A coroutine returned by
+        an `async def` callback is scheduled on the event loop returned by `get_event_loop`
+        and `None` is returned
+        """
+        if self._executor is None:
+            result = callback(*args)
+            if inspect.iscoroutine(result):
+                return self._schedule_coroutine(result)
+            return result
+        if has_request_context() and not isinstance(self._executor, ProcessPoolExecutor):
+            # Lets the callback use the request and emit to the client which sent the event
+            callback = copy_current_request_context(callback)
+        with self._callback_lock:
+            if self._running_callbacks >= self._max_concurrency:
+                self._pending_callbacks.append((callback, args))
+                return None
+            self._running_callbacks += 1
+        self._submit_to_executor(callback, args)
+        return None
+
+    def set_event_window(self, window):
+        """Coalesces the events of this widget which are delivered to a callback through
+        `_run_coalesced`, e.g. the change events of a slider being dragged. The callback is
+        called once at the end of the window with the latest event, instead of once per event
+
+            Args:
+                window (float): Length of the window in seconds, `None` to call the callback
+                                for every event again
+        """
+        if self._coalesce_lock is None:
+            self._coalesced = {}
+            self._coalesce_lock = Lock()
+        self._event_window = window
+
+    def _run_coalesced(self, callback, *args):
+        """Calls the callback like `_run_callback`, but only with the latest args received
+        within the event window of the widget"""
+        window = self._event_window
+        if not window:
+            return self._run_callback(callback, *args)
+        call = callback
+        if has_request_context():
+            # The callback of the latest event runs with the request of that event
+            call = copy_current_request_context(callback)
+        with self._coalesce_lock:
+            scheduled = callback in self._coalesced
+            self._coalesced[callback] = (call, args)
+        if not scheduled:
+            self._get_socket_io().start_background_task(self._deliver_coalesced, callback, window)
+        return None
+
+    def _deliver_coalesced(self, callback, window):
+        self._get_socket_io().sleep(window)
+        with self._coalesce_lock:
+            pending = self._coalesced.pop(callback, None)
+        if pending is None:
+            return
+        call, args = pending
+        try:
+            self._run_callback(call, *args)
+        except Exception:
+            logging.getLogger(__name__).exception("Callback of widget '%s' failed", self._name)
+
+    def _schedule_coroutine(self, coro):
+        if has_request_context():
+            coro = _in_request_context(coro, request_ctx.copy())
+        future = asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+        future.add_done_callback(self._log_callback_error)
+        return None
+
+    def _log_callback_error(self, future):
+        if not future.cancelled() and future.exception() is not None:
+            logging.getLogger(__name__).error("Callback of widget '%s' failed", self._name,
+                                              exc_info=future.exception())
+
+    def _submit_to_executor(self, callback, args):
+        future = self._executor.submit(_call, callback, *args)
+        future.add_done_callback(self._callback_done)
+
+    def _callback_done(self, future):
+        self._log_callback_error(future)
+        with self._callback_lock:
+            if self._pending_callbacks.__len__() == 0:
+                self._running_callbacks -= 1
+                return
+            callback, args = self._pending_callbacks.popleft()
+        self._submit_to_executor(callback, args)
+
+    @contextmanager
+    def batch(self):
+        """Collects the messages sent by the property setters of this widget and all of its
+        child widgets, and sends them once the `with` block is left. Repeated writes to the
+        same property are collapsed into the last one and the property changes of a widget
+        are sent as a single message, so the client applies and refreshes them at once::
+
+            with page.batch():
+                button.title = 'Save'
+                button.disabled = True
+                listview.theme = 'b'
+
+        Batches can be nested, the messages are sent when the outermost batch is left
+        """
+        widgets = []
+        self._begin_batch(widgets)
+        try:
+            yield self
+        finally:
+            for widget in widgets:
+                widget._end_batch()
+
+    def _get_all_children(self):
+        """All the child widgets of this widget, including the ones which are not kept in the
+        list of children, e.g. header widgets of a page"""
+        return self._child_widgets
+
+    def get_revision(self):
+        """A counter which is increased whenever the widget sends a property change to the
+        client or a child is added or removed, i.e. whenever the rendered content changes"""
+        return self._revision
+
+    def get_tree_revision(self):
+        """The revisions of this widget and all of its child widgets, it changes whenever the
+        rendered content of any of these widgets changes"""
+        revisions = [(id(self), self._revision)]
+        for child in self._get_all_children():
+            if isinstance(child, Widget):
+                revisions.extend(child.get_tree_revision())
+        return revisions
+
+    def invalidate(self):
+        """Marks the rendered content of the widget as changed, to be called after changes
+        which are not sent to the client through a property change"""
+        self._revision += 1
+
+    def _begin_batch(self, widgets):
+        if self._batch_depth == 0:
+            self._batched = OrderedDict()
+        self._batch_depth += 1
+        widgets.append(self)
+        for child in self._get_all_children():
+            if isinstance(child, Widget):
+                child._begin_batch(widgets)
+
+    def _end_batch(self):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            batched = self._batched
+            self._batched = None
+            self._flush_batch(batched)
+
+    def _emit(self, event, data, namespace=None, key=None):
+        """Emits a message to the client side of the widget. Within a `batch` the message is
+        held back, and replaces an earlier held back message of the same event and key. Outside
+        of a Socket.IO event the message is queued in the `Outbox` of the server and sent to
+        all the clients having the widget mounted
+
+            Args:
+                event (string): Name of the event
+                data (dict): Data of the message, a property change in the `{'cmd': ...,
+                             'value': ...}` format or a full set of properties
+                namespace (string): Namespace of the widget
+                key (string): The property changed by the message, messages without a key
+                              are never collapsed or batched
+        """
+        self._revision += 1
+        if self._batch_depth == 0:
+            if has_request_context() and getattr(request, 'namespace', None) is not None:
+                emit(event, data, namespace=namespace)
+            else:
+                # Not within a Socket.IO event, e.g. a background thread
+                get_outbox(self._get_socket_io()).put(self, event, data, namespace, key)
+        elif key is not None:
+            self._batched[(event, namespace, key)] = data
+        else:
+            self._batched[(event, namespace, object())] = data
+
+    def _get_socket_io(self):
+        """The `SocketIO` server of the widget, used to push the messages sent outside of
+        a Socket.IO event"""
+        return self._socket_io
+
+    def get_sessions(self):
+        """The session ids of the clients connected to the namespace of this widget"""
+        if self._sessions is None:
+            self._sessions = set()
+        return self._sessions
+
+    def get_push_interval(self):
+        return self._push_interval
+
+    def set_push_interval(self, interval):
+        """Sends the messages of this widget queued from outside of a Socket.IO event (e.g. a
+        background thread) at most once in the interval, intermediate changes of the same
+        property are dropped
+
+            Args:
+                interval (float): Seconds between two pushes, `None` to push right away
+        """
+        self._push_interval = interval
+
+    def on_connect(self, auth=None):
+        """Called by websocket when a client connects to the namespace of the widget"""
+        self.get_sessions().add(request.sid)
+
+    def on_disconnect(self):
+        """Called by websocket when a client disconnects from the namespace of the widget"""
+        self.get_sessions().discard(request.sid)
+
+    def _flush_batch(self, batched):
+        # The property changes of an event are sent as one 'batch' command, in place of the
+        # first of them, other messages are sent as they are
+        events = OrderedDict()
+        for (event, namespace, key), data in batched.items():
+            events.setdefault((event, namespace), []).append((data, isinstance(key, str)))
+        for (event, namespace), messages in events.items():
+            changes = [data for data, is_property in messages if is_property]
+            sent = False
+            for data, is_property in messages:
+                if not is_property or changes.__len__() == 1:
+                    self._emit(event, data, namespace=namespace)
+                elif not sent:
+                    self._emit(event, {'cmd': 'batch', 'value': changes}, namespace=namespace)
+                    sent = True
+
     def set_root_widget(self, root_widget):
         """Sets the widget passed as arg as the root element of GUI structure
 
@@ -141,6 +555,7 @@ class Widget:
         child.set_root_widget(self._root_widget)
         child.set_parent(self)
         self._child_widgets.append(child)
+        self._revision += 1
 
     def remove(self, child):
         """Removes an child widget from the current parent widget. The child should
@@ -150,6 +565,7 @@ class Widget:
                 child (Widget): Child that needs to be removed from parent widget
         """
         self._child_widgets.remove(child)
+        self._revision += 1
 
     def set_properties(self, prop):
         """ Sets the list of properties to the current widget. The properties can be
@@ -0,0 +1,135 @@
+"""This module contains the helpers used by the tabular widgets (tables, dropdowns,
+lists, etc.) to convert their cells to text and escape them for HTML. The cells
+are processed a column at a time instead of one by one.
+"""
+from collections import OrderedDict
+from itertools import zip_longest
+
+
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;',
+                                    '"': '&quot;', "'": '&#x27;'})
+_SEPARATOR = '\x00'
+
+
+def escape_column(values, escape=True, fmt=None):
+    """Converts all the values of a column to text and escapes them for HTML. The
+    texts are joined and escaped with a single `str.translate` call
+
+        Args:
+            values (iterable): Values of the column
+            escape (boolean): Whether the texts should be escaped or used as HTML
+            fmt (callable, optional): Converts a value to text, `str` by default
+
+        Returns:
+            list: The formatted text of each value
+    """
+    cells = list(map(fmt if fmt is not None else str, values))
+    if not escape or cells.__len__() == 0:
+        return cells
+    text = _SEPARATOR.join(cells)
+    if text.count(_SEPARATOR) != cells.__len__() - 1:
+        # One of the cells contains the separator itself
+        return [cell.translate(_HTML_ESCAPE_TABLE) for cell in cells]
+    return text.translate(_HTML_ESCAPE_TABLE).split(_SEPARATOR)
+
+
+class TabularFormatter:
+    """Formats the rows of a tabular widget column by column. The formatted cells of
+    the recently formatted columns are cached by the column index and the values they
+    were formatted from, so a column (or a page of a column) whose values are not changed
+    since it was last formatted is not formatted again
+    """
+
+    _escape = None
+    _formats = None
+    _cache = None
+    _cache_size = None
+
+    def __init__(self, escape=True, formats=None, cache_size=None):
+        """Below are the parameters of this class
+
+            Args:
+                escape (boolean): Escapes the cells for HTML if True, otherwise the cells
+                                  are expected to be HTML already
+                formats (dict, optional): A dict of column index and a callable which
+                                          converts the values of that column to text,
+                                          e.g. {2: '{:.2f}'.format}
+                cache_size (int): Number of formatted columns to be cached
+        """
+        self._escape = escape
+        if formats is not None:
+            self._formats = formats
+        else:
+            self._formats = {}
+        if cache_size is not None:
+            self._cache_size = cache_size
+        else:
+            self._cache_size = 64
+        self._cache = OrderedDict()
+
+    @property
+    def escape(self):
+        return self._escape
+
+    @escape.setter
+    def escape(self, val):
+        if val != self._escape:
+            self._escape = val
+            self.clear()
+
+    @property
+    def formats(self):
+        return self._formats
+
+    @formats.setter
+    def formats(self, val):
+        self._formats = val
+        self.clear()
+
+    def clear(self):
+        """Drops the cached cells of all the columns"""
+        self._cache = OrderedDict()
+
+    def format_column(self, index, values):
+        """Formats the values of the column at `index`
+
+            Args:
+                index (int): Index of the column, used to pick the format and the cache
+                values (iterable): Values of the column
+
+            Returns:
+                list: The formatted text of each value
+        """
+        values = tuple(values)
+        key = (index, values)
+        try:
+            cells = self._cache.get(key)
+        except TypeError:
+            # Unhashable values, e.g. lists, are formatted every time
+            return escape_column(values, self._escape, self._formats.get(index))
+        if cells is not None:
+            self._cache.move_to_end(key)
+            return cells
+        cells = escape_column(values, self._escape, self._formats.get(index))
+        self._cache[key] = cells
+        if self._cache.__len__() > self._cache_size:
+            self._cache.popitem(last=False)
+        return cells
+
+    def format_rows(self, rows):
+        """Formats a sequence of rows. Rows shorter than the others are padded with
+        empty cells
+
+            Args:
+                rows (sequence): A sequence of rows, where every row is a sequence of values
+
+            Returns:
+                list: A list of rows, where every row is a tuple of formatted cells
+        """
+        rows = list(rows)
+        columns = zip_longest(*rows, fillvalue='')
+        cells = [self.format_column(index, values) for index, values in enumerate(columns)]
+        if cells.__len__() == 0:
+            # None of the rows has a cell
+            return [() for row in rows]
+        return list(zip(*cells))
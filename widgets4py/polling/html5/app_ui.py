@@ -6,6 +6,7 @@ Date: 06/25/2019
 """
 import os
 from widgets4py.base import Widget
+from widgets4py.formatting import TabularFormatter
 from flask import json, request
 
 
@@ -131,7 +132,7 @@ class Button(Widget):
             if dsbld is not None:
                 self._disabled = True if dsbld == "true" else False
                 props['disabled'] = self._disabled
-        return json.dumps({"result": self._onclick_callback(self._name, props)})
+        return json.dumps({"result": self._run_callback(self._onclick_callback, self._name, props)})
 
     def _set_title(self, title):
         self._title = title
@@ -309,7 +310,7 @@ class TextBox(Widget):
             if dsbld is not None:
                 self._disabled = True if dsbld == "true" else False
                 props['disabled'] = self._disabled
-        return json.dumps({"result": self._onchange_callback(self._name, props)})
+        return json.dumps({"result": self._run_callback(self._onchange_callback, self._name, props)})
 
     def on_change(self, onchange_callback, app=None):
         """Attaches an callback handler to an Textbox"""
@@ -503,7 +504,7 @@ class CheckBox(Widget):
             if val is not None:
                 self._value = val
                 props['value'] = self._value
-        return json.dumps({"result": self._onclick_callback(self._name, props)})
+        return json.dumps({"result": self._run_callback(self._onclick_callback, self._name, props)})
 
     def _set_title(self, title):
         self._title = title
@@ -726,7 +727,7 @@ class Color(Widget):
 
     def _process_onclick_callback(self):
         props = {}
-        return json.dumps({'result': self._onclick_callback(self._name, props)})
+        return json.dumps({'result': self._run_callback(self._onclick_callback, self._name, props)})
 
     def _process_onchange_callback(self):
         props = {}
@@ -739,7 +740,7 @@ class Color(Widget):
             if dsbld is not None:
                 self._disabled = True if dsbld == "true" else False
                 props['disabled'] = self._disabled
-        return json.dumps({'result': self._onchange_callback(self._name, props)})
+        return json.dumps({'result': self._run_callback(self._onchange_callback, self._name, props)})
 
     def _set_value(self, val):
         self._value = val
@@ -987,7 +988,7 @@ class Date(Widget):
 
     def _process_onclick_callback(self):
         props = {}
-        return json.dumps({'result': self._onclick_callback(self._name, props)})
+        return json.dumps({'result': self._run_callback(self._onclick_callback, self._name, props)})
 
     def _process_onchange_callback(self):
         props = {}
@@ -1012,7 +1013,7 @@ class Date(Widget):
             if rdOnly is not None:
                 self._readonly = True if rdOnly == 'true' else False
                 props['readOnly'] = self._readonly
-        return json.dumps({'result': self._onchange_callback(self._name, props)})
+        return json.dumps({'result': self._run_callback(self._onchange_callback, self._name, props)})
 
     def _set_value(self, val):
         self._value = val
@@ -1310,7 +1311,7 @@ class File(Widget):
 
     def _process_onclick_callback(self):
         props = {}
-        return json.dumps({'result': self._onclick_callback(self._name, props)})
+        return json.dumps({'result': self._run_callback(self._onclick_callback, self._name, props)})
 
     def _process_onchange_callback(self):
         props = {}
@@ -1332,7 +1333,7 @@ class File(Widget):
                 file.save(os.path.join(self._upload_folder, filename))
                 props['filename'] = filename
                 props['upload_path'] = self._upload_folder
-        return json.dumps({'result': self._onchange_callback(self._name, props)})
+        return json.dumps({'result': self._run_callback(self._onchange_callback, self._name, props)})
 
     def _set_upload_folder(self, upload_folder):
         self._upload_folder = upload_folder
@@ -1727,7 +1728,8 @@ class Form(Widget):
         if request.form.__len__() > 0:
             self._submitted_form_data = request.form
         if self._form_submit_callback is not None:
-            return json.dumps({'result': self._form_submit_callback(self._name, request.form)})
+            return json.dumps({'result': self._run_callback(self._form_submit_callback, self._name,
+                                                            request.form)})
         return json.dumps({'result': ''})
 
     def get_submitted_form_data(self):
@@ -1760,6 +1762,7 @@ class DropDown(Widget):
     """
 
     _options = None
+    _formatter = None
     _size = None
     _required = None
     _disabled = None
@@ -1809,6 +1812,7 @@ class DropDown(Widget):
             self._options = options
         else:
             self._options = {}
+        self._formatter = TabularFormatter()
         self._onchange_callback = onchange_callback
         self._onclick_callback = onclick_callback
         self._app = app
@@ -1875,7 +1879,7 @@ class DropDown(Widget):
                                        self._process_onchange_callback)
 
     def _process_onclick_callback(self):
-        return json.dumps({'result': self._onclick_callback()})
+        return json.dumps({'result': self._run_callback(self._onclick_callback)})
 
     def _process_onchange_callback(self):
         if request.args.__len__() > 0:
@@ -1885,7 +1889,7 @@ class DropDown(Widget):
             val = request.args["value"]
             if val is not None:
                 self._value = val
-        return json.dumps({'result': self._onchange_callback()})
+        return json.dumps({'result': self._run_callback(self._onchange_callback)})
 
     def _set_size(self, size):
         """Sets the size of the dropdown's height based on number of rows passed
@@ -2012,19 +2016,15 @@ class DropDown(Widget):
         """
         content = self._render_pre_content('select')
         content += "\n"
-        for opt in self._options:
-            opt_list = self._options.get(opt)
-            title = str(opt_list[0])
-            is_selected = opt_list[1]
-            content += "<option value='" + opt + "' "
+        cells = self._formatter.format_rows(
+            [(opt, self._options.get(opt)[0] if self._options.get(opt)[0] is not None else opt)
+             for opt in self._options])
+        for opt, (value, title) in zip(self._options, cells):
+            is_selected = self._options.get(opt)[1]
+            content += "<option value='" + value + "' "
             if is_selected:
                 content += "selected "
-            content += ">"
-            if title is not None:
-                content += title
-            else:
-                content += opt
-            content += "</option>"
+            content += ">" + title + "</option>"
         self._widget_content = content + self._render_post_content('select')
         self._widget_content += "\n" + self._attach_polling()
         return self._widget_content
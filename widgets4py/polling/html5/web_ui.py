@@ -5,6 +5,7 @@ Author: Ajeet Singh
 Date: 06/25/2019
 """
 from widgets4py.base import Widget
+from widgets4py.formatting import TabularFormatter
 
 
 class Button(Widget):
@@ -661,6 +662,7 @@ class DropDown(Widget):
     """A dropdown widget class"""
 
     _options = None
+    _formatter = None
 
     def __init__(self, name, options=None, size=None, desc=None, prop=None, style=None, attr=None,
                  readonly=False, disabled=False, required=False, css_cls=None):
@@ -678,6 +680,7 @@ class DropDown(Widget):
             self._options = options
         else:
             self._options = {}
+        self._formatter = TabularFormatter()
 
     def add_option(self, value, title, is_selected=False):
         """Adds an options to the select list"""
@@ -691,18 +694,15 @@ class DropDown(Widget):
         """Renders the select list on the page"""
         content = self._render_pre_content('select')
         content += "\n"
-        for opt in self._options:
-            title = self._options.get(opt)[0]
+        cells = self._formatter.format_rows(
+            [(opt, self._options.get(opt)[0] if self._options.get(opt)[0] is not None else opt)
+             for opt in self._options])
+        for opt, (value, title) in zip(self._options, cells):
             is_selected = self._options.get(opt)[1]
-            content += "<option value='" + opt + "' "
+            content += "<option value='" + value + "' "
             if is_selected:
                 content += "selected "
-            content += ">"
-            if title is not None:
-                content += title
-            else:
-                content += opt
-            content += "</option>"
+            content += ">" + title + "</option>"
         self._widget_content = content + self._render_post_content('select')
         return self._widget_content
 
@@ -80,7 +80,7 @@ class Section(Widget):
             # dsbld = request.args['disabled']
             # if dsbld is not None:
             #     self._disabled = True if dsbld == "true" else False
-        return json.dumps({"result": self._onclick_callback()})
+        return json.dumps({"result": self._run_callback(self._onclick_callback)})
 
     def on_click(self, onclick_callback, app=None):
         """Adds an event handler to on_click event of the widget. The event handler can be
@@ -346,7 +346,7 @@ class RadioButtonGroup(Widget):
             val = request.args['value']
             if val is not None:
                 self._value = val
-        return json.dumps({"result": self._onclick_callback()})
+        return json.dumps({"result": self._run_callback(self._onclick_callback)})
 
     def on_click(self, onclick_callback, app=None):
         """Adds an event handler to on_click event of the widget. The event handler can be
@@ -566,7 +566,7 @@ class CheckBoxGroup(RadioButtonGroup):
                         self._value[key] = True
                 else:
                     self._value = {key: True}
-        return json.dumps({"result": self._onclick_callback()})
+        return json.dumps({"result": self._run_callback(self._onclick_callback)})
 
     def _sync_properties(self):
         return json.dumps({'name': self._name,
@@ -735,19 +735,19 @@ class DialogBox(Widget):
     def _onbefore_close_event(self):
         self._command = "close"
         if self._onbefore_close_callback is not None:
-            return json.dumps({'result': self._onbefore_close_callback()})
+            return json.dumps({'result': self._run_callback(self._onbefore_close_callback)})
         else:
             return json.dumps({'result': ''})
 
     def _onok_pressed_event(self):
         if self._onok_pressed_callback is not None:
-            return json.dumps({'result': self._onok_pressed_callback()})
+            return json.dumps({'result': self._run_callback(self._onok_pressed_callback)})
         else:
             return json.dumps({'result': ''})
 
     def _oncancel_pressed_event(self):
         if self._oncancel_pressed_callback is not None:
-            return json.dumps({'result': self._oncancel_pressed_callback()})
+            return json.dumps({'result': self._run_callback(self._oncancel_pressed_callback)})
         else:
             return json.dumps({'result': ''})
 
@@ -1221,7 +1221,7 @@ class MenuItem(Widget):
             if dsbld is not None:
                 self._disabled = True if dsbld == "true" else False
         if self._menu_clicked_callback is not None:
-            return json.dumps({'result': self._menu_clicked_callback()})
+            return json.dumps({'result': self._run_callback(self._menu_clicked_callback)})
         return json.dumps({'result': ''})
 
     def _sync_properties(self):
@@ -1535,7 +1535,7 @@ class Slider(Widget):
             val = request.args['value']
             if val is not None:
                 self._value = val
-        return json.dumps({"result": self._onclick_callback()})
+        return json.dumps({"result": self._run_callback(self._onclick_callback)})
 
     def on_click(self, onclick_callback, app=None):
         """Adds an event handler to on_click event of the widget. The event handler can be
@@ -1670,7 +1670,7 @@ class Slider(Widget):
             if val is not None:
                 self._value = val
         if self._slider_changed_callback is not None:
-            return json.dumps({'result': self._slider_changed_callback()})
+            return json.dumps({'result': self._run_callback(self._slider_changed_callback)})
         return json.dumps({'result': ''})
 
     def _attach_css(self):
@@ -2029,7 +2029,7 @@ class Spinner(Widget):
             if val is not None:
                 self._value = val
         if self._onchange_callback is not None:
-            return json.dumps({'result': self._onchange_callback()})
+            return json.dumps({'result': self._run_callback(self._onchange_callback)})
         return json.dumps({'result': ''})
 
     def render(self):
@@ -2259,7 +2259,7 @@ class Tab(Widget):
             if val is not None:
                 self._selected_index = val
         if self._tab_activated_callback is not None:
-            return json.dumps({'result': self._tab_activated_callback()})
+            return json.dumps({'result': self._run_callback(self._tab_activated_callback)})
         return json.dumps({'result': ''})
 
     def _attach_css(self):
@@ -5,10 +5,48 @@ To get more information about this componenet please visit JSTree's web site inc
 This module will handle the functionality to render the tree at frontend and setup the
 communication between the client and server side code.
 """
+import re
 from widgets4py.base import Widget
 from flask import json, request
 
 
+def _encode_ranges(bits):
+    """Encodes a bitset (an `int` where bit N is set for node index N) as a flat list of
+    index ranges `[start1, end1, start2, end2, ...]`, each end being exclusive
+    """
+    ranges = []
+    for match in re.finditer('1+', bin(bits)[:1:-1]):
+        ranges.append(match.start())
+        ranges.append(match.end())
+    return ranges
+
+
+def _get_page_data(parent_id, children, state, lazy, page_size, offset=0):
+    """Returns the data of one page of child nodes. If more children are available after
+    the page, a "load more" sentinel node is appended which carries the parent id & offset
+    of the next page in its data. The sentinel is disabled so that clicking it doesn't select it
+    """
+    if page_size is None:
+        return [child.get_data(state, lazy, page_size) for child in children]
+    data = [child.get_data(state, lazy, page_size) for child in children[offset:offset + page_size]]
+    if children.__len__() > offset + page_size:
+        data.append({'id': parent_id + '_more_' + str(offset + page_size),
+                     'text': 'Load more... (' + str(children.__len__() - offset - page_size) + ')',
+                     'icon': False,
+                     'state': {'disabled': True},
+                     'children': [],
+                     'data': {'more': parent_id, 'offset': offset + page_size}})
+    return data
+
+
+def _decode_ranges(ranges):
+    """Decodes the flat list of index ranges produced by `_encode_ranges` back to a bitset"""
+    bits = 0
+    for i in range(0, ranges.__len__() - 1, 2):
+        bits |= ((1 << (ranges[i + 1] - ranges[i])) - 1) << ranges[i]
+    return bits
+
+
 class JSTreeNode(Widget):
     """This class represents an node with in the JSTree. JSTreeNode renders
     as an "li" HTML tag and have couple of options associated with it like
@@ -23,6 +61,8 @@ class JSTreeNode(Widget):
     _li_attr = None
     _a_attr = None
     _type = None
+    _tree = None
+    _index = None
 
     def __init__(self, name, text, icon=None, is_opened=None, is_selected=None, is_disabled=None,
                  child_nodes=None, li_attr=None, a_attr=None, n_type=None):
@@ -87,6 +127,8 @@ class JSTreeNode(Widget):
     @text.setter
     def text(self, val):
         self._text = val
+        if self._tree is not None:
+            self._tree._log_change(['r', self._name, val])
 
     @property
     def li_attr(self):
@@ -114,6 +156,8 @@ class JSTreeNode(Widget):
     @is_open.setter
     def is_open(self, val):
         self._is_opened = val
+        if self._tree is not None:
+            self._tree._log_change(['s', self._name, {'opened': val}])
 
     @property
     def is_selected(self):
@@ -123,15 +167,19 @@ class JSTreeNode(Widget):
     @is_selected.setter
     def is_selected(self, val):
         self._is_selected = val
+        if self._tree is not None:
+            self._tree._log_change(['s', self._name, {'selected': val}])
 
     @property
     def is_disabled(self):
         """Returns whether the current node is disabled or not"""
-        self._is_disabled
+        return self._is_disabled
 
     @is_disabled.setter
     def is_disabled(self, val):
         self._is_disabled = val
+        if self._tree is not None:
+            self._tree._log_change(['s', self._name, {'disabled': val}])
 
     @property
     def is_parent(self):
@@ -154,6 +202,89 @@ class JSTreeNode(Widget):
             return False
         return True
 
+    def set_tree(self, tree):
+        """Sets the `JSTree` which owns this node and all of its child nodes. A node which
+        belongs to a tree reports its changes to the tree's change log
+
+            Args:
+                tree (JSTree): The tree owning this node or `None` if node is detached
+        """
+        self._tree = tree
+        for child in self._child_widgets:
+            child.set_parent(self)
+            child.set_tree(tree)
+
+    def add(self, child, position=None):
+        """Adds a child node to the current node. If current node is part of a `JSTree`,
+        the new node is recorded in the tree's change log and will be created at the
+        client side without reloading the whole tree
+
+            Args:
+                child (JSTreeNode): The node to be added as child of this node
+                position (int): Position of the child among its siblings, appended at the end if `None`
+        """
+        child.set_parent(self)
+        if position is not None:
+            self._child_widgets.insert(position, child)
+        else:
+            self._child_widgets.append(child)
+        if self._tree is not None:
+            self._tree._attach_node(child, self._name, position)
+
+    def remove(self, child):
+        """Removes the child node from the current node. If current node is part of a
+        `JSTree`, the removal is recorded in the tree's change log
+
+            Args:
+                child (JSTreeNode): The child node to be removed
+        """
+        self._child_widgets.remove(child)
+        if self._tree is not None:
+            self._tree._detach_node(child)
+
+    def _get_state(self, state):
+        """Returns the opened & selected flags of the node, taken from the state snapshot
+        (a tuple of opened and selected bitsets over node indexes) if one is passed
+        """
+        if state is not None and self._index is not None:
+            return ((state[0] >> self._index) & 1 == 1, (state[1] >> self._index) & 1 == 1)
+        return (self._is_opened, self._is_selected)
+
+    def get_data(self, state=None, lazy=False, page_size=None):
+        """Returns the current node and its child nodes as a `dict` in the JSON format
+        understood by the JSTree at client side
+
+            Args:
+                state (tuple): An optional state snapshot to be applied on the nodes
+                lazy (boolean): If `True`, children of closed nodes are not included and
+                                will be loaded by the client when the node is opened
+                page_size (int): If passed, only the first page of children is included
+                                    followed by a "load more" node
+        """
+        opened, selected = self._get_state(state)
+        if lazy and not opened and self._child_widgets.__len__() > 0:
+            children = True
+        else:
+            children = _get_page_data(self._name, self._child_widgets, state, lazy, page_size)
+        data = {'id': self._name,
+                'text': self._text,
+                'state': {'opened': opened,
+                          'disabled': self._is_disabled,
+                          'selected': selected},
+                'children': children}
+        if self._tree is not None and self._tree.is_checked(self._name):
+            # Nodes loaded after the checked state was sent to the client carry their own state
+            data['state']['checked'] = True
+            if self._tree._is_tie_selection():
+                data['state']['selected'] = True
+        if self._type is not None:
+            data['type'] = self._type
+        if self._icon is not None:
+            data['icon'] = self._icon
+        if self._index is not None:
+            data['data'] = {'idx': self._index}
+        return data
+
     def get_children_dom(self):
         """Returns the list of all the child nodes available under the current `JSTreeNode`"""
         return self._child_widgets
@@ -196,8 +327,13 @@ class JSTreeNode(Widget):
             node = parent_node
         return path
 
-    def render(self):
-        """Renders the content of the `JSTreeNode` within the parent widget (i.e., `JSTree`) of this node"""
+    def render(self, state=None):
+        """Renders the content of the `JSTreeNode` within the parent widget (i.e., `JSTree`) of this node
+
+            Args:
+                state (tuple): An optional state snapshot to be applied on the rendered nodes
+        """
+        opened, selected = self._get_state(state)
         content = "{\n"
         content += "id: '" + self._name + "',\n"
         content += "text: '" + self._text + "',\n"
@@ -206,15 +342,17 @@ class JSTreeNode(Widget):
         if self._icon is not None:
             content += "icon: '" + self._icon + "',"
         content += "state: {\n"
-        content += "    opened: " + json.dumps(self._is_opened) + ",\n"
+        content += "    opened: " + json.dumps(opened) + ",\n"
         content += "    disabled: " + json.dumps(self._is_disabled) + ",\n"
-        content += "    selected: " + json.dumps(self._is_selected) + ",\n"
+        content += "    selected: " + json.dumps(selected) + ",\n"
         content += "\n},\n"
         content += "children: [\n"
         for child in self._child_widgets:
-            content += child.render() + ",\n"
+            content += child.render(state) + ",\n"
         content += "],\n"
         content += "li_attr: {},\n"
+        if self._index is not None:
+            content += "data: {idx: " + str(self._index) + "},\n"
         content += "a_attr: {}"
         content += "\n}"
         return content
@@ -422,6 +560,22 @@ class JSTree(Widget):
     _unique_duplicate_url = None
     _unique_duplicate_callback = None
     _cmd_queue = None
+    _node_index = None
+    _index_ids = None
+    _free_indexes = None
+    _released_indexes = None
+    _node_bits = None
+    _checked_bits = None
+    _checked_dirty = None
+    _checked_url = None
+    _checked_callback = None
+    _lazy_load = None
+    _lazy_load_url = None
+    _state_snapshots = None
+    _state_key_callback = None
+    _save_state_url = None
+    _page_size = None
+    _change_log = None
     # ========= Events ============= #
     _loaded_callback = None
     _ready_callback = None
@@ -482,6 +636,8 @@ class JSTree(Widget):
     _show_contextmenu_url = None
     _search_url = None
     _clear_search_url = None
+    _event_batch_url = None
+    _event_batch_window = None
 
     def __init__(self, name, app=None, child_nodes=None, plugin_whole_row=None, plugin_checkbox=None,  # noqa
                  plugin_contextmenu=None, plugin_dnd=None, plugin_massload=None, plugin_search=None,
@@ -500,7 +656,8 @@ class JSTree(Widget):
                  dnd_use_html5=None, search_ajax_url=None, search_ajax_callback=None, search_case_sensitive=None,
                  search_show_only_matches=None, search_close_opened_onclear=None, sort_callback=None,
                  sort_url=None, types=None, unique_case_sensitive=None, unique_trim_whitespace=None,
-                 unique_duplicate_url=None, unique_duplicate_callback=None):
+                 unique_duplicate_url=None, unique_duplicate_callback=None, event_batch_window=None,
+                 lazy_load=None, page_size=None):
         """Constructor parameters defined below...
 
             Args:
@@ -527,13 +684,41 @@ class JSTree(Widget):
                                             either client side or server side depending upon the
                                             configuration. Search helps in finding the `JSTreeNode`
                                             and filtering out the nodes which are of no interset
+                event_batch_window (int): Time in milliseconds for which the high frequency events
+                                            (i.e., hover_node, dehover_node, redraw, model and
+                                            activate_node) are buffered at client side before
+                                            being reported to the server as one batch. Default
+                                            is 250 milliseconds
+                lazy_load (boolean): If `True`, only the open nodes are rendered with the tree and
+                                        children of the closed nodes are fetched from the server
+                                        when they are opened
+                page_size (int): Maximum number of children sent at once for a node. Any further
+                                    children are represented by a "load more" node which fetches
+                                    the next page from the server when selected. Enables `lazy_load`
         """
         Widget.__init__(self, name)
         self._app = app
+        self._node_index = {}
+        self._change_log = []
+        self._index_ids = []
+        self._free_indexes = []
+        self._released_indexes = []
+        self._node_bits = 0
+        self._checked_bits = 0
+        self._checked_dirty = False
+        self._lazy_load = lazy_load if lazy_load is not None else False
+        self._page_size = page_size
+        if self._page_size is not None:
+            self._lazy_load = True
+        self._state_snapshots = {}
         if child_nodes is not None:
             self._child_widgets = child_nodes
         else:
             self._child_widgets = []
+        for child in self._child_widgets:
+            child.set_parent(self)
+            child.set_tree(self)
+            self._index_node(child)
         self._plugin_whole_row = plugin_whole_row
         self._plugin_checkbox = plugin_checkbox
         self._plugin_contextmenu = plugin_contextmenu
@@ -624,6 +809,10 @@ class JSTree(Widget):
                     self._app.add_url_rule('/' + self._unique_duplicate_url,
                                            self._unique_duplicate_url, self._process_unique_duplicate_callback)
         self._cmd_queue = []
+        if event_batch_window is not None:
+            self._event_batch_window = event_batch_window
+        else:
+            self._event_batch_window = 250
 
     def _process_unique_duplicate_callback(self):
         name = ""
@@ -686,6 +875,50 @@ class JSTree(Widget):
         else:
             return json.dumps([])  # an empty JSON array
 
+    def state_key_config(self, callback):
+        """Configures the callback which returns the key (for example, the id of the logged in
+        user) under which the state snapshots of the tree are saved. The callback is invoked
+        within the request of the user and receives no parameters. If not configured, a single
+        snapshot is shared by all users
+
+        **NOTE**: This callback is the part of configuration and shouldn't be confused with
+                    any event
+
+            Args:
+                callback (callable): A callable returning the key of current user's snapshot
+        """
+        self._state_key_callback = callback
+
+    def _get_state_key(self):
+        if self._state_key_callback is not None:
+            return self._state_key_callback()
+        return None
+
+    def _get_state_snapshot(self):
+        return self._state_snapshots.get(self._get_state_key())
+
+    def _process_save_state_callback(self):
+        if request.form.__len__() > 0:
+            self._state_snapshots[self._get_state_key()] = (
+                _decode_ranges(json.loads(request.form['opened'])) & self._node_bits,
+                _decode_ranges(json.loads(request.form['selected'])) & self._node_bits)
+        return json.dumps({'result': ''})
+
+    def _process_lazy_load_callback(self):
+        node_id = '#'
+        offset = 0
+        if request.args.__len__() > 0:
+            node_id = request.args['id']
+            offset = int(request.args.get('offset', 0))
+        if node_id == '#':
+            node = self
+        else:
+            node = self._node_index.get(node_id)
+        if node is None:
+            return json.dumps([])
+        state = self._get_state_snapshot()
+        return json.dumps(_get_page_data(node_id, node._child_widgets, state, True, self._page_size, offset))
+
     def search_ajax_config(self, callback):
         """This callback will be used by JSTree to execute the search query at the server side.
         The callback will receive `str` parameter which is a search string or query and an optional
@@ -698,6 +931,127 @@ class JSTree(Widget):
         """
         self._search_ajax_callback = callback
 
+    def add(self, child, position=None):
+        """Adds a top level node to the tree. The addition is recorded in the change log
+        and will be created at the client side without reloading the whole tree
+
+            Args:
+                child (JSTreeNode): The node to be added at the root level of the tree
+                position (int): Position of the node among its siblings, appended at the end if `None`
+        """
+        child.set_parent(self)
+        if position is not None:
+            self._child_widgets.insert(position, child)
+        else:
+            self._child_widgets.append(child)
+        self._attach_node(child, '#', position)
+
+    def remove(self, child):
+        """Removes a top level node from the tree and records the removal in the change log
+
+            Args:
+                child (JSTreeNode): The node to be removed from the root level of the tree
+        """
+        self._child_widgets.remove(child)
+        self._detach_node(child)
+
+    def get_node(self, node_id):
+        """Returns the `JSTreeNode` having the passed id or `None` if no such node exists
+        in the tree
+
+            Args:
+                node_id (string): Id (or name) of the node
+        """
+        return self._node_index.get(node_id)
+
+    def _index_node(self, node):
+        self._node_index[node._name] = node
+        if node._index is None:
+            if self._free_indexes.__len__() > 0:
+                # Reuses the index of a removed node, the client has deleted that node already
+                node._index = self._free_indexes.pop()
+                self._index_ids[node._index] = node._name
+                mask = ~(1 << node._index)
+                for key, snapshot in list(self._state_snapshots.items()):
+                    self._state_snapshots[key] = (snapshot[0] & mask, snapshot[1] & mask)
+            else:
+                node._index = self._index_ids.__len__()
+                self._index_ids.append(node._name)
+            self._node_bits |= 1 << node._index
+        for child in node._child_widgets:
+            self._index_node(child)
+
+    def _unindex_node(self, node, ids):
+        self._node_index.pop(node._name, None)
+        if node._index is not None:
+            self._index_ids[node._index] = None
+            self._node_bits &= ~(1 << node._index)
+            self._checked_bits &= ~(1 << node._index)
+            self._released_indexes.append(node._index)
+            node._index = None
+        ids.add(node._name)
+        for child in node._child_widgets:
+            self._unindex_node(child, ids)
+
+    def _attach_node(self, node, parent_id, position):
+        node.set_tree(self)
+        self._index_node(node)
+        self._log_change(['c', node._name, parent_id, position, node.get_data()])
+
+    def _detach_node(self, node):
+        node.set_tree(None)
+        ids = set()
+        self._unindex_node(node, ids)
+        self._log_change(['d', node._name], ids)
+
+    def _log_change(self, change, ids=None):
+        """Records a change in the tree structure or node state. Changes are kept as
+        compact lists of the form `[op, node_id, args...]` and are collapsed while they
+        wait for the client to poll them, i.e., only the last text of a renamed node is
+        kept, state flags are merged and nodes created & deleted in between are dropped
+        """
+        op = change[0]
+        node_id = change[1]
+        if op == 'r' or op == 's':
+            for entry in self._change_log:
+                if entry[0] == 'c' and entry[1] == node_id:
+                    if op == 'r':
+                        entry[4]['text'] = change[2]
+                    else:
+                        entry[4]['state'].update(change[2])
+                    return
+            for entry in self._change_log:
+                if entry[0] == op and entry[1] == node_id:
+                    self._change_log.remove(entry)
+                    if op == 's':
+                        entry[2].update(change[2])
+                        change = entry
+                    break
+        elif op == 'd':
+            created = False
+            pending = []
+            for entry in self._change_log:
+                if entry[1] in ids:
+                    if entry[0] == 'c' and entry[1] == node_id:
+                        created = True
+                    continue
+                pending.append(entry)
+            self._change_log = pending
+            if created:
+                return
+        self._change_log.append(change)
+
+    def get_changes(self):
+        """Returns the list of pending changes which are not yet delivered to the client
+        and clears the change log
+        """
+        changes = self._change_log
+        self._change_log = []
+        # The indexes of the removed nodes can be reused once the client got their deletion
+        self._free_indexes.extend(self._released_indexes)
+        self._released_indexes = []
+        return changes
+
     def add_node_type(self, key, n_type):
         """Adds a node type to JSTree's type collection
 
@@ -776,15 +1130,36 @@ class JSTree(Widget):
         # ==================== Render Plugins ========================== #
         plugins = self._get_plugins()
         # ==================== Render Child Nodes ====================== #
-        for child in self._child_widgets:
-            data += child.render() + ",\n"
+        if self._lazy_load:
+            data = """function(node, callback){
+                                        var tree = this;
+                                        $.ajax({
+                                            url: '/%s',
+                                            type: 'get',
+                                            dataType: 'json',
+                                            data: {'id': node.id},
+                                            success: function(nodes){
+                                                callback.call(tree, nodes);
+                                            },
+                                            error: function(err_status){
+                                                alertify.error("Status Code: "
+                                                + err_status.status + "<br />" + "Error Message:"
+                                                + err_status.statusText);
+                                            }
+                                        });
+                                    }""" % (self._lazy_load_url)
+        else:
+            state = self._get_state_snapshot()
+            for child in self._child_widgets:
+                data += child.render(state) + ",\n"
+            data = "[" + data + "]"
         # =============== Build the final string for JSTree ============ #
         script = """
                     <script>
                         $(function(){
                             $('#%s').jstree({
                                 core: {
-                                    data: [%s],
+                                    data: %s,
                                     themes: {
                                         variant: '%s',
                                         dots: %s,
@@ -965,14 +1340,14 @@ class JSTree(Widget):
                        )
         return script
 
-    def _register_url(self, url, callback):
+    def _register_url(self, url, callback, methods=None):
         if self._app is not None:
             found = False
             for rule in self._app.url_map.iter_rules():
                 if rule.endpoint == url:
                     found = True
             if not found:
-                self._app.add_url_rule('/' + url, url, callback)
+                self._app.add_url_rule('/' + url, url, callback, methods=methods)
 
     def _prepare_callback_urls(self):
         self._loaded_url = str(__name__ + "_" + self._name + "_loaded").replace('.', '_')
@@ -1061,13 +1436,25 @@ class JSTree(Widget):
         #
         self._clear_search_url = str(__name__ + "_" + self._name + "_clear_search").replace('.', '_')
         self._register_url(self._clear_search_url, self._process_clear_search_callback)
+        #
+        self._event_batch_url = str(__name__ + "_" + self._name + "_event_batch").replace('.', '_')
+        self._register_url(self._event_batch_url, self._process_event_batch_callback)
+        #
+        self._checked_url = str(__name__ + "_" + self._name + "_checked").replace('.', '_')
+        self._register_url(self._checked_url, self._process_checked_callback, methods=['POST'])
+        #
+        self._save_state_url = str(__name__ + "_" + self._name + "_save_state").replace('.', '_')
+        self._register_url(self._save_state_url, self._process_save_state_callback, methods=['POST'])
+        #
+        self._lazy_load_url = str(__name__ + "_" + self._name + "_lazy_load").replace('.', '_')
+        self._register_url(self._lazy_load_url, self._process_lazy_load_callback)
 
     def on_loaded_event(self, callback):
         self._loaded_callback = callback
 
     def _process_loaded_callback(self):
         if self._loaded_callback is not None:
-            return json.dumps({'result': self._loaded_callback()})
+            return json.dumps({'result': self._run_callback(self._loaded_callback)})
         return json.dumps({'result': ''})
 
     def on_ready_event(self, callback):
@@ -1075,7 +1462,7 @@ class JSTree(Widget):
 
     def _process_ready_callback(self):
         if self._ready_callback is not None:
-            return json.dumps({'result': self._ready_callback()})
+            return json.dumps({'result': self._run_callback(self._ready_callback)})
         return json.dumps({'result': ''})
 
     def on_load_node_event(self, callback):
@@ -1083,7 +1470,7 @@ class JSTree(Widget):
 
     def _process_load_node_callback(self):
         if self._load_node_callback is not None:
-            return json.dumps({'result': self._load_node_callback()})
+            return json.dumps({'result': self._run_callback(self._load_node_callback)})
         return json.dumps({'result': ''})
 
     def on_model_event(self, callback):
@@ -1091,7 +1478,7 @@ class JSTree(Widget):
 
     def _process_model_callback(self):
         if self._model_callback is not None:
-            return json.dumps({'result': self._model_callback()})
+            return json.dumps({'result': self._run_callback(self._model_callback)})
         return json.dumps({'result': ''})
 
     def on_redraw_event(self, callback):
@@ -1099,7 +1486,7 @@ class JSTree(Widget):
 
     def _process_redraw_callback(self):
         if self._redraw_callback is not None:
-            return json.dumps({'result': self._redraw_callback()})
+            return json.dumps({'result': self._run_callback(self._redraw_callback)})
         return json.dumps({'result': ''})
 
     def on_before_open_event(self, callback):
@@ -1107,7 +1494,7 @@ class JSTree(Widget):
 
     def _process_before_open_callback(self):
         if self._before_open_callback is not None:
-            return json.dumps({'result': self._before_open_callback()})
+            return json.dumps({'result': self._run_callback(self._before_open_callback)})
         return json.dumps({'result': ''})
 
     def on_open_node_event(self, callback):
@@ -1115,7 +1502,7 @@ class JSTree(Widget):
 
     def _process_open_node_callback(self):
         if self._open_node_callback is not None:
-            return json.dumps({'result': self._open_node_callback()})
+            return json.dumps({'result': self._run_callback(self._open_node_callback)})
         return json.dumps({'result': ''})
 
     def on_after_open_event(self, callback):
@@ -1123,7 +1510,7 @@ class JSTree(Widget):
 
     def _process_after_open_callback(self):
         if self._after_open_callback is not None:
-            return json.dumps({'result': self._after_open_callback()})
+            return json.dumps({'result': self._run_callback(self._after_open_callback)})
         return json.dumps({'result': ''})
 
     def on_close_node_event(self, callback):
@@ -1131,7 +1518,7 @@ class JSTree(Widget):
 
     def _process_close_node_callback(self):
         if self._close_node_callback is not None:
-            return json.dumps({'result': self._close_node_callback()})
+            return json.dumps({'result': self._run_callback(self._close_node_callback)})
         return json.dumps({'result': ''})
 
     def on_after_close_event(self, callback):
@@ -1139,7 +1526,7 @@ class JSTree(Widget):
 
     def _process_after_close_callback(self):
         if self._after_close_callback is not None:
-            return json.dumps({'result': self._after_close_callback()})
+            return json.dumps({'result': self._run_callback(self._after_close_callback)})
         return json.dumps({'result': ''})
 
     def on_activate_node_event(self, callback):
@@ -1147,7 +1534,7 @@ class JSTree(Widget):
 
     def _process_activate_node_callback(self):
         if self._activate_node_callback is not None:
-            return json.dumps({'result': self._activate_node_callback()})
+            return json.dumps({'result': self._run_callback(self._activate_node_callback)})
         return json.dumps({'result': ''})
 
     def on_hover_node_event(self, callback):
@@ -1155,7 +1542,7 @@ class JSTree(Widget):
 
     def _process_hover_node_callback(self):
         if self._hover_node_callback is not None:
-            return json.dumps({'result': self._hover_node_callback()})
+            return json.dumps({'result': self._run_callback(self._hover_node_callback)})
         return json.dumps({'result': ''})
 
     def on_dehover_node_event(self, callback):
@@ -1163,7 +1550,7 @@ class JSTree(Widget):
 
     def _process_dehover_node_callback(self):
         if self._dehover_node_callback is not None:
-            return json.dumps({'result': self._dehover_node_callback()})
+            return json.dumps({'result': self._run_callback(self._dehover_node_callback)})
         return json.dumps({'result': ''})
 
     def on_select_node_event(self, callback):
@@ -1171,7 +1558,7 @@ class JSTree(Widget):
 
     def _process_select_node_callback(self):
         if self._select_node_callback is not None:
-            return json.dumps({'result': self._select_node_callback()})
+            return json.dumps({'result': self._run_callback(self._select_node_callback)})
         return json.dumps({'result': ''})
 
     def on_changed_event(self, callback):
@@ -1179,7 +1566,7 @@ class JSTree(Widget):
 
     def _process_changed_callback(self):
         if self._changed_callback is not None:
-            return json.dumps({'result': self._changed_callback()})
+            return json.dumps({'result': self._run_callback(self._changed_callback)})
         return json.dumps({'result': ''})
 
     def on_set_text_callback(self, callback):
@@ -1187,7 +1574,7 @@ class JSTree(Widget):
 
     def _process_set_text_callback(self):
         if self._set_text_callback is not None:
-            return json.dumps({'result': self._set_text_callback()})
+            return json.dumps({'result': self._run_callback(self._set_text_callback)})
         return json.dumps({'result': ''})
 
     def on_create_node_callback(self, callback):
@@ -1195,7 +1582,7 @@ class JSTree(Widget):
 
     def _process_create_node_callback(self):
         if self._create_node_callback is not None:
-            return json.dumps({'result': self._create_node_callback()})
+            return json.dumps({'result': self._run_callback(self._create_node_callback)})
         return json.dumps({'result': ''})
 
     def on_rename_node_callback(self, callback):
@@ -1203,7 +1590,7 @@ class JSTree(Widget):
 
     def _process_rename_node_callback(self):
         if self._rename_node_callback is not None:
-            return json.dumps({'result': self._rename_node_callback()})
+            return json.dumps({'result': self._run_callback(self._rename_node_callback)})
         return json.dumps({'result': ''})
 
     def on_delete_node_callback(self, callback):
@@ -1211,7 +1598,7 @@ class JSTree(Widget):
 
     def _process_delete_node_callback(self):
         if self._delete_node_callback is not None:
-            return json.dumps({'result': self._delete_node_callback()})
+            return json.dumps({'result': self._run_callback(self._delete_node_callback)})
         return json.dumps({'result': ''})
 
     def on_move_node_callback(self, callback):
@@ -1219,7 +1606,7 @@ class JSTree(Widget):
 
     def _process_move_node_callback(self):
         if self._move_node_callback is not None:
-            return json.dumps({'result': self._move_node_callback()})
+            return json.dumps({'result': self._run_callback(self._move_node_callback)})
         return json.dumps({'result': ''})
 
     def on_copy_node_callback(self, callback):
@@ -1227,7 +1614,7 @@ class JSTree(Widget):
 
     def _process_copy_node_callback(self):
         if self._copy_node_callback is not None:
-            return json.dumps({'result': self._copy_node_callback()})
+            return json.dumps({'result': self._run_callback(self._copy_node_callback)})
         return json.dumps({'result': ''})
 
     def on_copy_callback(self, callback):
@@ -1235,7 +1622,7 @@ class JSTree(Widget):
 
     def _process_copy_callback(self):
         if self._copy_callback is not None:
-            return json.dumps({'result': self._copy_callback()})
+            return json.dumps({'result': self._run_callback(self._copy_callback)})
         return json.dumps({'result': ''})
 
     def on_cut_callback(self, callback):
@@ -1243,7 +1630,7 @@ class JSTree(Widget):
 
     def _process_cut_callback(self):
         if self._cut_callback is not None:
-            return json.dumps({'result': self._cut_callback()})
+            return json.dumps({'result': self._run_callback(self._cut_callback)})
         return json.dumps({'result': ''})
 
     def on_paste_callback(self, callback):
@@ -1251,7 +1638,7 @@ class JSTree(Widget):
 
     def _process_paste_callback(self):
         if self._paste_callback is not None:
-            return json.dumps({'result': self._paste_callback()})
+            return json.dumps({'result': self._run_callback(self._paste_callback)})
         return json.dumps({'result': ''})
 
     def on_check_node_callback(self, callback):
@@ -1259,7 +1646,7 @@ class JSTree(Widget):
 
     def _process_check_node_callback(self):
         if self._check_node_callback is not None:
-            return json.dumps({'result': self._check_node_callback()})
+            return json.dumps({'result': self._run_callback(self._check_node_callback)})
         return json.dumps({'result': ''})
 
     def on_uncheck_node_callback(self, callback):
@@ -1267,7 +1654,29 @@ class JSTree(Widget):
 
     def _process_uncheck_node_callback(self):
         if self._uncheck_node_callback is not None:
-            return json.dumps({'result': self._uncheck_node_callback()})
+            return json.dumps({'result': self._run_callback(self._uncheck_node_callback)})
+        return json.dumps({'result': ''})
+
+    def on_checked_callback(self, callback):
+        """Registers a callback which is called once the client reports back its complete set
+        of checked nodes (see `read_checked`). The callback receives the list of checked node ids
+
+            Args:
+                callback (callable): A callable which accepts the list of checked node ids
+        """
+        self._checked_callback = callback
+
+    def _process_checked_callback(self):
+        if request.form.__len__() > 0:
+            checked = _decode_ranges(json.loads(request.form['checked'])) & self._node_bits
+            if 'loaded' in request.form:
+                # The client knows only the nodes it has loaded, the others keep the server state
+                loaded = _decode_ranges(json.loads(request.form['loaded'])) & self._node_bits
+                self._checked_bits = (self._checked_bits & ~loaded) | (checked & loaded)
+            else:
+                self._checked_bits = checked
+        if self._checked_callback is not None:
+            return json.dumps({'result': self._run_callback(self._checked_callback, self.get_checked())})
         return json.dumps({'result': ''})
 
     def on_show_contextmenu_callback(self, callback):
@@ -1275,7 +1684,7 @@ class JSTree(Widget):
 
     def _process_show_contextmenu_callback(self):
         if self._show_contextmenu_callback is not None:
-            return json.dumps({'result': self._show_contextmenu_callback()})
+            return json.dumps({'result': self._run_callback(self._show_contextmenu_callback)})
         return json.dumps({'result': ''})
 
     def on_search_callback(self, callback):
@@ -1283,7 +1692,7 @@ class JSTree(Widget):
 
     def _process_search_callback(self):
         if self._search_callback is not None:
-            return json.dumps({'result': self._search_callback()})
+            return json.dumps({'result': self._run_callback(self._search_callback)})
         return json.dumps({'result': ''})
 
     def on_clear_search_callback(self, callback):
@@ -1291,23 +1700,107 @@ class JSTree(Widget):
 
     def _process_clear_search_callback(self):
         if self._clear_search_callback is not None:
-            return json.dumps({'result': self._clear_search_callback()})
+            return json.dumps({'result': self._run_callback(self._clear_search_callback)})
         return json.dumps({'result': ''})
 
+    def _process_event_batch_callback(self):
+        callbacks = {'model': self._model_callback,
+                     'redraw': self._redraw_callback,
+                     'activate_node': self._activate_node_callback,
+                     'hover_node': self._hover_node_callback,
+                     'dehover_node': self._dehover_node_callback}
+        results = []
+        if request.args.__len__() > 0:
+            for event in json.loads(request.args['events']):
+                callback = callbacks.get(event[0])
+                if callback is not None:
+                    results.append(self._run_callback(callback))
+        return json.dumps({'result': results})
+
+    def _attach_event_batching(self):
+        """Renders the client side buffer which collects the high frequency events and
+        reports them to the server as a single batch once per batch window. Repeated
+        events for the same node are reported once, a hover immediately followed by a
+        dehover of the same node (or vice versa) cancels out and only the last `redraw`
+        and `model` events are kept
+        """
+        return """
+                            var event_batch = [];
+                            var event_batch_timer = null;
+                            var queue_event = function(name, node){
+                                var last = event_batch.length > 0 ? event_batch[event_batch.length - 1] : null;
+                                if(last != null && last[0] == name && last[1] == node){
+                                    return;
+                                }
+                                if(last != null && last[1] == node
+                                    && ((last[0] == 'hover_node' && name == 'dehover_node')
+                                        || (last[0] == 'dehover_node' && name == 'hover_node'))){
+                                    event_batch.pop();
+                                } else {
+                                    if(name == 'redraw' || name == 'model'){
+                                        event_batch = event_batch.filter(function(evt){
+                                            return evt[0] != name;
+                                        });
+                                    }
+                                    event_batch.push([name, node]);
+                                }
+                                if(event_batch_timer == null){
+                                    event_batch_timer = setTimeout(function(){
+                                        var events = event_batch;
+                                        event_batch = [];
+                                        event_batch_timer = null;
+                                        if(events.length == 0){
+                                            return;
+                                        }
+                                        $.ajax({
+                                            url: '/%s',
+                                            type: 'get',
+                                            dataType: 'json',
+                                            data: {'events': JSON.stringify(events)},
+                                            success: function(status){},
+                                            error: function(err_status){
+                                                alertify.error("Status Code: "
+                                                + err_status.status + "<br />" + "Error Message:"
+                                                + err_status.statusText);
+                                            }
+                                        });
+                                    }, %d);
+                                }
+                            };\n
+                        """ % (self._event_batch_url, self._event_batch_window)
+
     def _attach_event_handlers(self):       # noqa
         handlers = ""
         handlers += """<script>
                         $(function(){
                             var selector = $('#%s');\n
                     """ % (self._name)
-        if self._loaded_callback is not None:
+        if self._page_size is not None:
             handlers += """
-                            selector.on('loaded.jstree', function(e, data){
+                            selector.on('click', '.jstree-anchor', function(e){
+                                var tree = selector.jstree(true);
+                                var more = tree.get_node(this);
+                                if(!more || more.data == null || more.data.more == undefined){
+                                    return;
+                                }
                                 $.ajax({
                                     url: '/%s',
                                     type: 'get',
                                     dataType: 'json',
-                                    success: function(status){},
+                                    data: {'id': more.data.more, 'offset': more.data.offset},
+                                    success: function(nodes){
+                                        var chk_callback = tree.settings.core.check_callback;
+                                        tree.settings.core.check_callback = true;
+                                        tree.delete_node(more);
+                                        for(var i = 0; i < nodes.length; i++){
+                                            // Nodes created through the change log may be loaded already
+                                            if(tree.get_node(nodes[i].id)){
+                                                continue;
+                                            }
+                                            tree.create_node(more.data.more, nodes[i], 'last');
+                                        }
+                                        tree.settings.core.check_callback = chk_callback;
+                                    },
                                     error: function(err_status){
                                         alertify.error("Status Code: "
                                         + err_status.status + "<br />" + "Error Message:"
@@ -1315,10 +1808,14 @@ class JSTree(Widget):
                                     }
                                 });
                             });\n
-                        """ % (self._loaded_url)
-        if self._ready_callback is not None:
+                        """ % (self._lazy_load_url)
+        if self._model_callback is not None or self._redraw_callback is not None or\
+                self._activate_node_callback is not None or self._hover_node_callback is not None or\
+                self._dehover_node_callback is not None:
+            handlers += self._attach_event_batching()
+        if self._loaded_callback is not None:
             handlers += """
-                            selector.on('ready.jstree', function(e, data){
+                            selector.on('loaded.jstree', function(e, data){
                                 $.ajax({
                                     url: '/%s',
                                     type: 'get',
@@ -1331,10 +1828,10 @@ class JSTree(Widget):
                                     }
                                 });
                             });\n
-                        """ % (self._ready_url)
-        if self._load_node_callback is not None:
+                        """ % (self._loaded_url)
+        if self._ready_callback is not None:
             handlers += """
-                            selector.on('load_node.jstree', function(node, status){
+                            selector.on('ready.jstree', function(e, data){
                                 $.ajax({
                                     url: '/%s',
                                     type: 'get',
@@ -1347,10 +1844,10 @@ class JSTree(Widget):
                                     }
                                 });
                             });\n
-                        """ % (self._load_node_url)
-        if self._model_callback is not None:
+                        """ % (self._ready_url)
+        if self._load_node_callback is not None:
             handlers += """
-                            selector.on('model.jstree', function(nodes, parent){
+                            selector.on('load_node.jstree', function(node, status){
                                 $.ajax({
                                     url: '/%s',
                                     type: 'get',
@@ -1363,23 +1860,19 @@ class JSTree(Widget):
                                     }
                                 });
                             });\n
-                        """ % (self._model_url)
+                        """ % (self._load_node_url)
+        if self._model_callback is not None:
+            handlers += """
+                            selector.on('model.jstree', function(e, data){
+                                queue_event('model', data.node != undefined ? data.node.id : null);
+                            });\n
+                        """
         if self._redraw_callback is not None:
             handlers += """
-                            selector.on('redraw.jstree', function(nodes){
-                                $.ajax({
-                                    url: '/%s',
-                                    type: 'get',
-                                    dataType: 'json',
-                                    success: function(status){},
-                                    error: function(err_status){
-                                        alertify.error("Status Code: "
-                                        + err_status.status + "<br />" + "Error Message:"
-                                        + err_status.statusText);
-                                    }
-                                });
+                            selector.on('redraw.jstree', function(e, data){
+                                queue_event('redraw', data.node != undefined ? data.node.id : null);
                             });\n
-                        """ % (self._redraw_url)
+                        """
         if self._before_open_callback is not None:
             handlers += """
                             selector.on('before_open.jstree', function(data){
@@ -1462,55 +1955,28 @@ class JSTree(Widget):
                         """ % (self._after_close_url)
         if self._activate_node_callback is not None:
             handlers += """
-                            selector.on('activate_node.jstree', function(node, event){
-                                $.ajax({
-                                    url: '/%s',
-                                    type: 'get',
-                                    dataType: 'json',
-                                    success: function(status){},
-                                    error: function(err_status){
-                                        alertify.error("Status Code: "
-                                        + err_status.status + "<br />" + "Error Message:"
-                                        + err_status.statusText);
-                                    }
-                                });
+                            selector.on('activate_node.jstree', function(e, data){
+                                queue_event('activate_node', data.node != undefined ? data.node.id : null);
                             });\n
-                        """ % (self._activate_node_url)
+                        """
         if self._hover_node_callback is not None:
             handlers += """
-                            selector.on('hover_node.jstree', function(node){
-                                $.ajax({
-                                    url: '/%s',
-                                    type: 'get',
-                                    dataType: 'json',
-                                    success: function(status){},
-                                    error: function(err_status){
-                                        alertify.error("Status Code: "
-                                        + err_status.status + "<br />" + "Error Message:"
-                                        + err_status.statusText);
-                                    }
-                                });
+                            selector.on('hover_node.jstree', function(e, data){
+                                queue_event('hover_node', data.node != undefined ? data.node.id : null);
                             });\n
-                        """ % (self._hover_node_callback)
+                        """
         if self._dehover_node_callback is not None:
             handlers += """
-                            selector.on('dehover_node.jstree', function(node){
-                                $.ajax({
-                                    url: '/%s',
-                                    type: 'get',
-                                    dataType: 'json',
-                                    success: function(status){},
-                                    error: function(err_status){
-                                        alertify.error("Status Code: "
-                                        + err_status.status + "<br />" + "Error Message:"
-                                        + err_status.statusText);
-                                    }
-                                });
+                            selector.on('dehover_node.jstree', function(e, data){
+                                queue_event('dehover_node', data.node != undefined ? data.node.id : null);
                             });\n
-                        """ % (self._dehover_node_url)
+                        """
         if self._select_node_callback is not None:
             handlers += """
                             selector.on('select_node.jstree', function(node, selected, event){
+                                if(selected.node && selected.node.data && selected.node.data.more !== undefined){
+                                    return;
+                                }
                                 $.ajax({
                                     url: '/%s',
                                     type: 'get',
@@ -1526,7 +1992,10 @@ class JSTree(Widget):
                         """ % (self._select_node_url)
         if self._changed_callback is not None:
             handlers += """
-                            selector.on('changed.jstree', function(node, action, selected. event){
+                            selector.on('changed.jstree', function(node, selected, event){
+                                if(selected.node && selected.node.data && selected.node.data.more !== undefined){
+                                    return;
+                                }
                                 $.ajax({
                                     url: '/%s',
                                     type: 'get',
@@ -1771,6 +2240,11 @@ class JSTree(Widget):
         return handlers
 
     def _command_processor(self):
+        if self._change_log.__len__() > 0:
+            return json.dumps({'cmd': 'APPLY-CHANGES', 'arg0': self.get_changes()})
+        if self._checked_dirty:
+            self._checked_dirty = False
+            return json.dumps({'cmd': 'SET-CHECKED', 'arg0': _encode_ranges(self._checked_bits)})
         if self._cmd_queue is not None and self._cmd_queue.__len__() > 0:
             cmd = self._cmd_queue.pop()
             if cmd is not None:
@@ -1849,13 +2323,35 @@ class JSTree(Widget):
             self._cmd_queue.append({'cmd': 'CREATE-NODE'})
 
     def rename_node(self, node, name):
-        self._cmd_queue.append({'cmd': 'RENAME-NODE', 'arg0': node, 'arg1': name})
+        tree_node = self._node_index.get(node)
+        if tree_node is not None:
+            tree_node.text = name
+        else:
+            self._cmd_queue.append({'cmd': 'RENAME-NODE', 'arg0': node, 'arg1': name})
 
     def delete_node(self, node):
-        self._cmd_queue.append({'cmd': 'DELETE-NODE', 'arg0': node})
+        tree_node = self._node_index.get(node)
+        if tree_node is not None:
+            tree_node.get_parent().remove(tree_node)
+        else:
+            self._cmd_queue.append({'cmd': 'DELETE-NODE', 'arg0': node})
 
-    def move_node(self, node, parent):
-        self._cmd_queue.append({'cmd': 'MOVE-NODE', 'arg0': node, 'arg1': parent})
+    def move_node(self, node, parent, position=None):
+        tree_node = self._node_index.get(node)
+        if parent == '#':
+            new_parent = self
+        else:
+            new_parent = self._node_index.get(parent)
+        if tree_node is not None and new_parent is not None:
+            tree_node.get_parent()._child_widgets.remove(tree_node)
+            tree_node.set_parent(new_parent)
+            if position is not None:
+                new_parent._child_widgets.insert(position, tree_node)
+            else:
+                new_parent._child_widgets.append(tree_node)
+            self._log_change(['m', node, parent, position])
+        else:
+            self._cmd_queue.append({'cmd': 'MOVE-NODE', 'arg0': node, 'arg1': parent})
 
     def copy_node(self, node, parent):
         self._cmd_queue.append({'cmd': 'COPY-NODE', 'arg0': node, 'arg1': parent})
@@ -1926,17 +2422,107 @@ class JSTree(Widget):
     def enable_checkbox(self, nodes):
         self._cmd_queue.append({'cmd': 'ENABLE-CHECKBOX', 'arg0': nodes})
 
+    def _is_three_state(self):
+        return self._checkbox_three_state if self._checkbox_three_state is not None else True
+
+    def _is_tie_selection(self):
+        return self._checkbox_tie_selection if self._checkbox_tie_selection is not None else True
+
+    def _get_bits(self, nodes):
+        """Returns the bitset of the passed node ids (including their descendants if the
+        checkbox plugin runs in three state mode) and the list of ids not known to the tree
+        """
+        if not isinstance(nodes, (list, tuple)):
+            nodes = [nodes]
+        three_state = self._is_three_state()
+        bits = 0
+        unknown = []
+        for node_id in nodes:
+            stack = [self._node_index.get(node_id)]
+            if stack[0] is None:
+                unknown.append(node_id)
+                continue
+            while stack.__len__() > 0:
+                node = stack.pop()
+                bits |= 1 << node._index
+                if three_state:
+                    stack.extend(node._child_widgets)
+        return bits, unknown
+
+    def _update_parents(self, nodes):
+        # In the three state mode a parent is checked only if all of its children are checked
+        if not self._is_three_state():
+            return
+        if not isinstance(nodes, (list, tuple)):
+            nodes = [nodes]
+        for node_id in nodes:
+            node = self._node_index.get(node_id)
+            parent = node.get_parent() if node is not None else None
+            while isinstance(parent, JSTreeNode) and parent._index is not None:
+                checked = True
+                for child in parent._child_widgets:
+                    if (self._checked_bits >> child._index) & 1 == 0:
+                        checked = False
+                        break
+                if checked:
+                    self._checked_bits |= 1 << parent._index
+                else:
+                    self._checked_bits &= ~(1 << parent._index)
+                parent = parent.get_parent()
+
     def check_node(self, nodes):
-        self._cmd_queue.append({'cmd': 'CHECK-NODE', 'arg0': nodes})
+        bits, unknown = self._get_bits(nodes)
+        self._checked_bits |= bits
+        self._update_parents(nodes)
+        self._checked_dirty = True
+        if unknown.__len__() > 0:
+            self._cmd_queue.append({'cmd': 'CHECK-NODE', 'arg0': unknown})
 
     def uncheck_node(self, nodes):
-        self._cmd_queue.append({'cmd': 'UNCHECK-NODE', 'arg0': nodes})
+        bits, unknown = self._get_bits(nodes)
+        self._checked_bits &= ~bits
+        self._update_parents(nodes)
+        self._checked_dirty = True
+        if unknown.__len__() > 0:
+            self._cmd_queue.append({'cmd': 'UNCHECK-NODE', 'arg0': unknown})
 
     def check_all(self):
-        self._cmd_queue.append({'cmd': 'CHECK-ALL'})
+        self._checked_bits = self._node_bits
+        self._checked_dirty = True
 
     def uncheck_all(self):
-        self._cmd_queue.append({'cmd': 'UNCHECK-ALL'})
+        self._checked_bits = 0
+        self._checked_dirty = True
+
+    def is_checked(self, node):
+        """Returns `True` if the node having passed id is checked as per the server side
+        checkbox state
+
+            Args:
+                node (string): Id (or name) of the node
+        """
+        tree_node = self._node_index.get(node)
+        if tree_node is None:
+            return False
+        return (self._checked_bits >> tree_node._index) & 1 == 1
+
+    def get_checked(self):
+        """Returns the list of ids of all checked nodes as per the server side checkbox state.
+        The state is kept as a bitset over the node indexes and the client receives it as one
+        list of index ranges whenever it changes
+        """
+        ranges = _encode_ranges(self._checked_bits)
+        checked = []
+        for i in range(0, ranges.__len__(), 2):
+            checked.extend(self._index_ids[ranges[i]:ranges[i + 1]])
+        return checked
+
+    def read_checked(self):
+        """Requests the client to report its complete set of checked nodes in a single call.
+        Once received, the server side checkbox state is updated and the callback registered
+        through `on_checked_callback` is invoked
+        """
+        self._cmd_queue.append({'cmd': 'GET-CHECKED'})
 
     def show_contextmenu(self):
         self._cmd_queue.append({'cmd': 'SHOW-CONTEXTMENU'})
@@ -1948,12 +2534,29 @@ class JSTree(Widget):
         self._cmd_queue.append({'cmd': 'CLEAR-SEARCH'})
 
     def save_state(self):
+        """Requests the client to save the state of the tree. Apart from the state plugin's
+        local storage, the opened and selected nodes are posted to the server where they are
+        kept as bitsets per state key (see `state_key_config`). The snapshot is applied directly
+        to the nodes whenever the tree is rendered or its nodes are lazy loaded
+        """
         self._cmd_queue.append({'cmd': 'SAVE-STATE'})
 
     def restore_state(self):
-        self._cmd_queue.append({'cmd': 'RESTORE-STATE'})
+        """Restores the saved state of the tree. A lazy loading tree reloads its data from
+        the server, which returns the nodes with the saved state already applied
+        """
+        self._cmd_queue.append({'cmd': 'RESTORE-STATE', 'arg0': self._lazy_load})
 
-    def clear_state(self):
+    def clear_state(self, key=None):
+        """Clears the saved state of the tree at the client and the server side snapshot
+
+            Args:
+                key (object): The state key of the snapshot to be cleared, if `None` the key
+                                is resolved using the callback set through `state_key_config`
+        """
+        if key is None:
+            key = self._get_state_key()
+        self._state_snapshots.pop(key, None)
         self._cmd_queue.append({'cmd': 'CLEAR-STATE'})
 
     def _attach_polling(self):
@@ -1967,6 +2570,18 @@ class JSTree(Widget):
                 self._app.add_url_rule('/' + url, url, self._command_processor)
         script = """
                 <script>
+                    function %s_ranges(idxs){
+                        idxs.sort(function(a, b){ return a - b; });
+                        var ranges = [];
+                        for(var i = 0; i < idxs.length; i++){
+                            if(ranges.length > 0 && ranges[ranges.length - 1] == idxs[i]){
+                                ranges[ranges.length - 1] = idxs[i] + 1;
+                            } else {
+                                ranges.push(idxs[i], idxs[i] + 1);
+                            }
+                        }
+                        return ranges;
+                    }
                     (function %s_poll(){
                         setTimeout(function(){
                             $.ajax({
@@ -2165,13 +2780,132 @@ class JSTree(Widget):
                                                     selector.clear_search();
                                                     break;
                                                 case 'SAVE-STATE':
-                                                    selector.save_state();
+                                                    if(selector.save_state != undefined){
+                                                        selector.save_state();
+                                                    }
+                                                    var opened = [];
+                                                    var selected = [];
+                                                    $.each(selector._model.data, function(id, node){
+                                                        if(node.data != null && node.data.idx != undefined){
+                                                            if(node.state.opened){
+                                                                opened.push(node.data.idx);
+                                                            }
+                                                            if(node.state.selected){
+                                                                selected.push(node.data.idx);
+                                                            }
+                                                        }
+                                                    });
+                                                    $.ajax({
+                                                        url: '/%s',
+                                                        type: 'post',
+                                                        dataType: 'json',
+                                                        data: {'opened': JSON.stringify(%s_ranges(opened)),
+                                                               'selected': JSON.stringify(%s_ranges(selected))},
+                                                        success: function(status){},
+                                                        error: function(err_status){
+                                                            alertify.error("Status Code: "
+                                                            + err_status.status + "<br />" + "Error Message:"
+                                                            + err_status.statusText);
+                                                        }
+                                                    });
                                                     break;
                                                 case 'RESTORE-STATE':
-                                                    selector.restore_state();
+                                                    if(props.arg0){
+                                                        selector.refresh(false, true);
+                                                    } else if(selector.restore_state != undefined){
+                                                        selector.restore_state();
+                                                    }
                                                     break;
                                                 case 'CLEAR-STATE':
-                                                    selector.clear_state();
+                                                    if(selector.clear_state != undefined){
+                                                        selector.clear_state();
+                                                    }
+                                                    break;
+                                                case 'SET-CHECKED':
+                                                    var idx_ids = {};
+                                                    $.each(selector._model.data, function(id, node){
+                                                        if(node.data != null && node.data.idx != undefined){
+                                                            idx_ids[node.data.idx] = id;
+                                                        }
+                                                    });
+                                                    var checked = [];
+                                                    for(var i = 0; i < props.arg0.length; i += 2){
+                                                        for(var j = props.arg0[i]; j < props.arg0[i + 1]; j++){
+                                                            if(idx_ids[j] != undefined){
+                                                                checked.push(idx_ids[j]);
+                                                            }
+                                                        }
+                                                    }
+                                                    selector.uncheck_all();
+                                                    selector.check_node(checked);
+                                                    break;
+                                                case 'GET-CHECKED':
+                                                    var idxs = [];
+                                                    $.each(selector.get_checked(true), function(i, node){
+                                                        if(node.data != null && node.data.idx != undefined){
+                                                            idxs.push(node.data.idx);
+                                                        }
+                                                    });
+                                                    var loaded = [];
+                                                    $.each(selector._model.data, function(id, node){
+                                                        if(node.data != null && node.data.idx != undefined){
+                                                            loaded.push(node.data.idx);
+                                                        }
+                                                    });
+                                                    $.ajax({
+                                                        url: '/%s',
+                                                        type: 'post',
+                                                        dataType: 'json',
+                                                        data: {'checked': JSON.stringify(%s_ranges(idxs)),
+                                                               'loaded': JSON.stringify(%s_ranges(loaded))},
+                                                        success: function(status){},
+                                                        error: function(err_status){
+                                                            alertify.error("Status Code: "
+                                                            + err_status.status + "<br />" + "Error Message:"
+                                                            + err_status.statusText);
+                                                        }
+                                                    });
+                                                    break;
+                                                case 'APPLY-CHANGES':
+                                                    var chk_callback = selector.settings.core.check_callback;
+                                                    selector.settings.core.check_callback = true;
+                                                    for(var i = 0; i < props.arg0.length; i++){
+                                                        var chg = props.arg0[i];
+                                                        switch(chg[0]){
+                                                            case 'c':
+                                                                selector.create_node(chg[2], chg[4],
+                                                                    chg[3] != null ? chg[3] : 'last');
+                                                                break;
+                                                            case 'd':
+                                                                selector.delete_node(chg[1]);
+                                                                break;
+                                                            case 'r':
+                                                                selector.rename_node(chg[1], chg[2]);
+                                                                break;
+                                                            case 'm':
+                                                                selector.move_node(chg[1], chg[2],
+                                                                    chg[3] != null ? chg[3] : 'last');
+                                                                break;
+                                                            case 's':
+                                                                if(chg[2].opened === true){
+                                                                    selector.open_node(chg[1]);
+                                                                } else if(chg[2].opened === false){
+                                                                    selector.close_node(chg[1]);
+                                                                }
+                                                                if(chg[2].selected === true){
+                                                                    selector.select_node(chg[1], true);
+                                                                } else if(chg[2].selected === false){
+                                                                    selector.deselect_node(chg[1], true);
+                                                                }
+                                                                if(chg[2].disabled === true){
+                                                                    selector.disable_node(chg[1]);
+                                                                } else if(chg[2].disabled === false){
+                                                                    selector.enable_node(chg[1]);
+                                                                }
+                                                                break;
+                                                        }
+                                                    }
+                                                    selector.settings.core.check_callback = chk_callback;
                                                     break;
                                             }
                                         }
@@ -2187,11 +2921,14 @@ class JSTree(Widget):
                         }, 500);
                     })();
                 </script>
-                """ % (url, url, self._name, url)
+                """ % (url, url, url, self._name, self._save_state_url, url, url,
+                       self._checked_url, url, url, url)
         return script
 
     def render(self):
         self._prepare_callback_urls()
+        # Rendered data already reflects all the pending changes
+        self._change_log = []
         content = self._render_pre_content('div')
         content += self._render_post_content('div')
         content += self._attach_script() + "\n" + self._attach_event_handlers()\
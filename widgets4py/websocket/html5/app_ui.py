@@ -9,6 +9,7 @@ Date: 07/25/2019
 import os
 from flask_socketio import emit, Namespace
 from widgets4py.base import Widget
+from widgets4py.formatting import TabularFormatter
 
 
 class Button(Namespace, Widget):
@@ -95,8 +96,8 @@ class Button(Namespace, Widget):
     #     self._sync_properties(obj.namespace)
 
     def _sync_properties(self, ns):
-        emit('sync_properties_' + self._name, {'disabled': self._disabled,
-                                               'title': self._title}, namespace=ns)
+        self._emit('sync_properties_' + self._name, {'disabled': self._disabled,
+                                                     'title': self._title}, namespace=ns, key='properties')
 
     def on_click(self, click_callback):
         """Registers an callback passed as argument with the onclick event
@@ -118,7 +119,7 @@ class Button(Namespace, Widget):
             self._title = title
         try:
             if self._click_callback is not None:
-                self._click_callback(self._name, props)
+                self._run_callback(self._click_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -127,13 +128,13 @@ class Button(Namespace, Widget):
             msg = 'Method failed during callback execution: ' + str(e)
             emit('failed', {'status': False, 'message': msg})
 
-    def on_connect(self):
+    def on_connect(self, auth=None):
         """Called by websocket when connection is established"""
-        pass
+        Widget.on_connect(self)
 
     def on_disconnect(self):
         """Called by websocket when connection is terminated"""
-        pass
+        Widget.on_disconnect(self)
 
     def _attach_script(self):
         script = """
@@ -278,10 +279,10 @@ class TextBox(Namespace, Widget):
         self._sync_properties(self._namespace_url)
 
     def _sync_properties(self, ns):
-        emit('sync_properties_' + self._name, {'disabled': self._disabled,
-                                               'text': self._text,
-                                               'readonly': self._readonly},
-             namespace=ns)
+        self._emit('sync_properties_' + self._name, {'disabled': self._disabled,
+                                                     'text': self._text,
+                                                     'readonly': self._readonly},
+                   namespace=ns, key='properties')
 
     def on_change(self, change_callback):
         """Registers an callable event handler with the textbox and called when text value is changed"""
@@ -301,7 +302,7 @@ class TextBox(Namespace, Widget):
             self._text = txt
         try:
             if self._change_callback is not None:
-                self._change_callback(self._name, props)
+                self._run_callback(self._change_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -309,13 +310,13 @@ class TextBox(Namespace, Widget):
             print("Error: " + str(e))
             emit('failed', {'status': False, 'message': 'Method failed during callback execution: ' + str(e)})
 
-    def on_connect(self):
+    def on_connect(self, auth=None):
         """This method is called when websocket connection is established"""
-        pass
+        Widget.on_connect(self)
 
     def on_disconnect(self):
         """This method is called when websocket connection is terminated"""
-        pass
+        Widget.on_disconnect(self)
 
     def _attach_script(self):
         script = """
@@ -478,11 +479,11 @@ class CheckBox(Namespace, Widget):
     #     self._sync_properties(obj.namespace)
 
     def _sync_properties(self, ns):
-        emit('sync_properties_' + self._name, {'disabled': self._disabled,
-                                               'title': self._title,
-                                               'checked': self._checked,
-                                               'value': self._value},
-             namespace=ns)
+        self._emit('sync_properties_' + self._name, {'disabled': self._disabled,
+                                                     'title': self._title,
+                                                     'checked': self._checked,
+                                                     'value': self._value},
+                   namespace=ns, key='properties')
 
     def on_click(self, click_callback):
         """Attaches an event handler that will be executed when checked state changes"""
@@ -505,7 +506,7 @@ class CheckBox(Namespace, Widget):
             self._value = val
         try:
             if self._click_callback is not None:
-                self._click_callback(self._name, props)
+                self._run_callback(self._click_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -513,13 +514,13 @@ class CheckBox(Namespace, Widget):
             print("Error: " + str(e))
             emit('failed', {'status': False, 'message': 'Method failed during callback execution: ' + str(e)})
 
-    def on_connect(self):
+    def on_connect(self, auth=None):
         """This method is called when websocket establish an connection"""
-        pass
+        Widget.on_connect(self)
 
     def on_disconnect(self):
         """This method is called when websocket's connection is terminated"""
-        pass
+        Widget.on_disconnect(self)
 
     def _attach_script(self):
         script = """
@@ -668,8 +669,8 @@ class Color(Namespace, Widget):
         self._sync_properties(self._namespace_url)
 
     def _sync_properties(self, ns):
-        emit('sync_properties_' + self._name, {'disabled': self._disabled,
-                                               'value': self._value}, namespace=ns)
+        self._emit('sync_properties_' + self._name, {'disabled': self._disabled,
+                                                     'value': self._value}, namespace=ns, key='properties')
 
     def on_change(self, change_callback):
         """Registers an change passed as argument with the onchange event
@@ -690,7 +691,7 @@ class Color(Namespace, Widget):
             self._value = val
         try:
             if self._change_callback is not None:
-                self._change_callback(self._name, props)
+                self._run_callback(self._change_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -699,13 +700,13 @@ class Color(Namespace, Widget):
             msg = 'Method failed during callback execution: ' + str(e)
             emit('failed', {'status': False, 'message': msg})
 
-    def on_connect(self):
+    def on_connect(self, auth=None):
         """Called by websocket when connection is established"""
-        pass
+        Widget.on_connect(self)
 
     def on_disconnect(self):
         """Called by websocket when connection is terminated"""
-        pass
+        Widget.on_disconnect(self)
 
     def _attach_script(self):
         script = """
@@ -882,12 +883,12 @@ class Date(Namespace, Widget):
         self._sync_properties(self._namespace_url)
 
     def _sync_properties(self, ns):
-        emit('sync_properties_' + self._name, {'disabled': self._disabled,
-                                               'value': self._value,
-                                               'max': self._max,
-                                               'min': self._min,
-                                               'readonly': self._readonly},
-             namespace=ns)
+        self._emit('sync_properties_' + self._name, {'disabled': self._disabled,
+                                                     'value': self._value,
+                                                     'max': self._max,
+                                                     'min': self._min,
+                                                     'readonly': self._readonly},
+                   namespace=ns, key='properties')
 
     def on_change(self, change_callback):
         """Registers an callable event handler with the textbox and called when text value is changed"""
@@ -913,7 +914,7 @@ class Date(Namespace, Widget):
             self._readonly = rdonly
         try:
             if self._change_callback is not None:
-                self._change_callback(self._name, props)
+                self._run_callback(self._change_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -921,13 +922,13 @@ class Date(Namespace, Widget):
             print("Error: " + str(e))
             emit('failed', {'status': False, 'message': 'Method failed during callback execution: ' + str(e)})
 
-    def on_connect(self):
+    def on_connect(self, auth=None):
         """This method is called when websocket connection is established"""
-        pass
+        Widget.on_connect(self)
 
     def on_disconnect(self):
         """This method is called when websocket connection is terminated"""
-        pass
+        Widget.on_disconnect(self)
 
     def _attach_script(self):
         script = """
@@ -1174,9 +1175,9 @@ class File(Namespace, Widget):
         self._sync_properties(self._namespace_url)
 
     def _sync_properties(self, ns):
-        emit('sync_properties_' + self._name, {'disabled': self._disabled,
-                                               'multiple': self._multiple},
-             namespace=ns)
+        self._emit('sync_properties_' + self._name, {'disabled': self._disabled,
+                                                     'multiple': self._multiple},
+                   namespace=ns, key='properties')
 
     def on_change(self, change_callback):
         """Registers an callable event handler with the widget and called when text value is changed"""
@@ -1207,7 +1208,7 @@ class File(Namespace, Widget):
                     files_path.append(os.path.join(self._upload_folder, filename))
         try:
             if self._change_callback is not None:
-                self._change_callback(self._name, props)
+                self._run_callback(self._change_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -1226,7 +1227,7 @@ class File(Namespace, Widget):
             self._multiple = mul
         try:
             if self._click_callback is not None:
-                self._click_callback(self._name, props)
+                self._run_callback(self._click_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -1234,13 +1235,13 @@ class File(Namespace, Widget):
             print("Error: " + str(e))
             emit('failed', {'status': False, 'message': 'Method failed during callback execution: ' + str(e)})
 
-    def on_connect(self):
+    def on_connect(self, auth=None):
         """This method is called when websocket connection is established"""
-        pass
+        Widget.on_connect(self)
 
     def on_disconnect(self):
         """This method is called when websocket connection is terminated"""
-        pass
+        Widget.on_disconnect(self)
 
     def _attach_script(self):
         script = """
@@ -1858,9 +1859,9 @@ class Form(Namespace, Widget):
         self._sync_properties(self._namespace_url)
 
     def _sync_properties(self, ns):
-        emit('sync_properties_' + self._name, {'disabled': self._disabled,
-                                               'legend': self._legend},
-             namespace=ns)
+        self._emit('sync_properties_' + self._name, {'disabled': self._disabled,
+                                                     'legend': self._legend},
+                   namespace=ns, key='properties')
 
     def on_submit(self, submit_callback):
         """Registers an callback passed as argument with the submit event
@@ -1885,7 +1886,7 @@ class Form(Namespace, Widget):
             self._submitted_form_data = form_data
         try:
             if self._submit_callback is not None:
-                self._submit_callback(self._name, props)
+                self._run_callback(self._submit_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -1894,13 +1895,13 @@ class Form(Namespace, Widget):
             msg = 'Method failed during callback execution: ' + str(e)
             emit('failed', {'status': False, 'message': msg})
 
-    def on_connect(self):
+    def on_connect(self, auth=None):
         """Called by websocket when connection is established"""
-        pass
+        Widget.on_connect(self)
 
     def on_disconnect(self):
         """Called by websocket when connection is terminated"""
-        pass
+        Widget.on_disconnect(self)
 
     def _attach_script(self):
         script = """
@@ -1967,6 +1968,7 @@ class ListBox(Namespace, Widget):
     """
 
     _options = None
+    _formatter = None
     _size = None
     _disabled = None
     _change_callback = None
@@ -2022,6 +2024,7 @@ class ListBox(Namespace, Widget):
             self._options = options
         else:
             self._options = {}
+        self._formatter = TabularFormatter()
         if size is not None:
             self._size = size
         else:
@@ -2081,11 +2084,11 @@ class ListBox(Namespace, Widget):
         self._sync_properties(self._namespace_url)
 
     def _sync_properties(self, ns):
-        emit('sync_properties_' + self._name, {'disabled': self._disabled,
-                                               'size': self._size,
-                                               'value': self._value,
-                                               'multiselect': self._multiselect},
-             namespace=ns)
+        self._emit('sync_properties_' + self._name, {'disabled': self._disabled,
+                                                     'size': self._size,
+                                                     'value': self._value,
+                                                     'multiselect': self._multiselect},
+                   namespace=ns, key='properties')
 
     def on_change(self, change_callback):
         """Registers an callback passed as argument with the change event
@@ -2132,7 +2135,7 @@ class ListBox(Namespace, Widget):
             self._multiselect = multi
         try:
             if self._change_callback is not None:
-                self._change_callback(self._name, props)
+                self._run_callback(self._change_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -2141,13 +2144,13 @@ class ListBox(Namespace, Widget):
             msg = 'Method failed during callback execution: ' + str(e)
             emit('failed', {'status': False, 'message': msg})
 
-    def on_connect(self):
+    def on_connect(self, auth=None):
         """Called by websocket when connection is established"""
-        pass
+        Widget.on_connect(self)
 
     def on_disconnect(self):
         """Called by websocket when connection is terminated"""
-        pass
+        Widget.on_disconnect(self)
 
     def _attach_script(self):
         script = """
@@ -2200,17 +2203,15 @@ class ListBox(Namespace, Widget):
         if self._multiselect is not None and self._multiselect:
             self.add_attribute("multiple")
         content = self._render_pre_content('select')
-        for opt in self._options:
-            value = self._options.get(opt)
-            title = value[0]
-            is_selected = value[1]
-            content += "\n<option value='" + opt + "' "
+        cells = self._formatter.format_rows(
+            [(opt, self._options.get(opt)[0] if self._options.get(opt)[0] is not None else opt)
+             for opt in self._options])
+        for opt, (value, title) in zip(self._options, cells):
+            is_selected = self._options.get(opt)[1]
+            content += "\n<option value='" + value + "' "
             if is_selected is not None and is_selected:
                 content += "selected "
-            if title is not None:
-                content += ">" + title + "</option>"
-            else:
-                content += ">" + opt + "</option>"
+            content += ">" + title + "</option>"
         self._widget_content = content + self._render_post_content('select') + "\n" + self._attach_script()
         return self._widget_content
 
@@ -2300,8 +2301,8 @@ class Label(Namespace, Widget):
     #     self._sync_properties(obj.namespace)
 
     def _sync_properties(self, ns):
-        emit('sync_properties_' + self._name, {'disabled': self._disabled,
-                                               'text': self._text}, namespace=ns)
+        self._emit('sync_properties_' + self._name, {'disabled': self._disabled,
+                                                     'text': self._text}, namespace=ns, key='properties')
 
     def on_click(self, click_callback):
         """Registers an callback passed as argument with the onclick event
@@ -2323,7 +2324,7 @@ class Label(Namespace, Widget):
             self._text = txt
         try:
             if self._click_callback is not None:
-                self._click_callback(self._name, props)
+                self._run_callback(self._click_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -2332,13 +2333,13 @@ class Label(Namespace, Widget):
             msg = 'Method failed during callback execution: ' + str(e)
             emit('failed', {'status': False, 'message': msg})
 
-    def on_connect(self):
+    def on_connect(self, auth=None):
         """Called by websocket when connection is established"""
-        pass
+        Widget.on_connect(self)
 
     def on_disconnect(self):
         """Called by websocket when connection is terminated"""
-        pass
+        Widget.on_disconnect(self)
 
     def _attach_script(self):
         script = """
@@ -5,11 +5,15 @@ JQuery Mobile framework
 Author: Ajeet Singh
 Date: 07/30/2019
 """
-import cgi
-from flask import json
+from flask import json, request
 from flask_socketio import Namespace, emit
 from widgets4py.base import Widget
+from widgets4py.websocket.rate_limit import rate_limit_script, rate_limited
+from widgets4py.formatting import TabularFormatter, escape_column
 from enum import Enum
+from bisect import bisect_left
+from collections import namedtuple
+from html import escape
 
 
 class MobilePage(Widget, Namespace):
@@ -167,6 +171,7 @@ class MobilePage(Widget, Namespace):
     @title.setter
     def title(self, val):
         self._title = val
+        self.invalidate()
 
     @property
     def header_widgets(self):
@@ -175,6 +180,7 @@ class MobilePage(Widget, Namespace):
     @header_widgets.setter
     def header_widgets(self, val):
         self._header_widgets = val
+        self.invalidate()
 
     @property
     def child_widgets(self):
@@ -183,6 +189,7 @@ class MobilePage(Widget, Namespace):
     @child_widgets.setter
     def child_widgets(self, val):
         self._child_widgets = val
+        self.invalidate()
 
     @property
     def footer_widgets(self):
@@ -191,6 +198,7 @@ class MobilePage(Widget, Namespace):
     @footer_widgets.setter
     def footer_widgets(self, val):
         self._footer_widgets = val
+        self.invalidate()
 
     @property
     def panel_widgets(self):
@@ -199,6 +207,7 @@ class MobilePage(Widget, Namespace):
     @panel_widgets.setter
     def panel_widgets(self, val):
         self._panel_widgets = val
+        self.invalidate()
 
     @property
     def footer_title(self):
@@ -207,24 +216,37 @@ class MobilePage(Widget, Namespace):
     @footer_title.setter
     def footer_title(self, val):
         self._footer_title = val
+        self.invalidate()
 
     def add_panel(self, panel):
         self._panel_widgets.append(panel)
+        self.invalidate()
 
     def remove_panel(self, panel):
         self._panel_widgets.remove(panel)
+        self.invalidate()
 
     def add_header_widget(self, widget):
         self._header_widgets.append(widget)
+        self.invalidate()
 
     def remove_header_widget(self, widget):
         self._header_widgets.remove(widget)
+        self.invalidate()
 
     def add_footer_widget(self, widget):
         self._footer_widgets.append(widget)
+        self.invalidate()
 
     def remove_footer_widget(self, widget):
         self._footer_widgets.remove(widget)
+        self.invalidate()
+
+    def _get_socket_io(self):
+        return self._socketio
+
+    def _get_all_children(self):
+        return self._header_widgets + self._child_widgets + self._footer_widgets + self._panel_widgets
 
     def on_before_render_event(self, callback):
         self._before_render_callback = callback
@@ -233,12 +255,12 @@ class MobilePage(Widget, Namespace):
         self._after_render_callback = callback
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def on_fire_click_event(self, props):
         if self._click_callback is not None:
-            self._click_callback(self._name, props)
+            self._run_callback(self._click_callback, self._name, props)
 
     def _attach_script(self):
         script = """
@@ -248,8 +270,12 @@ class MobilePage(Widget, Namespace):
                             var socket = io('%s');
                             var selector = $('#%s');
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.page("option", props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.page("option", props['cmd'], props['value']);
+                                }
                             });
 
                             selector.bind('vclick', function(){
@@ -338,18 +364,147 @@ class MobilePage(Widget, Namespace):
         return content
 
 
-class MultiPage(Widget):
+class MultiPage(Widget, Namespace):
     """This class is the collection of multiple virtual pages that will be rendered on
     a single page in reality. Please check 'Multi-Page' section in the JQuery Mobile
     for more information
+
+    In the lazy mode only the initial page is rendered with the document, the other pages
+    are rendered when the user navigates to them for the first time and are sent over the
+    socket. The rendered pages are cached at the server until the revision of the page or of
+    any of its widgets changes (see `Widget.get_tree_revision`)
     """
 
-    def __init__(self, name, pages):
+    _namespace = None
+    _socket_io = None
+    _lazy = None
+    _initial_page = None
+    _page_cache = None
+
+    def __init__(self, name, pages, socket_io=None, lazy=None, initial_page=None):
+        """
+            Args:
+                name (string): Name of the widget
+                pages (list): A list of `MobilePage` widgets
+                socket_io (SocketIO): An instance of the `SocketIO` class, required in the lazy mode
+                lazy (boolean): Renders only the initial page with the document
+                initial_page (string): Name of the page shown first, the first page by default
+        """
         Widget.__init__(self, name)
+        Namespace.__init__(self, '/' + str(__name__ + "_" + name + "_mpage").replace('.', '_'))
+        self._namespace = '/' + str(__name__ + "_" + name + "_mpage").replace('.', '_')
         if pages is not None:
             self._child_widgets = pages
         else:
             self._child_widgets = []
+        if lazy is not None:
+            self._lazy = lazy
+        else:
+            self._lazy = False
+        if self._lazy and socket_io is None:
+            raise ValueError("The value of 'socket_io' can't be empty in the lazy mode")
+        self._socket_io = socket_io
+        if self._socket_io is not None:
+            self._socket_io.on_namespace(self)
+        self._initial_page = initial_page
+        self._page_cache = {}
+
+    @property
+    def lazy(self):
+        return self._lazy
+
+    @property
+    def initial_page(self):
+        return self._initial_page
+
+    @initial_page.setter
+    def initial_page(self, val):
+        self._initial_page = val
+
+    def get_page(self, name):
+        """Returns the page having the given name, None if not available"""
+        for page in self._child_widgets:
+            if page.get_name() == name:
+                return page
+        return None
+
+    def render_page(self, name):
+        """Returns the content of the page, rendered again only if the page was changed since
+        it was last rendered
+
+            Args:
+                name (string): Name of the page
+        """
+        page = self.get_page(name)
+        if page is None:
+            return None
+        revision = page.get_tree_revision()
+        cached = self._page_cache.get(name)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        content = page.render()
+        self._page_cache[name] = (revision, content)
+        return content
+
+    def invalidate(self, page=None):
+        """Drops the cached content of the page, or of all the pages if no page is passed"""
+        Widget.invalidate(self)
+        if page is not None:
+            self._page_cache.pop(page, None)
+        else:
+            self._page_cache = {}
+
+    def on_load_page(self, props):
+        name = props['page']
+        content = self.render_page(name)
+        if content is not None:
+            emit('sync_page_' + self._name, {'page': name, 'html': content}, namespace=self._namespace)
+
+    def _attach_script(self, pages):
+        script = """
+                <script>
+                (function($, undefined){
+                    var socket = io('%s');
+                    var pages = %s;
+                    var pending = {};
+
+                    function load_page(page, options){
+                        if(pending[page] === undefined){
+                            pending[page] = options;
+                            socket.emit('load_page', {'page': page});
+                        }
+                    }
+
+                    // Pages not available in the document are loaded from the server first
+                    $(document).on('pagecontainerbeforechange', function(e, data){
+                        if(typeof data.toPage !== 'string'){
+                            return;
+                        }
+                        var page = $.mobile.path.parseUrl(data.toPage).hash.replace('#', '');
+                        if(pages.indexOf(page) < 0 || $('#' + page).length > 0){
+                            return;
+                        }
+                        e.preventDefault();
+                        load_page(page, data.options || {});
+                    });
+
+                    $(function(){
+                        var page = window.location.hash.replace('#', '');
+                        if(pages.indexOf(page) >= 0 && $('#' + page).length == 0){
+                            load_page(page, {});
+                        }
+                    });
+
+                    socket.on('sync_page_%s', function(data){
+                        var options = pending[data.page] || {};
+                        delete pending[data.page];
+                        $.mobile.pageContainer.append(data.html);
+                        $.mobile.pageContainer.pagecontainer('change', '#' + data.page, options);
+                    });
+                })(jQuery);
+                </script>
+                """ % (self._namespace, json.dumps(pages), self._name)
+        return script
 
     def add_page(self, page):
         """Adds a new page of type `MobilePage` to this MultiPage widget
@@ -358,6 +513,7 @@ class MultiPage(Widget):
                 page (MobilePage): Instance of the `MobilePage` widget
         """
         self._child_widgets.append(page)
+        self._revision += 1
 
     def remove_page(self, page):
         """Removes a page of type `MobilePage` from this widget
@@ -366,12 +522,25 @@ class MultiPage(Widget):
                 page (MobilePage): Instance of the `MobilePage` widget
         """
         self._child_widgets.remove(page)
+        self._page_cache.pop(page.get_name(), None)
+        self._revision += 1
 
     def render(self):
-        """Renders all the child pages"""
+        """Renders all the child pages, or only the initial page in the lazy mode"""
         content = ""
-        for page in self._child_widgets:
-            content += page.render() + "\n"
+        if not self._lazy:
+            for page in self._child_widgets:
+                content += page.render() + "\n"
+            return content
+        initial_page = self._initial_page
+        if initial_page is None and self._child_widgets.__len__() > 0:
+            initial_page = self._child_widgets[0].get_name()
+        if initial_page is not None:
+            if self.get_page(initial_page) is None:
+                raise ValueError("No page named '" + str(initial_page) + "' to be shown first")
+            content += self.render_page(initial_page) + "\n"
+        pages = [page.get_name() for page in self._child_widgets if page.get_name() != initial_page]
+        content += self._attach_script(pages)
         return content
 
 
@@ -521,10 +690,10 @@ class Button(Widget, Namespace):
         self._data_rel = val
 
     def _sync_properties(self):
-        emit('sync_properties_' + self._name, {'title': self._title,
-                                               'icon': self._icon,
-                                               'styles': self._btn_styles},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'title': self._title,
+                                                     'icon': self._icon,
+                                                     'styles': self._btn_styles},
+                   namespace=self._namespace, key='properties')
 
     def add_style(self, style):
         """Add a new style from ButtonStyle class to the buttons style
@@ -555,7 +724,7 @@ class Button(Widget, Namespace):
                 self._icon = icon
         try:
             if self._click_callback is not None:
-                self._click_callback(self._name, props)
+                self._run_callback(self._click_callback, self._name, props)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -720,8 +889,8 @@ class CheckBox(Widget, Namespace):
         Widget.__init__(self, name)
         Namespace.__init__(self, '/' + str(__name__ + "_" + name + "_check").replace('.', '_'))
         self._namespace = '/' + str(__name__ + "_" + name + "_check").replace('.', '_')
-        self._socketio = socket_io
-        self._socketio.on_namespace(self)
+        self._socket_io = socket_io
+        self._socket_io.on_namespace(self)
         if items is not None:
             self._items = items
         else:
@@ -814,9 +983,9 @@ class CheckBox(Widget, Namespace):
         self._sync_properties()
 
     def _sync_properties(self):
-        emit('sync_properties_' + self._name, {'orientation': self._orientation,
-                                               'legend': self._legend},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'orientation': self._orientation,
+                                                     'legend': self._legend},
+                   namespace=self._namespace, key='properties')
 
     def add_item(self, name, title, theme=None, disabled=None):
         """Adds a new item to the collection of checkboxes
@@ -856,16 +1025,16 @@ class CheckBox(Widget, Namespace):
                 self._items.remove(itm)
 
     def set_item_title(self, item_name, value):
-        emit('sync_item_props_' + self._name, {'item_name': item_name,
-                                               'prop_name': 'title',
-                                               'value': value},
-             namespace=self._namespace)
+        self._emit('sync_item_props_' + self._name, {'item_name': item_name,
+                                                     'prop_name': 'title',
+                                                     'value': value},
+                   namespace=self._namespace)
 
     def set_item_disabled(self, item_name, value):
-        emit('sync_item_props_' + self._name, {'item_name': item_name,
-                                               'prop_name': 'disabled',
-                                               'value': value},
-             namespace=self._namespace)
+        self._emit('sync_item_props_' + self._name, {'item_name': item_name,
+                                                     'prop_name': 'disabled',
+                                                     'value': value},
+                   namespace=self._namespace)
 
     def on_fire_click_event(self, data):
         try:
@@ -874,7 +1043,7 @@ class CheckBox(Widget, Namespace):
                     if item['name'] == data['source']:
                         item['state'] = data['state']
             if self._click_callback is not None:
-                self._click_callback(data['source'], data['state'], self._items)
+                self._run_callback(self._click_callback, data['source'], data['state'], self._items)
                 emit('success', {'status': True, 'message': 'success'})
             else:
                 emit('warning', {'status': False, 'message': 'No callback registered'})
@@ -1028,6 +1197,10 @@ class Collapsible(Namespace, Widget):
     to expand or collapse content when tapped and are
     useful in mobile to provide a compact presentation
     of content.
+
+    A deferred collapsible renders only its header as long as it is collapsed, its content
+    is rendered when it is expanded for the first time and is sent over the socket. The
+    client keeps the content once loaded
     """
 
     _title = None
@@ -1047,11 +1220,19 @@ class Collapsible(Namespace, Widget):
     _namespace = None
     _collapse_callback = None
     _expand_callback = None
+    _deferred = None
+    _content_cache = None
 
     def __init__(self, name, title, socket_io, theme=None, content_theme=None, is_collapsed=None,
                  is_mini=None, collapsed_icon=None, expanded_icon=None, iconpos=None,
                  is_fieldset=None, legend=None, is_inset=None, corners=None, collapse_callback=None,
-                 expand_callback=None, disabled=None):
+                 expand_callback=None, disabled=None, deferred=None):
+        """
+            Args:
+                deferred (boolean): Renders the content only when the collapsible is expanded
+                                    for the first time, a collapsible within a `CollapsibleSet`
+                                    uses the value of the set if not given
+        """
         Widget.__init__(self, name)
         Namespace.__init__(self, '/' + str(__name__ + "_" + self._name + "_colpse").replace('.', '_'))
         self._namespace = '/' + str(__name__ + "_" + self._name + "_colpse").replace('.', '_')
@@ -1072,6 +1253,7 @@ class Collapsible(Namespace, Widget):
         self._disabled = disabled
         self._collapse_callback = collapse_callback
         self._expand_callback = expand_callback
+        self._deferred = deferred
 
     @property
     def namespace(self):
@@ -1213,6 +1395,38 @@ class Collapsible(Namespace, Widget):
         self._disabled = val
         self._sync_properties('disabled', val)
 
+    @property
+    def deferred(self):
+        """Whether the content is rendered only when the widget is expanded"""
+        return self._deferred
+
+    @deferred.setter
+    def deferred(self, val):
+        self._deferred = val
+        self.invalidate()
+
+    def _is_deferred(self):
+        deferred = self._deferred
+        if deferred is None and isinstance(self.get_parent(), CollapsibleSet):
+            deferred = self.get_parent().deferred
+        return bool(deferred) and self._is_collapsed is not False
+
+    def render_content(self):
+        """Returns the rendered child widgets, rendered again only if any of them was changed
+        since they were last rendered"""
+        revision = self.get_tree_revision()
+        if self._content_cache is not None and self._content_cache[0] == revision:
+            return self._content_cache[1]
+        content = ""
+        if self._child_widgets is not None:
+            for widget in self._child_widgets:
+                content += widget.render() + "\n"
+        self._content_cache = (revision, content)
+        return content
+
+    def on_load_content(self, props):
+        emit('sync_content_' + self._name, {'html': self.render_content()}, namespace=self._namespace)
+
     def on_fire_collapse_event(self, props):  # noqa
         clspd = props['collapsed']
         if clspd is not None:
@@ -1248,7 +1462,7 @@ class Collapsible(Namespace, Widget):
         if thm is not None:
             self._theme = thm
         if self._collapse_callback is not None:
-            self._collapse_callback(self._name, props)
+            self._run_callback(self._collapse_callback, self._name, props)
 
     def on_fire_expand_event(self, props):  # noqa
         clspd = props['collapsed']
@@ -1285,11 +1499,11 @@ class Collapsible(Namespace, Widget):
         if thm is not None:
             self._theme = thm
         if self._expand_callback is not None:
-            self._expand_callback(self._name, props)
+            self._run_callback(self._expand_callback, self._name, props)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def _attach_script(self):
         script = """
@@ -1299,8 +1513,12 @@ class Collapsible(Namespace, Widget):
                             var socket = io('%s');
                             var selector = $('#%s');
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.collapsible("option", props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.collapsible("option", props['cmd'], props['value']);
+                                }
                             });
 
                             selector.on( "collapsiblecollapse", function( event, ui ) {
@@ -1342,6 +1560,58 @@ class Collapsible(Namespace, Widget):
                 """ % (self._namespace, self._name, self._name)
         return script
 
+    def _attach_content_script(self):
+        script = """
+                <script>
+                    (function($, undefined){
+                        $(document).bind('pagecreate', function(e){
+                            var socket = io('%s');
+                            var selector = $('#%s');
+                            var requested = false;
+
+                            selector.on( "collapsibleexpand", function( event, ui ) {
+                                if(!requested){
+                                    requested = true;
+                                    socket.emit("load_content", {});
+                                }
+                            } );
+
+                            socket.on('sync_content_%s', function(data){
+                                var content = selector.children('.ui-collapsible-content');
+                                // The page is created already, so the 'pagecreate' handlers bound by
+                                // the scripts of the loaded widgets are collected through the special
+                                // event hook while the content is inserted, and only they get the event
+                                var added = [];
+                                var special = $.event.special.pagecreate;
+                                $.event.special.pagecreate = $.extend({}, special, {
+                                    add: function(handleObj){
+                                        added.push(handleObj.handler);
+                                        if(special != undefined && special.add != undefined){
+                                            special.add.call(this, handleObj);
+                                        }
+                                    }
+                                });
+                                try{
+                                    content.html(data['html']);
+                                } finally {
+                                    if(special != undefined){
+                                        $.event.special.pagecreate = special;
+                                    } else {
+                                        delete $.event.special.pagecreate;
+                                    }
+                                }
+                                content.enhanceWithin();
+                                var event = $.Event('pagecreate', {'target': content[0]});
+                                for(var i = 0; i < added.length; i++){
+                                    added[i].call(document, event);
+                                }
+                            });
+                        });
+                    })(jQuery);
+                </script>
+                """ % (self._namespace, self._name, self._name)
+        return script
+
     def render(self):       # noqa
         """Renders the widget contents"""
         content = ""
@@ -1373,14 +1643,16 @@ class Collapsible(Namespace, Widget):
             if self._title is not None:
                 content += "<h4 id='" + self._name
                 content += "_head'>" + self._title + "</h4>\n"
-        if self._child_widgets is not None:
-            for widget in self._child_widgets:
-                content += widget.render() + "\n"
+        deferred = self._is_deferred()
+        if not deferred:
+            content += self.render_content()
         if self._is_fieldset is not None and self._is_fieldset:
             content += "</fieldset>"
         else:
             content += "</div>"
         content += "\n" + self._attach_script()
+        if deferred:
+            content += "\n" + self._attach_content_script()
         return content
 
 
@@ -1394,13 +1666,20 @@ class CollapsibleSet(Collapsible):
     def __init__(self, name, title, socket_io, theme=None, content_theme=None, is_collapsed=None,
                  is_mini=None, collapsed_icon=None, expanded_icon=None, iconpos=None,
                  is_fieldset=None, legend=None, is_inset=None, collapse_callback=None, items=None,
-                 no_corners=None, use_filter=None):
+                 no_corners=None, use_filter=None, deferred=None):
+        """
+            Args:
+                deferred (boolean): Renders the content of the collapsible items only when they
+                                    are expanded for the first time, unless set for an item itself
+        """
         Collapsible.__init__(self, name, None, socket_io, theme=theme, content_theme=content_theme,
                              is_collapsed=is_collapsed, is_mini=is_mini, collapsed_icon=collapsed_icon,
                              expanded_icon=expanded_icon, iconpos=iconpos, is_fieldset=None, legend=None,
-                             is_inset=is_inset, collapse_callback=collapse_callback)
+                             is_inset=is_inset, collapse_callback=collapse_callback, deferred=deferred)
         if items is not None:
             self._child_widgets = items
+            for item in items:
+                item.set_parent(self)
         else:
             self._child_widgets = []
         self._no_corners = no_corners
@@ -1591,11 +1870,11 @@ class ControlGroup(Widget, Namespace):
         if typ is not None:
             self._type = typ
         if self._click_callback is not None:
-            self._click_callback(self._name, props)
+            self._run_callback(self._click_callback, self._name, props)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def _attach_script(self):
         script = """
@@ -1606,8 +1885,12 @@ class ControlGroup(Widget, Namespace):
                             var selector = $('#%s');
                             var head_selector = $('#%s_lgnd');
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.controlgroup("option", props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.controlgroup("option", props['cmd'], props['value']);
+                                }
                             });
 
                             selector.bind('vclick', function(){
@@ -1685,6 +1968,7 @@ class FlipSwitch(Widget, Namespace):
     _is_disabled = None
     _custom_size = None
     _change_callback = None
+    _rate_limit = None
     _custom_label_css = None
     _custom_label_size_css = None
 
@@ -1731,7 +2015,17 @@ class FlipSwitch(Widget, Namespace):
 
     def __init__(self, name, socket_io, on_text=None, off_text=None, is_checked=None, switch_kind=None,
                  select_options=None, theme=None, is_mini=None, no_corners=None, is_disabled=None,
-                 custom_size=None, change_callback=None, custom_label_css=None, custom_label_size_css=None):
+                 custom_size=None, change_callback=None, custom_label_css=None, custom_label_size_css=None,
+                 rate_limit=None, event_window=None):
+        """
+            Args:
+                rate_limit (RateLimit): Limits the rate of the change events sent by the client while
+                                       the user toggles the switch, see `RateLimit.throttle` and
+                                       `RateLimit.debounce`
+                event_window (float): Seconds in which the change events are coalesced at the
+                                      server, the callback is called once per window with the
+                                      latest value
+        """
         Widget.__init__(self, name)
         Namespace.__init__(self, '/' + str(__name__ + "_" + self._name + "_fs").replace(".", "_"))
         self._namespace = '/' + str(__name__ + "_" + self._name + "_fs").replace(".", "_")
@@ -1771,6 +2065,17 @@ class FlipSwitch(Widget, Namespace):
         self._change_callback = change_callback
         self._custom_label_css = custom_label_css
         self._custom_label_size_css = custom_label_size_css
+        self._rate_limit = rate_limit
+        if event_window is not None:
+            self.set_event_window(event_window)
+
+    @property
+    def rate_limit(self):
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, val):
+        self._rate_limit = val
 
     @property
     def namespace(self):
@@ -1891,26 +2196,31 @@ class FlipSwitch(Widget, Namespace):
         if chk is not None:
             self._is_checked = chk
         if self._change_callback is not None:
-            self._change_callback(self._name, props)
+            self._run_coalesced(self._change_callback, self._name, props)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def _attach_script(self):
         script = """
                 <script>
                     (function($, undefined){
+                        %s
                         $(document).bind('pagecreate', function(e){
                             var socket = io('%s');
                             var selector = $('#%s');
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.flipswitch("option", props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.flipswitch("option", props['cmd'], props['value']);
+                                }
                                 selector.flipswitch('refresh');
                             });
 
-                            selector.bind('change', function(){
+                            var fire_change_event = function(){
                                 props = {
                                             'corners': selector.flipswitch("option", "corners"),
                                             'disabled': selector.flipswitch("option", "disabled"),
@@ -1921,11 +2231,13 @@ class FlipSwitch(Widget, Namespace):
                                             'checked': selector.is(':checked')
                                         };
                                 socket.emit("fire_change_event", props);
-                            });
+                            };
+                            selector.bind('change', %s);
                         });
                     })(jQuery);
                 </script>
-                """ % (self._namespace, self._name, self._name)
+                """ % (rate_limit_script(self._rate_limit), self._namespace, self._name, self._name,
+                       rate_limited('fire_change_event', self._rate_limit))
         return script
 
     def render(self):  # noqa
@@ -2080,6 +2392,16 @@ class SectionLayout(Widget):
         return content
 
 
+class ListRow(namedtuple('ListRow', ['title', 'href', 'count', 'img_src', 'icon',
+                                     'is_list_divider'],
+                         defaults=(None, None, None, None, None))):
+    """A row of a virtual `ListView`. The rows are plain tuples kept in a list by the
+    listview, so a list of many thousands of entries doesn't need a widget per entry
+    """
+
+    __slots__ = ()
+
+
 class ListView(Widget, Namespace):
     """A listview is coded as a simple unordered list (ul)
     or ordered list (ol) with a data-role="listview"
@@ -2101,10 +2423,29 @@ class ListView(Widget, Namespace):
     _split_theme = None
     _namespace = None
     _socket_io = None
+    _is_virtual = None
+    _window_size = None
+    _rows = None
+    _filter_index = None
+    _views = None
+    _click_callback = None
 
     def __init__(self, name, socket_io, is_ordered=None, is_inset=None, is_filterable=None,
                  is_filter_reveal=None, is_auto_divider_enabled=None, is_split_button_enabled=None,
-                 theme=None, items=None, disabled=None):
+                 theme=None, items=None, disabled=None, is_virtual=None, window_size=None,
+                 rows=None, click_callback=None):
+        """
+            Args:
+                click_callback (callable): Called with the name of the listview and the event
+                                    properties, whose 'index' is the position of the clicked
+                                    item or row, when an item without own callback is clicked
+                is_virtual (boolean): If True, the listview renders the `rows` instead of
+                                    its items. Only a window of rows is kept in the page,
+                                    further slices are requested over the socket while the
+                                    user scrolls and filtering is done on the server
+                window_size (int): Number of rows sent to the client at once in virtual mode
+                rows (list): `ListRow` tuples, or plain titles, shown in virtual mode
+        """
         Widget.__init__(self, name)
         Namespace.__init__(self, '/' + str(__name__ + "_" + self._name + "_lv").replace('.', '_'))
         self._namespace = '/' + str(__name__ + "_" + self._name + "_lv").replace('.', '_')
@@ -2121,6 +2462,19 @@ class ListView(Widget, Namespace):
             self._child_widgets = items
         else:
             self._child_widgets = []
+        for item in self._child_widgets:
+            item.set_parent(self)
+        self._click_callback = click_callback
+        if is_virtual is not None:
+            self._is_virtual = is_virtual
+        else:
+            self._is_virtual = False
+        if window_size is not None:
+            self._window_size = window_size
+        else:
+            self._window_size = 50
+        self._views = {}
+        self.rows = rows if rows is not None else []
 
     @property
     def namespace(self):
@@ -2130,6 +2484,114 @@ class ListView(Widget, Namespace):
     def namespace(self, val):
         self._namespace = val
 
+    @property
+    def rows(self):
+        """The rows of the listview in virtual mode"""
+        return self._rows
+
+    @rows.setter
+    def rows(self, val):
+        self._rows = [row if isinstance(row, ListRow) else ListRow(str(row)) for row in val]
+        self._views = {}
+        self._filter_index = None
+
+    def _build_filter_index(self):
+        # Sorted (word, row index) pairs of all the words of the row titles, so that the
+        # rows having a word starting with the search text are found by a binary search
+        index = []
+        for pos, row in enumerate(self._rows):
+            if not row.is_list_divider:
+                for word in set(str(row.title).lower().split()):
+                    index.append((word, pos))
+        index.sort()
+        self._filter_index = ([entry[0] for entry in index], [entry[1] for entry in index])
+
+    def filter_rows(self, text):
+        """Returns the indexes of the rows matching the search text. A row matches if each
+        word of the text is the start of a word of the row's title
+
+            Args:
+                text (string): The search text typed by the user
+        """
+        if self._filter_index is None:
+            self._build_filter_index()
+        words, positions = self._filter_index
+        result = None
+        for term in text.lower().split():
+            found = set()
+            pos = bisect_left(words, term)
+            while pos < words.__len__() and words[pos].startswith(term):
+                found.add(positions[pos])
+                pos += 1
+            result = found if result is None else result & found
+        if result is None:
+            return None
+        return sorted(result)
+
+    def _render_row(self, pos, row):
+        if row.is_list_divider:
+            return "<li data-role='list-divider' data-index='%d'>%s</li>" % (pos,
+                                                                               escape(str(row.title)))
+        content = "<li data-index='%d' " % pos
+        if row.icon is not None:
+            content += "data-icon='" + row.icon + "' "
+        content += "><a href='" + (row.href if row.href is not None else "#") + "'>"
+        if row.img_src is not None:
+            content += "<img src='" + row.img_src + "' /><h2>" + escape(str(row.title)) + "</h2>"
+        else:
+            content += escape(str(row.title))
+        if row.count is not None:
+            content += "<span class='ui-li-count'>" + str(row.count) + "</span>"
+        return content + "</a></li>"
+
+    def _render_rows(self, view, start, count):
+        content = []
+        if view is None:
+            for pos in range(start, min(start + count, self._rows.__len__())):
+                content.append(self._render_row(pos, self._rows[pos]))
+        else:
+            for pos in view[start:start + count]:
+                content.append(self._render_row(pos, self._rows[pos]))
+        return "\n".join(content)
+
+    def _send_rows(self, view, start, count, reset=False):
+        total = self._rows.__len__() if view is None else view.__len__()
+        start = max(0, min(start, total))
+        count = max(0, min(count, self._window_size, total - start))
+        emit('sync_rows_' + self._name, {'start': start, 'count': count, 'total': total,
+                                         'reset': reset,
+                                         'html': self._render_rows(view, start, count)},
+             namespace=self._namespace)
+
+    def on_fetch_rows(self, props):
+        self._send_rows(self._views.get(request.sid), int(props['start']), int(props['count']))
+
+    def on_filter_rows(self, props):
+        view = self.filter_rows(props['text'])
+        if view is None:
+            self._views.pop(request.sid, None)
+        else:
+            self._views[request.sid] = view
+        self._send_rows(view, 0, self._window_size, True)
+
+    def on_disconnect(self):
+        Widget.on_disconnect(self)
+        self._views.pop(request.sid, None)
+
+    def on_click(self, click_callback):
+        """Sets the callback called when an item or a row of the listview is clicked"""
+        self._click_callback = click_callback
+
+    def on_fire_item_click_event(self, props):
+        index = int(props['index'])
+        if not self._is_virtual and 0 <= index < self._child_widgets.__len__():
+            item = self._child_widgets[index]
+            if isinstance(item, ListItem) and item.click_callback is not None:
+                item.on_click(props)
+                return
+        if self._click_callback is not None:
+            self._run_callback(self._click_callback, self._name, props)
+
     @property
     def split_theme(self):
         return self._split_theme
@@ -2235,8 +2697,8 @@ class ListView(Widget, Namespace):
         self._is_split_button_enabled = val
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def _attach_script(self):
         script = """
@@ -2246,17 +2708,138 @@ class ListView(Widget, Namespace):
                             var socket = io('%s');
                             var selector = $('#%s');
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.listview("option", props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.listview("option", props['cmd'], props['value']);
+                                }
                                 selector.listview('refresh');
                             });
+
+                            // One handler for all the items, reports the index of the item
+                            selector.on('click', 'li[data-index]', function(){
+                                socket.emit('fire_item_click_event',
+                                            {'index': $(this).attr('data-index'),
+                                             'id': $(this).attr('id')});
+                            });
                         });
                     })(jQuery);
                 </script>
                 """ % (self._namespace, self._name, self._name)
         return script
 
+    def _attach_virtual_script(self):
+        script = """
+                <script>
+                    (function($, undefined){
+                        $(document).bind('pagecreate', function(e){
+                            var socket = io('%s');
+                            var selector = $('#%s');
+                            var spacer = $('#%s_spacer');
+                            var window_size = %d;
+                            var state = {'first': 0, 'last': selector.children('li').length,
+                                         'total': %d, 'loading': false};
+
+                            function fetch(start, count){
+                                state.loading = true;
+                                socket.emit('fetch_rows', {'start': start, 'count': count});
+                            }
+
+                            $(window).on('scroll', function(){
+                                if(state.loading || !selector.is(':visible')){
+                                    return;
+                                }
+                                var top = $(window).scrollTop();
+                                var bottom = top + $(window).height();
+                                if(bottom > selector.offset().top + selector.outerHeight() - 300
+                                   && state.last < state.total){
+                                    fetch(state.last, window_size);
+                                } else if(state.first > 0 && top < selector.offset().top + 300){
+                                    var start = Math.max(0, state.first - window_size);
+                                    fetch(start, state.first - start);
+                                }
+                            });
+
+                            $('#%s_filter').on('input', function(){
+                                var text = $(this).val();
+                                clearTimeout(state.filter_timer);
+                                state.filter_timer = setTimeout(function(){
+                                    state.loading = true;
+                                    socket.emit('filter_rows', {'text': text});
+                                }, 250);
+                            });
+
+                            socket.on('sync_rows_%s', function(data){
+                                state.loading = false;
+                                state.total = data.total;
+                                if(data.reset){
+                                    selector.empty();
+                                    spacer.height(0);
+                                    state.first = data.start;
+                                    state.last = data.start;
+                                }
+                                var items;
+                                var height = 0;
+                                if(data.start >= state.last){
+                                    selector.append(data.html);
+                                    state.last = data.start + data.count;
+                                    selector.listview('refresh');
+                                    // Keeps at most three windows of rows in the page
+                                    items = selector.children('li');
+                                    var excess = items.length - 3 * window_size;
+                                    if(excess > 0){
+                                        items.slice(0, excess).each(function(){
+                                            height += $(this).outerHeight(true);
+                                        }).remove();
+                                        spacer.height(spacer.height() + height);
+                                        state.first += excess;
+                                    }
+                                } else {
+                                    selector.prepend(data.html);
+                                    state.first = data.start;
+                                    selector.listview('refresh');
+                                    selector.children('li').slice(0, data.count).each(function(){
+                                        height += $(this).outerHeight(true);
+                                    });
+                                    spacer.height(Math.max(0, spacer.height() - height));
+                                    items = selector.children('li');
+                                    var excess = items.length - 3 * window_size;
+                                    if(excess > 0){
+                                        items.slice(items.length - excess).remove();
+                                        state.last -= excess;
+                                    }
+                                }
+                            });
+                        });
+                    })(jQuery);
+                </script>
+                """ % (self._namespace, self._name, self._name, self._window_size,
+                       self._rows.__len__(), self._name, self._name)
+        return script
+
+    def _render_virtual(self):
+        content = ""
+        if self._is_filterable or self._is_filter_reveal:
+            content += "<input type='search' id='" + self._name + "_filter' "
+            content += "data-type='search' placeholder='Search Items...' />\n"
+        content += "<div id='" + self._name + "_spacer' style='height: 0px;'></div>\n"
+        content += "<ol " if self._is_ordered else "<ul "
+        content += "data-role='listview' id='" + self._name + "' "
+        content += "style='margin-bottom: 10px;' "
+        if self._is_inset:
+            content += "data-inset='true' "
+        if self._is_split_button_enabled:
+            content += "data-split-icon='gear' data-split-theme='a' "
+        content += ">\n"
+        content += self._render_rows(None, 0, self._window_size) + "\n"
+        content += "</ol>\n" if self._is_ordered else "</ul>\n"
+        content += self._attach_script() + self._attach_virtual_script()
+        return content
+
     def render(self):
+        if self._is_virtual:
+            return self._render_virtual()
         content = ""
         if not self._is_ordered:
             content += "<ul data-role='listview' "
@@ -2275,52 +2858,44 @@ class ListView(Widget, Namespace):
         if self._is_split_button_enabled:
             content += "data-split-icon='gear' data-split-theme='a' "
         content += ">\n"
-        for widget in self._child_widgets:
-            content += widget.render() + "\n"
+        for index, widget in enumerate(self._child_widgets):
+            if isinstance(widget, ListItem):
+                content += widget.render(index) + "\n"
+            else:
+                content += widget.render() + "\n"
         if not self._is_ordered:
             content += "</ul>\n"
         else:
-            content += "</ol>\n" + self._attach_script()
+            content += "</ol>\n"
+        content += self._attach_script()
         return content
 
 
-class ListItem(Widget, Namespace):
+class ListItem:
     """An listview item which can be rendered as readonly, link or complex UI using the options
-    provided by this class
+    provided by this class. An item is a light weight record rather than a widget: it has no
+    socket namespace of its own, the click on an item is reported to its `ListView` which
+    calls the item's click callback
     """
 
-    _namespace = None
-    _socket_io = None
-    _title = None
-    _content = None
-    _is_read_only = None
-    _is_linked = None
-    _is_count_bubble_enabled = None
-    _is_thumbnail_enabled = None
-    _icon = None
-    _is_list_divider = None
-    _count = None
-    _img_src = None
-    _click_callback = None
-    _is_active = None
-    _href = None
-    _data_rel = None
+    __slots__ = ('_name', '_title', '_content', '_is_read_only', '_is_linked',
+                 '_is_count_bubble_enabled', '_is_thumbnail_enabled', '_icon', '_is_list_divider',
+                 '_count', '_img_src', '_click_callback', '_is_active', '_href', '_data_rel',
+                 '_parent_widget')
 
-    def __init__(self, name, title, socket_io, content=None, is_read_only=None, is_linked=None,
+    def __init__(self, name, title, socket_io=None, content=None, is_read_only=None, is_linked=None,
                  is_count_bubble_enabled=None, is_thumbnail_enabled=None, icon=None,
                  is_list_divider=None, count=None, img_src=None, click_callback=None, is_active=None,
                  href=None, data_rel=None):
-        Widget.__init__(self, name)
-        Namespace.__init__(self, '/' + str(__name__ + "_" + self._name + "_li").replace('.', '_'))
-        self._namespace = '/' + str(__name__ + "_" + self._name + "_li").replace('.', '_')
+        """
+            Args:
+                socket_io (SocketIO): Not used anymore, the events of the items are handled
+                                    by the namespace of the `ListView`
+        """
+        self._name = name
         self._title = title
         self._content = content
-        self._socket_io = socket_io
-        self._socket_io.on_namespace(self)
-        if is_linked is not None:
-            self._is_linked = is_linked
-        else:
-            self._is_linked = True
+        self._is_linked = is_linked if is_linked is not None else True
         self._is_count_bubble_enabled = is_count_bubble_enabled
         self._is_thumbnail_enabled = is_thumbnail_enabled
         self._is_read_only = is_read_only
@@ -2330,19 +2905,24 @@ class ListItem(Widget, Namespace):
         self._img_src = img_src
         self._click_callback = click_callback
         self._is_active = is_active
-        if href is not None:
-            self._href = href
-        else:
-            self._href = "#"
+        self._href = href if href is not None else "#"
         self._data_rel = data_rel
+        self._parent_widget = None
 
-    @property
-    def namespace(self):
-        return self._namespace
+    def get_name(self):
+        """Returns the name of this item"""
+        return self._name
 
-    @namespace.setter
-    def namespace(self, val):
-        self._namespace = val
+    def set_root_widget(self, root_widget):
+        pass
+
+    def set_parent(self, widget):
+        """Sets the `ListView` the item belongs to"""
+        self._parent_widget = widget
+
+    def get_parent(self):
+        """Returns the `ListView` the item belongs to"""
+        return self._parent_widget
 
     @property
     def title(self):
@@ -2424,42 +3004,45 @@ class ListItem(Widget, Namespace):
     def img_src(self, val):
         self._img_src = val
 
-    def on_fire_click_event(self, props):  # noqa
-        if self._click_callback is not None:
-            self._click_callback(self._name, props)
+    @property
+    def click_callback(self):
+        return self._click_callback
 
-    def _attach_script(self):
-        script = """
-                <script>
-                    (function($, undefined){
-                        $(document).bind('pagecreate', function(e){
-                            var socket = io('%s');
-                            var selector = $('#%s');
+    @click_callback.setter
+    def click_callback(self, val):
+        self._click_callback = val
 
-                            selector.bind('click', function(){
-                                props = {
-                                        };
-                                socket.emit("fire_click_event", props);
-                            });
-                        });
-                    })(jQuery);
-                </script>
-                """ % (self._namespace, self._name)
-        return script
+    def on_click(self, props):
+        """Calls the click callback of the item, invoked by the `ListView` with the event
+        properties which include the index of the item
+        """
+        if self._click_callback is not None:
+            if self._parent_widget is not None:
+                self._parent_widget._run_callback(self._click_callback, self._name, props)
+            else:
+                self._click_callback(self._name, props)
 
-    def render(self):
+    def render(self, index=None):
+        """Renders the item
+
+            Args:
+                index (int): Position of the item within its listview, rendered as the
+                            data-index attribute which is reported back on a click
+        """
         content = ""
+        data_index = "data-index='" + str(index) + "' " if index is not None else ""
         if self._is_list_divider is not None and self._is_list_divider:
-            return "<li data-role='list-divider' id='" + self._name + "'>" + self._title + "</li>"
+            return "<li data-role='list-divider' " + data_index + "id='" + self._name + "'>" + \
+                self._title + "</li>"
         if self._is_read_only is not None and self._is_read_only:
-                return "<li id='" + self._name + "'>" + self._title + "</li>"
+                return "<li " + data_index + "id='" + self._name + "'>" + self._title + "</li>"
         else:
             if self._is_linked is not None and self._is_linked:
                 if self._icon is not None:
                     content += "<li data-icon='" + self._icon + "' "
                 else:
                     content += "<li "
-                content += "id='" + self._name + "'>"
+                content += data_index + "id='" + self._name + "'>"
                 content += "<a href='" + self._href + "' "
                 if self._data_rel is not None:
                     content += "data-rel='" + self._data_rel + "' "
@@ -2472,8 +3055,8 @@ class ListItem(Widget, Namespace):
                 else:
                     content += self._title
                 if self._is_count_bubble_enabled is not None and self._is_count_bubble_enabled:
-                    content += "<span class='ui-li-count>" + self._count + "</span>"
-                content += "</a></li>\n" + self._attach_script()
+                    content += "<span class='ui-li-count'>" + str(self._count) + "</span>"
+                content += "</a></li>\n"
                 return content
         return self._content
 
@@ -2575,11 +3158,11 @@ class NavBar(Widget, Namespace):
             self._icon_pos = iconpos
         clicked_item = props['clicked_item']
         if self._click_callback is not None:
-            self._click_callback(clicked_item, props)
+            self._run_callback(self._click_callback, clicked_item, props)
 
     def _sync_properties(self, cmd, value):
-        emit("sync_properties_" + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit("sync_properties_" + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def _attach_script(self):
         script = """
@@ -2589,8 +3172,12 @@ class NavBar(Widget, Namespace):
                             var socket = io('%s');
                             var selector = $('#%s');
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.navbar("option", props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.navbar("option", props['cmd'], props['value']);
+                                }
                                 selector.navbar('refresh');
                             });
 
@@ -2787,15 +3374,15 @@ class Panel(Widget, Namespace):
         if theme is not None:
             self._theme = theme
         if self._before_close_callback is not None:
-            self._before_close_callback(self._name, props)
+            self._run_callback(self._before_close_callback, self._name, props)
 
     def on_fire_before_open_event(self, props):
         if self._before_open_callback is not None:
-            self._before_open_callback(self._name, props)
+            self._run_callback(self._before_open_callback, self._name, props)
 
     def _sync_properties(self, cmd, value):
-        emit("sync_properties_" + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit("sync_properties_" + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def _attach_script(self):
         script = """
@@ -2805,8 +3392,12 @@ class Panel(Widget, Namespace):
                             var socket = io('%s');
                             var selector = $('#%s');
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.panel("option", props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.panel("option", props['cmd'], props['value']);
+                                }
                                 selector.panel('refresh');
                             });
 
@@ -3079,7 +3670,7 @@ class Popup(Widget, Namespace):
         if transition is not None:
             self._transition = transition
         if self._after_close_callback is not None:
-            self._after_close_callback(self._name, props)
+            self._run_callback(self._after_close_callback, self._name, props)
 
     def on_fire_after_open_event(self, props):
         theme = props['theme']
@@ -3113,11 +3704,11 @@ class Popup(Widget, Namespace):
         if transition is not None:
             self._transition = transition
         if self._after_open_callback is not None:
-            self._after_open_callback(self._name, props)
+            self._run_callback(self._after_open_callback, self._name, props)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def _attach_script(self):
         script = """
@@ -3127,8 +3718,12 @@ class Popup(Widget, Namespace):
                             var socket = io('%s');
                             var selector = $('#%s');
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.popup('option', props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.popup('option', props['cmd'], props['value']);
+                                }
                             });
 
                             selector.on('popupafterclose', function(){
@@ -3311,11 +3906,21 @@ class RangeSlider(Widget, Namespace):
     _mini = None
     _disabled = None
     _value_changed_callback = None
+    _rate_limit = None
 
     def __init__(self, name, socket_io, title1=None, title2=None, value1=None, value2=None,
                  value1min=None, value1max=None, value2min=None, value2max=None, step1=None,
                  step2=None, highlight=None, theme=None, track_theme=None, mini=None,
-                 disabled=None, value_changed_callback=None):
+                 disabled=None, value_changed_callback=None, rate_limit=None, event_window=None):
+        """
+            Args:
+                rate_limit (RateLimit): Limits the rate of the change events sent by the client while
+                                       the user drags the handles, see `RateLimit.throttle` and
+                                       `RateLimit.debounce`
+                event_window (float): Seconds in which the change events are coalesced at the
+                                      server, the callback is called once per window with the
+                                      latest value
+        """
         Widget.__init__(self, name)
         Namespace.__init__(self, '/' + str(__name__ + '_' + self._name + '_rs').replace('.', '_'))
         self._namespace = '/' + str(__name__ + '_' + self._name + '_rs').replace('.', '_')
@@ -3361,6 +3966,17 @@ class RangeSlider(Widget, Namespace):
         self._mini = mini
         self._disabled = disabled
         self._value_changed_callback = value_changed_callback
+        self._rate_limit = rate_limit
+        if event_window is not None:
+            self.set_event_window(event_window)
+
+    @property
+    def rate_limit(self):
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, val):
+        self._rate_limit = val
 
     @property
     def disabled(self):
@@ -3426,11 +4042,11 @@ class RangeSlider(Widget, Namespace):
         self._sync_properties('value2', val)
 
     def on_value_changed_event(self, callback):
-        self._value_changed_callback = callable
+        self._value_changed_callback = callback
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def on_fire_change_event(self, props):
         dsbld = props['disabled']
@@ -3455,30 +4071,35 @@ class RangeSlider(Widget, Namespace):
         if val2 is not None:
             self._value2 = val2
         if self._value_changed_callback is not None:
-            self._value_changed_callback(self._name, props)
+            self._run_coalesced(self._value_changed_callback, self._name, props)
 
     def _attach_script(self):
         script = """
                 <script>
                     (function($, undefined){
+                        %s
                         $(document).bind('pagecreate', function(e){
                             var socket = io('%s');
                             var selector = $('#%s');
                             var input1 = $('#%s1');
                             var input2 = $('#%s2');
 
-                            socket.on('sync_properties_%s', function(props){
-                                if(props['cmd'] == 'value1'){
-                                    input1.val(props['value']);
-                                }else if(props['cmd'] == 'value2'){
-                                    input2.val(props['value']);
-                                } else {
-                                    selector.rangeslider("option", props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    if(props['cmd'] == 'value1'){
+                                        input1.val(props['value']);
+                                    }else if(props['cmd'] == 'value2'){
+                                        input2.val(props['value']);
+                                    } else {
+                                        selector.rangeslider("option", props['cmd'], props['value']);
+                                    }
                                 }
                                 selector.rangeslider('refresh');
                             });
 
-                            selector.bind('change', function(e){
+                            var fire_change_event = function(e){
                                 var props = {
                                             'disabled': selector.rangeslider('option', 'disabled'),
                                             'highlight': selector.rangeslider('option', 'highlight'),
@@ -3489,11 +4110,13 @@ class RangeSlider(Widget, Namespace):
                                             'value2': input2.val()
                                 };
                                 socket.emit('fire_change_event', props);
-                            });
+                            };
+                            selector.bind('change', %s);
                         });
                     })(jQuery);
                 </script>
-                """ % (self._namespace, self._name, self._name, self._name, self._name)
+                """ % (rate_limit_script(self._rate_limit), self._namespace, self._name, self._name,
+                       self._name, self._name, rate_limited('fire_change_event', self._rate_limit))
         return script
 
     def render(self):
@@ -3528,6 +4151,120 @@ class RangeSlider(Widget, Namespace):
         return content
 
 
+class SelectOptionStore:
+    """A compact store for a large number of options of a `SelectMenu`. The options are kept
+    column wise (values, titles, disabled flags and option groups) instead of a dict per option,
+    and are searched by their titles for the subset to be sent to the client
+    """
+
+    _values = None
+    _titles = None
+    _keys = None
+    _disabled = None
+    _groups = None
+    _group_names = None
+    _group_ids = None
+    _positions = None
+    _last_text = None
+    _last_hits = None
+
+    def __init__(self, options=None):
+        """Below are the parameters of this class
+
+            Args:
+                options (list, optional): A list of option dicts in the format used by
+                                          `SelectMenu`
+        """
+        self._values = []
+        self._titles = []
+        self._keys = []
+        self._disabled = bytearray()
+        self._groups = []
+        self._group_names = []
+        self._group_ids = {}
+        self._positions = {}
+        if options is not None:
+            for option in options:
+                self.add(option['option_value'], option.get('option_title'),
+                         option.get('disabled', False), option.get('opt_group'))
+
+    def __len__(self):
+        return self._values.__len__()
+
+    def _invalidate(self):
+        self._last_text = None
+        self._last_hits = None
+
+    def add(self, value, title=None, disabled=False, opt_group=None):
+        """Adds an option to the store, an option with the same value is replaced"""
+        if value in self._positions:
+            self.remove(value)
+        if title is None:
+            title = value
+        group = self._group_ids.get(opt_group)
+        if group is None:
+            group = self._group_names.__len__()
+            self._group_ids[opt_group] = group
+            self._group_names.append(opt_group)
+        self._positions[value] = self._values.__len__()
+        self._values.append(value)
+        self._titles.append(title)
+        self._keys.append(str(title).lower())
+        self._disabled.append(1 if disabled else 0)
+        self._groups.append(group)
+        self._invalidate()
+
+    def remove(self, value):
+        """Removes the option having the given value from the store"""
+        pos = self._positions.pop(value)
+        del self._values[pos]
+        del self._titles[pos]
+        del self._keys[pos]
+        del self._disabled[pos]
+        del self._groups[pos]
+        for index in range(pos, self._values.__len__()):
+            self._positions[self._values[index]] = index
+        self._invalidate()
+
+    def position(self, value):
+        """The position of the option in the store, None if the option is not available"""
+        return self._positions.get(value)
+
+    def get_option(self, pos):
+        """Returns the option at the given position as a tuple of value, title, disabled
+        flag and option group"""
+        return (self._values[pos], self._titles[pos], bool(self._disabled[pos]),
+                self._group_names[self._groups[pos]])
+
+    def sort_positions(self, positions):
+        """Sorts the positions of options in place by their option groups and positions"""
+        groups = self._groups
+        positions.sort(key=lambda pos: (groups[pos], pos))
+
+    def filter(self, text):
+        """Returns the positions of the options having the text in their titles, ordered by
+        their option groups. The result of the last search is narrowed down when the text
+        is extended, e.g. while the user is typing in the search box
+
+            Args:
+                text (string): The text to be searched, case insensitive
+        """
+        text = (text or "").lower()
+        if self._last_text is not None and text.startswith(self._last_text):
+            candidates = self._last_hits
+        else:
+            candidates = range(self._keys.__len__())
+        keys = self._keys
+        if text == "":
+            hits = list(candidates)
+        else:
+            hits = [pos for pos in candidates if text in keys[pos]]
+        hits.sort(key=self._groups.__getitem__)
+        self._last_text = text
+        self._last_hits = hits
+        return hits
+
+
 class SelectMenu(Widget, Namespace):
     """The select menu is based on a native select element, which is hidden from view and
     replaced with a custom-styled select button that matches the look and feel of the jQuery
@@ -3559,11 +4296,28 @@ class SelectMenu(Widget, Namespace):
     _multiple = None
     _click_callback = None
     _selected_value = None
+    _store = None
+    _page_size = None
+    _selected = None
+    _change_callback = None
 
     def __init__(self, name, socket_io, close_text=None, corners=None, disabled=None, divider_theme=None,
                  hide_placeholder_menuitems=None, icon=None, icon_pos=None, icon_shadow=None, inline=None,
                  mini=None, native_menu=None, overlay_theme=None, shadow=None, theme=None, options=None,
-                 multiple=None, click_callback=None, selected_value=None):
+                 multiple=None, click_callback=None, selected_value=None, large_options=None,
+                 page_size=None, change_callback=None):
+        """
+            Args:
+                large_options (boolean): Keeps the options in a `SelectOptionStore` at the server
+                                        and renders only a page of them, filtered by the text
+                                        typed by the user in a search box. Meant for menus having
+                                        thousands of options
+                page_size (int): The number of options sent to the client at a time in the
+                                large options mode, 50 by default
+                change_callback (callable): Called with the name of the widget and the list of
+                                           selected values once the selection is changed in the
+                                           large options mode
+        """
         Widget.__init__(self, name)
         Namespace.__init__(self, '/' + str(__name__ + "_" + self._name + "_sel").replace('.', '_'))
         self._namespace = '/' + str(__name__ + "_" + self._name + "_sel").replace('.', '_')
@@ -3590,6 +4344,46 @@ class SelectMenu(Widget, Namespace):
             self._options = []
         self._click_callback = click_callback
         self._selected_value = selected_value
+        if large_options:
+            self._store = SelectOptionStore()
+            self._selected = set()
+            options = self._options
+            self._options = []
+            for option in options:
+                self.add_option(option['option_value'], option.get('option_title'),
+                                option.get('selected', False), option.get('disabled', False),
+                                option.get('opt_group'))
+            if selected_value is not None:
+                self._selected.add(selected_value)
+        if page_size is not None:
+            self._page_size = page_size
+        else:
+            self._page_size = 50
+        self._change_callback = change_callback
+
+    @property
+    def option_store(self):
+        """The store of the options in the large options mode, None otherwise"""
+        return self._store
+
+    @property
+    def selected_values(self):
+        """The values of all the selected options"""
+        if self._store is None:
+            return [opt['option_value'] for opt in self._options if opt['selected']]
+        return sorted(self._selected, key=self._store.position)
+
+    @selected_values.setter
+    def selected_values(self, val):
+        val = list(val)
+        if self._store is None:
+            selected = set(val)
+            for opt in self._options:
+                opt['selected'] = opt['option_value'] in selected
+        else:
+            self._selected = set(val)
+        self._selected_value = val[0] if val.__len__() > 0 else None
+        self._sync_properties('selectedValues', val)
 
     @property
     def selected_value(self):
@@ -3598,7 +4392,10 @@ class SelectMenu(Widget, Namespace):
     @selected_value.setter
     def selected_value(self, val):
         self._selected_value = val
-        self._sync_properties('selectedValue', val)
+        if self._store is not None:
+            self.selected_values = [val] if val is not None else []
+        else:
+            self._sync_properties('selectedValue', val)
 
     @property
     def close_text(self):
@@ -3735,8 +4532,8 @@ class SelectMenu(Widget, Namespace):
         self._multiple = val
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def add_option(self, option_value, option_title=None, selected=False, disabled=False, opt_group=None):
         option = {}
@@ -3748,10 +4545,142 @@ class SelectMenu(Widget, Namespace):
         option['selected'] = selected
         option['disabled'] = disabled
         option['opt_group'] = opt_group
-        self._options.append(option)
+        if self._store is not None:
+            self._store.add(option_value, option_title, disabled, opt_group)
+            if selected:
+                self._selected.add(option_value)
+        else:
+            self._options.append(option)
 
     def remove(self, option):
-        self._options.remove(option)
+        if self._store is not None:
+            value = option['option_value'] if isinstance(option, dict) else option
+            self._store.remove(value)
+            self._selected.discard(value)
+        else:
+            self._options.remove(option)
+
+    def _render_options(self, positions):
+        # Renders the options at the given positions of the store, grouped under their optgroups
+        options = [self._store.get_option(pos) for pos in positions]
+        values = escape_column([opt[0] for opt in options])
+        titles = escape_column([opt[1] for opt in options])
+        content = ""
+        group = None
+        for num, (value, title, disabled, opt_group) in enumerate(options):
+            if opt_group != group:
+                if group is not None:
+                    content += "</optgroup>\n"
+                if opt_group is not None:
+                    content += "<optgroup label='" + escape(str(opt_group)) + "'>\n"
+                group = opt_group
+            content += "<option value='" + values[num] + "' "
+            if value in self._selected:
+                content += "selected='selected' "
+            if disabled:
+                content += "disabled='disabled' "
+            content += ">" + titles[num] + "</option>\n"
+        if group is not None:
+            content += "</optgroup>\n"
+        return content
+
+    def _get_page(self, text, start):
+        hits = self._store.filter(text)
+        page = hits[start:start + self._page_size]
+        if start == 0:
+            # The selected options are always available in the select element
+            shown = set(page)
+            positions = [self._store.position(value) for value in self._selected]
+            positions = page + [pos for pos in positions if pos is not None and pos not in shown]
+            self._store.sort_positions(positions)
+        else:
+            # The selected options are already added to the select element with the first page
+            positions = [pos for pos in page if self._store.get_option(pos)[0] not in self._selected]
+        return positions, len(page), len(hits)
+
+    def on_filter_options(self, props):
+        text = props.get('text', "")
+        start = int(props.get('start', 0))
+        positions, count, total = self._get_page(text, start)
+        emit('sync_options_' + self._name,
+             {'start': start, 'count': count, 'total': total, 'reset': start == 0,
+              'html': self._render_options(positions)},
+             namespace=self._namespace)
+
+    def on_select_options(self, props):
+        selected = props.get('selected', [])
+        if self._multiple:
+            # Only the options available on the client can be changed by the user
+            self._selected.difference_update(props.get('shown', []))
+            self._selected.update(selected)
+        else:
+            self._selected = set(selected[:1])
+        self._selected_value = selected[0] if selected.__len__() > 0 else None
+        if self._change_callback is not None:
+            self._run_callback(self._change_callback, self._name, self.selected_values)
+
+    def _attach_options_script(self, loaded, total):
+        script = """
+                    <script>
+                    (function($, undefined){
+                        $(document).bind('pagecreate', function(e){
+                            var socket = io('%s');
+                            var selector = $('#%s');
+                            var search = $('#%s_search');
+                            var more = $('#%s_more');
+                            var state = {'loaded': %d, 'total': %d, 'timer': null};
+
+                            function fetch_options(start){
+                                socket.emit('filter_options', {'text': search.val(), 'start': start});
+                            }
+
+                            more.toggle(state.loaded < state.total);
+                            search.bind('input', function(){
+                                clearTimeout(state.timer);
+                                state.timer = setTimeout(function(){ fetch_options(0); }, 250);
+                            });
+                            more.bind('click', function(e){
+                                e.preventDefault();
+                                fetch_options(state.loaded);
+                            });
+
+                            selector.bind('change', function(){
+                                var shown = selector.find('option').map(function(){
+                                    return this.value;
+                                }).get();
+                                var selected = selector.find('option:selected').map(function(){
+                                    return this.value;
+                                }).get();
+                                socket.emit('select_options', {'shown': shown, 'selected': selected});
+                            });
+
+                            socket.on('sync_options_%s', function(data){
+                                if(data.reset){
+                                    selector.html(data.html);
+                                } else {
+                                    selector.append(data.html);
+                                }
+                                state.loaded = data.start + data.count;
+                                state.total = data.total;
+                                more.toggle(state.loaded < state.total);
+                                selector.selectmenu('refresh', true);
+                            });
+
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    if(props['cmd'] == 'selectedValues'){
+                                        fetch_options(0);
+                                    }
+                                }
+                            });
+                        });
+                    })(jQuery);
+                    </script>
+                """ % (self._namespace, self._name, self._name, self._name, loaded, total,
+                       self._name, self._name)
+        return script
 
     def on_fire_click_event(self, props):  # noqa
         close_text = props['closeText']
@@ -3800,7 +4729,7 @@ class SelectMenu(Widget, Namespace):
         if selected_val is not None:
             self._selected_value = selected_val
         if self._click_callback is not None:
-            self._click_callback(self._name, props)
+            self._run_callback(self._click_callback, self._name, props)
 
     def _attach_script(self):
         script = """
@@ -3832,11 +4761,15 @@ class SelectMenu(Widget, Namespace):
                                 socket.emit('fire_click_event', props);
                             });
 
-                            socket.on('sync_properties_%s', function(props){
-                                if(props['cmd'] == 'selectedValue'){
-                                    selector.val(props['value']);
-                                } else {
-                                    selector.selectmenu('option', props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    if(props['cmd'] == 'selectedValue' || props['cmd'] == 'selectedValues'){
+                                        selector.val(props['value']);
+                                    } else {
+                                        selector.selectmenu('option', props['cmd'], props['value']);
+                                    }
                                 }
                                 selector.selectmenu('refresh');
                             });
@@ -3848,6 +4781,8 @@ class SelectMenu(Widget, Namespace):
 
     def render(self):  # noqa
         content = ""
+        if self._store is not None:
+            content += "<input type='search' id='" + self._name + "_search' data-type='search' />\n"
         content += "<select id='" + self._name + "' "
         if self._mini is not None:
             content += "data-mini='" + json.dumps(self._mini) + "' "
@@ -3881,6 +4816,13 @@ class SelectMenu(Widget, Namespace):
         if self._theme is not None:
             content += "data-theme='" + self._theme + "' "
         content += ">"
+        if self._store is not None:
+            positions, count, total = self._get_page("", 0)
+            content += self._render_options(positions)
+            content += "</select>\n"
+            content += "<a href='#' id='" + self._name + "_more' class='ui-btn ui-mini'>More</a>\n"
+            content += self._attach_script() + self._attach_options_script(count, total)
+            return content
         opt_groups = {}
         for option in self._options:
             if option['opt_group'] is None:
@@ -3940,10 +4882,20 @@ class Slider(Widget, Namespace):
     _mini = None
     _disabled = None
     _value_changed_callback = None
+    _rate_limit = None
 
     def __init__(self, name, socket_io, title=None, value=None, valuemin=None, valuemax=None,
                  step=None, highlight=None, theme=None, track_theme=None, mini=None,
-                 disabled=None, value_changed_callback=None):
+                 disabled=None, value_changed_callback=None, rate_limit=None, event_window=None):
+        """
+            Args:
+                rate_limit (RateLimit): Limits the rate of the change events sent by the client while
+                                       the user drags the slider, see `RateLimit.throttle` and
+                                       `RateLimit.debounce`
+                event_window (float): Seconds in which the change events are coalesced at the
+                                      server, the callback is called once per window with the
+                                      latest value
+        """
         Widget.__init__(self, name)
         Namespace.__init__(self, '/' + str(__name__ + '_' + self._name + '_slider').replace('.', '_'))
         self._namespace = '/' + str(__name__ + '_' + self._name + '_slider').replace('.', '_')
@@ -3972,6 +4924,17 @@ class Slider(Widget, Namespace):
         self._mini = mini
         self._disabled = disabled
         self._value_changed_callback = value_changed_callback
+        self._rate_limit = rate_limit
+        if event_window is not None:
+            self.set_event_window(event_window)
+
+    @property
+    def rate_limit(self):
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, val):
+        self._rate_limit = val
 
     @property
     def disabled(self):
@@ -4028,11 +4991,11 @@ class Slider(Widget, Namespace):
         self._sync_properties('value', val)
 
     def on_value_changed_event(self, callback):
-        self._value_changed_callback = callable
+        self._value_changed_callback = callback
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def on_fire_change_event(self, props):
         dsbld = props['disabled']
@@ -4054,26 +5017,31 @@ class Slider(Widget, Namespace):
         if val is not None:
             self._value = val
         if self._value_changed_callback is not None:
-            self._value_changed_callback(self._name, props)
+            self._run_coalesced(self._value_changed_callback, self._name, props)
 
     def _attach_script(self):
         script = """
                 <script>
                     (function($, undefined){
+                        %s
                         $(document).bind('pagecreate', function(e){
                             var socket = io('%s');
                             var selector = $('#%s');
 
-                            socket.on('sync_properties_%s', function(props){
-                                if(props['cmd'] == 'value'){
-                                    selector.val(props['value']);
-                                } else {
-                                    selector.slider('option', props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    if(props['cmd'] == 'value'){
+                                        selector.val(props['value']);
+                                    } else {
+                                        selector.slider('option', props['cmd'], props['value']);
+                                    }
                                 }
                                 selector.slider('refresh');
                             });
 
-                            selector.bind('change', function(e){
+                            var fire_change_event = function(e){
                                 var props = {
                                             'disabled': selector.slider('option', 'disabled'),
                                             'highlight': selector.slider('option', 'highlight'),
@@ -4083,11 +5051,13 @@ class Slider(Widget, Namespace):
                                             'value': selector.val()
                                 };
                                 socket.emit('fire_change_event', props);
-                            });
+                            };
+                            selector.bind('change', %s);
                         });
                     })(jQuery);
                 </script>
-                """ % (self._namespace, self._name, self._name)
+                """ % (rate_limit_script(self._rate_limit), self._namespace, self._name, self._name,
+                       rate_limited('fire_change_event', self._rate_limit))
         return script
 
     def render(self):
@@ -4143,6 +5113,9 @@ class Table(Widget, Namespace):
     _alternate_rows = None
     _disabled = None
     _click_callback = None
+    _page_size = None
+    _sort_cache = None
+    _formatter = None
     _default_css = """
                     <style>
                     /* Show priority 1 at 320px (20em x 16px) */
@@ -4182,7 +5155,17 @@ class Table(Widget, Namespace):
     def __init__(self, name, socket_io, mode=None, column_headers=None, row_headers=None, data=None,
                  row_rendering_option=None, display_row_number=None, column_btn_text=None,
                  column_btn_theme=None, column_popup_theme=None, make_reponsive=None, alternate_rows=None,
-                 disabled=None, css=None, click_callback=None):
+                 disabled=None, css=None, click_callback=None, page_size=None):
+        """
+            Args:
+                data (sequence): Rows of the table as a sequence of sequences, e.g. a list of
+                                tuples or a 2D NumPy array. The rows are read by index and
+                                are not copied
+                page_size (int): If provided, only the first page of rows is rendered with
+                                the table, further pages are streamed over the socket on
+                                scroll or on "more" and the rows can be sorted on the server
+                                by clicking on a column header
+        """
         Widget.__init__(self, name)
         Namespace.__init__(self, '/' + str(__name__ + '_' + name + '_table').replace('.', '_'))
         self._namespace = '/' + str(__name__ + '_' + name + '_table').replace('.', '_')
@@ -4224,6 +5207,9 @@ class Table(Widget, Namespace):
         if css is not None:
             self._default_css = css
         self._click_callback = click_callback
+        self._page_size = page_size
+        self._sort_cache = {}
+        self._formatter = TabularFormatter(self._row_rendering_option != RowRenderingOptions.HTML)
 
     @property
     def namespace(self):
@@ -4264,6 +5250,16 @@ class Table(Widget, Namespace):
     @data.setter
     def data(self, val):
         self._data = val
+        self._sort_cache = {}
+        self._formatter.clear()
+
+    @property
+    def page_size(self):
+        return self._page_size
+
+    @page_size.setter
+    def page_size(self, val):
+        self._page_size = val
 
     @property
     def row_rendering_option(self):
@@ -4272,6 +5268,7 @@ class Table(Widget, Namespace):
     @row_rendering_option.setter
     def row_rendering_option(self, val):
         self._row_rendering_option = val
+        self._formatter.escape = val != RowRenderingOptions.HTML
 
     @property
     def display_row_number(self):
@@ -4353,12 +5350,122 @@ class Table(Widget, Namespace):
         if popup_theme is not None:
             self._column_popup_theme = popup_theme
         if self._click_callback is not None:
-            self._click_callback(self._name, props)
+            self._run_callback(self._click_callback, self._name, props)
 
     def _sync_properties(self, cmd, val):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': val},
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': val},
+                   namespace=self._namespace, key=cmd)
+
+    def _get_sort_permutation(self, column):
+        # The ascending order of the rows by the column, cached until the data changes
+        perm = self._sort_cache.get(column)
+        if perm is None:
+            data = self._data
+            try:
+                perm = sorted(range(len(data)), key=lambda pos: data[pos][column])
+            except TypeError:
+                # Mixed types which can't be compared, e.g. None and numbers
+                perm = sorted(range(len(data)), key=lambda pos: str(data[pos][column]))
+            self._sort_cache[column] = perm
+        return perm
+
+    def _get_row_positions(self, start, stop, column=None, desc=False):
+        if column is None:
+            return range(start, stop)
+        perm = self._get_sort_permutation(column)
+        if desc:
+            last = len(perm) - 1
+            return [perm[last - pos] for pos in range(start, stop)]
+        return perm[start:stop]
+
+    def _render_rows(self, start, stop, column=None, desc=False):
+        positions = self._get_row_positions(start, stop, column, desc)
+        # The cells of the page are formatted and escaped column by column
+        cells = self._formatter.format_rows([self._data[pos] for pos in positions])
+        rows = []
+        for num, pos in enumerate(positions):
+            row_content = ""
+            if self._display_row_number:
+                row_content = "<th class='label'>" + str(start + num + 1) + "</th>"
+            if self._row_headers is not None and len(self._row_headers) > 0:
+                row_content = row_content + "<th class='label'>" + self._row_headers[pos] + "</th>"
+            if len(cells[num]) > 0:
+                row_content += "<td>" + "</td><td>".join(cells[num]) + "</td>"
+            rows.append("<tr>" + row_content + "</tr>\n")
+        return "".join(rows)
+
+    def on_fetch_rows(self, props):
+        total = len(self._data) if self._data is not None else 0
+        start = max(0, min(int(props['start']), total))
+        stop = min(start + self._page_size, total)
+        column = props.get('column')
+        column = int(column) if column is not None else None
+        emit('sync_rows_' + self._name,
+             {'start': start, 'count': stop - start, 'total': total,
+              'reset': props.get('reset', False),
+              'html': self._render_rows(start, stop, column, props.get('desc', False))},
              namespace=self._namespace)
 
+    def _attach_paging_script(self):
+        script = """
+                <script>
+                (function($, undefined){
+                    $(document).bind('pagecreate', function(){
+                        var socket = io('%s');
+                        var selector = $('#%s');
+                        var more = $('#%s_more');
+                        var state = {'loaded': selector.find('tbody tr').length, 'total': %d,
+                                     'column': null, 'desc': false, 'loading': false};
+
+                        function fetch_rows(start, reset){
+                            state.loading = true;
+                            socket.emit('fetch_rows', {'start': start, 'column': state.column,
+                                                       'desc': state.desc, 'reset': reset});
+                        }
+
+                        more.toggle(state.loaded < state.total);
+                        more.bind('click', function(){
+                            if(!state.loading && state.loaded < state.total){
+                                fetch_rows(state.loaded, false);
+                            }
+                        });
+
+                        $(window).on('scroll', function(){
+                            if(state.loading || state.loaded >= state.total || !selector.is(':visible')){
+                                return;
+                            }
+                            var bottom = $(window).scrollTop() + $(window).height();
+                            if(bottom > selector.offset().top + selector.outerHeight() - 200){
+                                fetch_rows(state.loaded, false);
+                            }
+                        });
+
+                        selector.find('th[data-column]').bind('click', function(){
+                            var column = parseInt($(this).attr('data-column'));
+                            state.desc = (state.column == column) ? !state.desc : false;
+                            state.column = column;
+                            fetch_rows(0, true);
+                        });
+
+                        socket.on('sync_rows_%s', function(data){
+                            var body = selector.children('tbody');
+                            state.loading = false;
+                            if(data.reset){
+                                body.empty();
+                            }
+                            body.append(data.html);
+                            state.loaded = data.start + data.count;
+                            state.total = data.total;
+                            more.toggle(state.loaded < state.total);
+                            selector.table('rebuild');
+                        });
+                    });
+                })(jQuery);
+                </script>
+                """ % (self._namespace, self._name, self._name,
+                       len(self._data) if self._data is not None else 0, self._name)
+        return script
+
     def _attach_script(self):
         script = """
                 <script>
@@ -4367,8 +5474,12 @@ class Table(Widget, Namespace):
                         var socket = io('%s');
                         var selector = $('%s');
 
-                        socket.on('sync_properties_%s', function(props){
-                            selector.table-columntoggle('option', props['cmd'], props['value']);
+                        socket.on('sync_properties_%s', function(data){
+                            var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                            for(var i = 0; i < batch.length; i++){
+                                var props = batch[i];
+                                selector.table-columntoggle('option', props['cmd'], props['value']);
+                            }
                         });
 
                         selector.bind('click', function(e){
@@ -4412,10 +5523,16 @@ class Table(Widget, Namespace):
             header_rows_count = 1
         else:
             header_rows_count = 2
+        columns = {}
+        if self._page_size is not None:
+            # The index of the column is reported on a click on the header for sorting
+            for index, col_header in enumerate(self._column_headers):
+                columns[col_header['name']] = "data-column='" + str(index) + "' "
         th = ""
         if header_rows_count == 1:
             for col_header in self._column_headers:
-                th += "<th data-priority='" + col_header['priority'] + "' >" + col_header['name'] + "</th>"
+                th += "<th data-priority='" + col_header['priority'] + "' " + \
+                    columns.get(col_header['name'], "") + ">" + col_header['name'] + "</th>"
             # if row header or row count needs to be displayed in table, an extra column
             # should be added in the column headers
             if len(self._row_headers) > 0 and self._display_row_number:
@@ -4433,7 +5550,7 @@ class Table(Widget, Namespace):
                 th1 += "<th class='label' colspan='" + str(grp_data['count']) + "' data-priority='"\
                     + str(grp_data['priority']) + "'>" + group + "</th>\n"
                 for col in grp_data['cols']:
-                    th2 += "<th class='label'>" + col + "</th>\n"
+                    th2 += "<th class='label' " + columns.get(col, "") + ">" + col + "</th>\n"
             # if row header or row count needs to be displayed in table, an extra column
             # should be added in the column headers
             if len(self._row_headers) > 0 and self._display_row_number:
@@ -4465,22 +5582,15 @@ class Table(Widget, Namespace):
         else:
             content += " class='ui-shadow default-table' "
         content += ">"
-        body = ""
-        row_counter = 0
-        for row in self._data:
-            row_content = ""
-            if self._display_row_number:
-                row_content = "<th class='label'>" + str(row_counter + 1) + "</th>"
-            if self._row_headers is not None and len(self._row_headers) > 0:
-                row_content = row_content + "<th class='label'>" + self._row_headers[row_counter] + "</th>"
-            for cell in row:
-                if self._row_rendering_option == RowRenderingOptions.HTML:
-                    row_content += "<td>" + str(cell) + "</td>"
-                else:
-                    row_content += "<td>" + cgi.escape(str(cell)) + "</td>"
-            body += "<tr>" + row_content + "</tr>\n"
-            row_counter += 1
+        total = len(self._data) if self._data is not None else 0
+        if self._page_size is not None:
+            body = self._render_rows(0, min(self._page_size, total))
+        else:
+            body = self._render_rows(0, total)
         content += thead + "<tbody>" + body + "</tbody></table>\n" + self._attach_script() + "\n"
+        if self._page_size is not None:
+            content += "<a href='#' id='" + self._name + "_more' class='ui-btn'>More</a>\n"
+            content += self._attach_paging_script() + "\n"
         return content
 
 
@@ -4563,11 +5673,12 @@ class SimpleListView(Widget, Namespace):
                 self._items.remove(item)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value})
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def on_fire_select_event(self, props):
         if self._select_callback is not None:
-            self._select_callback(self._name, props)
+            self._run_callback(self._select_callback, self._name, props)
 
     def _attach_script(self):
         script = """<script>
@@ -4576,8 +5687,12 @@ class SimpleListView(Widget, Namespace):
                             var socket = io('%s');
 
                             selector.listview();
-                            socket.on('sync_properties_%s', function(props){
-                                selector.listview('option', props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.listview('option', props['cmd'], props['value']);
+                                }
                             });
 
                             selector.on('listviewonselected', function(event){
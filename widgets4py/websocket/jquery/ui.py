@@ -5,8 +5,9 @@ Author: Ajeet Singh
 Date: 08/16/2019
 
 """
-from flask_socketio import Namespace, emit
+from flask_socketio import Namespace
 from widgets4py.base import Widget
+from widgets4py.websocket.rate_limit import rate_limit_script, rate_limited
 from flask import json
 from enum import Enum
 
@@ -118,11 +119,11 @@ class Section(Widget, Namespace):
             if dsbld is not None:
                 self._disabled = dsbld
         if self._onclick_callback is not None:
-            self._onclick_callback(self._name, props)
+            self._run_callback(self._onclick_callback, self._name, props)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def on_click(self, onclick_callback):
         """Adds an event handler to on_click event of the widget. The event handler can be
@@ -289,8 +290,8 @@ class Accordion(Widget, Namespace):
         self._fill_space = val
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def render(self):
         """Method to render the content of Accordion and its child widget's
@@ -311,8 +312,12 @@ class Accordion(Widget, Namespace):
                                 heightStyle: "%s"
                             });
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.accordion("option", props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.accordion("option", props['cmd'], props['value']);
+                                }
                             });
                         });
                         </script>
@@ -536,7 +541,7 @@ class RadioButtonGroup(Widget, Namespace):
             if dsbld is not None:
                 self._disabled_buttons = dsbld
         if self._onclick_callback is not None:
-            self._onclick_callback(self._name, props)
+            self._run_callback(self._onclick_callback, self._name, props)
 
     def on_click(self, onclick_callback):
         """Adds an event handler to on_click event of the widget. The event handler can be
@@ -548,8 +553,8 @@ class RadioButtonGroup(Widget, Namespace):
         self._onclick_callback = onclick_callback
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def render(self):
         """Renders the Radio button group with title passed as param
@@ -784,7 +789,7 @@ class CheckBoxGroup(Widget, Namespace):
             if dsbld is not None:
                 self._disabled_buttons = dsbld
         if self._onclick_callback is not None:
-            self._onclick_callback(self._name, props)
+            self._run_callback(self._onclick_callback, self._name, props)
 
     def on_click(self, onclick_callback):
         """Adds an event handler to on_click event of the widget. The event handler can be
@@ -796,8 +801,8 @@ class CheckBoxGroup(Widget, Namespace):
         self._onclick_callback = onclick_callback
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def render(self):
         """Renders the checkbox button group with title passed as param
@@ -1128,19 +1133,19 @@ class DialogBox(Widget, Namespace):
         # or on, cancel buttons
         self._command = "close"
         if self._onbefore_close_callback is not None:
-            self._onbefore_close_callback(self._name, props)
+            self._run_callback(self._onbefore_close_callback, self._name, props)
 
     def on_fire_ok_pressed_event(self, props):
         if self._onok_pressed_callback is not None:
-            self._onok_pressed_callback(self._name, props)
+            self._run_callback(self._onok_pressed_callback, self._name, props)
 
     def on_fire_cancel_pressed_event(self, props):
         if self._oncancel_pressed_callback is not None:
-            self._oncancel_pressed_callback(self._name, props)
+            self._run_callback(self._oncancel_pressed_callback, self._name, props)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def on_before_close(self, onbefore_close_callback):
         """Adds an event handler to on_click event of the widget. The event handler can be
@@ -1180,22 +1185,26 @@ class DialogBox(Widget, Namespace):
                                 var selector = $("#%s");
                                 var socket = io("%s");
 
-                                socket.on('sync_properties_%s', function(props){
-                                    cmd = props['cmd'];
-                                    value = props['value'];
-                                    if(cmd === 'open'){
-                                        var isOpen = selector.dialog('isOpen');
-
-                                        if(!isOpen){
-                                            selector.dialog('open');
-                                        }
-                                    } else if(cmd === 'close'){
-                                        var isOpen = selector.dialog('isOpen');
-                                        if(isOpen){
-                                            selector.dialog('close');
+                                socket.on('sync_properties_%s', function(data){
+                                    var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                    for(var i = 0; i < batch.length; i++){
+                                        var props = batch[i];
+                                        cmd = props['cmd'];
+                                        value = props['value'];
+                                        if(cmd === 'open'){
+                                            var isOpen = selector.dialog('isOpen');
+
+                                            if(!isOpen){
+                                                selector.dialog('open');
+                                            }
+                                        } else if(cmd === 'close'){
+                                            var isOpen = selector.dialog('isOpen');
+                                            if(isOpen){
+                                                selector.dialog('close');
+                                            }
+                                        } else{
+                                            selector.dialog('option', cmd, value);
                                         }
-                                    } else{
-                                        selector.dialog('option', cmd, value);
                                     }
                                 });
 
@@ -1215,22 +1224,26 @@ class DialogBox(Widget, Namespace):
                                 var selector = $("#%s");
                                 var socket = io("%s");
 
-                                socket.on('sync_properties_%s', function(props){
-                                    cmd = props['cmd'];
-                                    value = props['value'];
-                                    if(cmd === 'open'){
-                                        var isOpen = selector.dialog('isOpen');
-
-                                        if(!isOpen){
-                                            selector.dialog('open');
-                                        }
-                                    } else if(cmd === 'close'){
-                                        var isOpen = selector.dialog('isOpen');
-                                        if(isOpen){
-                                            selector.dialog('close');
+                                socket.on('sync_properties_%s', function(data){
+                                    var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                    for(var i = 0; i < batch.length; i++){
+                                        var props = batch[i];
+                                        cmd = props['cmd'];
+                                        value = props['value'];
+                                        if(cmd === 'open'){
+                                            var isOpen = selector.dialog('isOpen');
+
+                                            if(!isOpen){
+                                                selector.dialog('open');
+                                            }
+                                        } else if(cmd === 'close'){
+                                            var isOpen = selector.dialog('isOpen');
+                                            if(isOpen){
+                                                selector.dialog('close');
+                                            }
+                                        } else {
+                                            selector.dialog('option', cmd, value);
                                         }
-                                    } else {
-                                        selector.dialog('option', cmd, value);
                                     }
                                 });
 
@@ -1265,22 +1278,26 @@ class DialogBox(Widget, Namespace):
                                 var selector = $("#%s");
                                 var socket = io("%s");
 
-                                socket.on('sync_properties_%s', function(props){
-                                    cmd = props['cmd'];
-                                    value = props['value'];
-                                    if(cmd === 'open'){
-                                        var isOpen = selector.dialog('isOpen');
-
-                                        if(!isOpen){
-                                            selector.dialog('open');
-                                        }
-                                    } else if(cmd === 'close'){
-                                        var isOpen = selector.dialog('isOpen');
-                                        if(isOpen){
-                                            selector.dialog('close');
+                                socket.on('sync_properties_%s', function(data){
+                                    var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                    for(var i = 0; i < batch.length; i++){
+                                        var props = batch[i];
+                                        cmd = props['cmd'];
+                                        value = props['value'];
+                                        if(cmd === 'open'){
+                                            var isOpen = selector.dialog('isOpen');
+
+                                            if(!isOpen){
+                                                selector.dialog('open');
+                                            }
+                                        } else if(cmd === 'close'){
+                                            var isOpen = selector.dialog('isOpen');
+                                            if(isOpen){
+                                                selector.dialog('close');
+                                            }
+                                        } else{
+                                            selector.dialog('option', cmd, value);
                                         }
-                                    } else{
-                                        selector.dialog('option', cmd, value);
                                     }
                                 });
 
@@ -1316,22 +1333,26 @@ class DialogBox(Widget, Namespace):
                                 var selector = $("#%s");
                                 var socket = io("%s");
 
-                                socket.on('sync_properties_%s', function(props){
-                                    cmd = props['cmd'];
-                                    value = props['value'];
-                                    if(cmd === 'open'){
-                                        var isOpen = selector.dialog('isOpen');
-
-                                        if(!isOpen){
-                                            selector.dialog('open');
-                                        }
-                                    } else if(cmd === 'close'){
-                                        var isOpen = selector.dialog('isOpen');
-                                        if(isOpen){
-                                            selector.dialog('close');
+                                socket.on('sync_properties_%s', function(data){
+                                    var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                    for(var i = 0; i < batch.length; i++){
+                                        var props = batch[i];
+                                        cmd = props['cmd'];
+                                        value = props['value'];
+                                        if(cmd === 'open'){
+                                            var isOpen = selector.dialog('isOpen');
+
+                                            if(!isOpen){
+                                                selector.dialog('open');
+                                            }
+                                        } else if(cmd === 'close'){
+                                            var isOpen = selector.dialog('isOpen');
+                                            if(isOpen){
+                                                selector.dialog('close');
+                                            }
+                                        } else {
+                                            selector.dialog('option', cmd, value);
                                         }
-                                    } else {
-                                        selector.dialog('option', cmd, value);
                                     }
                                 });
 
@@ -1459,26 +1480,30 @@ class MenuItem(Widget, Namespace):
                                 socket.emit("fire_click_event", props);
                             });
 
-                            socket.on('sync_properties_%s', function(props){
-                                if(props['cmd'] == "title" && props["value"] != undefined && props["value"] != ""){
-                                    selector.text(props["value"]);
-                                }
-
-                                if(props["cmd"] == "disabled" && props["value"]){
-                                    if(!selector.hasClass('ui-state-disabled')){
-                                            selector.addClass('ui-state-disabled');
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    if(props['cmd'] == "title" && props["value"] != undefined && props["value"] != ""){
+                                        selector.text(props["value"]);
                                     }
-                                } else if(props["cmd"] == "disabled" && !props["value"]) {
-                                    if(selector.hasClass('ui-state-disabled')){
-                                        selector.removeClass('ui-state-disabled');
+
+                                    if(props["cmd"] == "disabled" && props["value"]){
+                                        if(!selector.hasClass('ui-state-disabled')){
+                                                selector.addClass('ui-state-disabled');
+                                        }
+                                    } else if(props["cmd"] == "disabled" && !props["value"]) {
+                                        if(selector.hasClass('ui-state-disabled')){
+                                            selector.removeClass('ui-state-disabled');
+                                        }
                                     }
-                                }
 
-                                if(props["cmd"] == "icon" && props["value"] != ""){
-                                    icon_selector = $('#%s_icon');
-                                    if(icon_selector != undefined){
-                                        if(!icon_selector.hasClass(props["value"])){
-                                            icon_selector.addClass(props["value"]);
+                                    if(props["cmd"] == "icon" && props["value"] != ""){
+                                        icon_selector = $('#%s_icon');
+                                        if(icon_selector != undefined){
+                                            if(!icon_selector.hasClass(props["value"])){
+                                                icon_selector.addClass(props["value"]);
+                                            }
                                         }
                                     }
                                 }
@@ -1507,10 +1532,11 @@ class MenuItem(Widget, Namespace):
             if dsbld is not None:
                 self._disabled = dsbld
         if self._menu_clicked_callback is not None:
-            self._menu_clicked_callback(self._name, props)
+            self._run_callback(self._menu_clicked_callback, self._name, props)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value})
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def render(self):
         """Renders the menuitem and returns the content to parent widget
@@ -1666,8 +1692,8 @@ class Menu(Widget, Namespace):
         self._sync_properties('role', val)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def _attach_css(self):
         css = ""
@@ -1714,8 +1740,12 @@ class Menu(Widget, Namespace):
 
                                 selector.menu();
 
-                                socket.on('sync_properties_%s', function(props){
-                                    selector.menu('option', props['cmd'], props['value']);
+                                socket.on('sync_properties_%s', function(data){
+                                    var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                    for(var i = 0; i < batch.length; i++){
+                                        var props = batch[i];
+                                        selector.menu('option', props['cmd'], props['value']);
+                                    }
                                 });
                             });
                         </script>
@@ -1740,8 +1770,12 @@ class Menu(Widget, Namespace):
                                 },
                             });
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.menu('option', props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.menu('option', props['cmd'], props['value']);
+                                }
                             });
                         });
                     </script>
@@ -1779,9 +1813,11 @@ class Slider(Widget, Namespace):
     _step = None
     _value = None
     _values = None
+    _rate_limit = None
 
     def __init__(self, name, socket_io, value=None, orientation=None, max=None, desc=None, prop=None, style=None, attr=None,
-                 disabled=False, onclick_callback=None, onchange_callback=None, css_cls=None):
+                 disabled=False, onclick_callback=None, onchange_callback=None, css_cls=None,
+                 rate_limit=None, event_window=None):
         """Default constructor of the Label widget class
 
             Args:
@@ -1800,6 +1836,11 @@ class Slider(Widget, Namespace):
                 onclick_callback (function, optional): A function to be called back on onclick event
                 slider_changed_callback (function, optional): Called whenever value of slider changes
                 css_cls (list, optional): An list of CSS class names to be added to current widget
+                rate_limit (RateLimit, optional): Limits the rate of the change events sent by the
+                                                  client, see `RateLimit.throttle` and `RateLimit.debounce`
+                event_window (float, optional): Seconds in which the change events are coalesced at the
+                                                server, the callback is called once per window with the
+                                                latest value
         """
         Widget.__init__(self, name, desc=desc, prop=prop, style=style, attr=attr,
                         css_cls=css_cls)
@@ -1822,6 +1863,9 @@ class Slider(Widget, Namespace):
             self._max = 100
         else:
             self._max = max
+        self._rate_limit = rate_limit
+        if event_window is not None:
+            self.set_event_window(event_window)
 
     @property
     def namespace(self):
@@ -1831,9 +1875,18 @@ class Slider(Widget, Namespace):
     def namespace(self, val):
         self._namespace = val
 
+    @property
+    def rate_limit(self):
+        return self._rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, val):
+        self._rate_limit = val
+
     def _attach_script(self):
         script = """
                     <script>
+                        %s
                         $(function(){
                             var selector = $('#%s');
                             var socket = io('%s');
@@ -1847,21 +1900,27 @@ class Slider(Widget, Namespace):
                                 socket.emit('fire_click_event', prop);
                             });
 
-                            selector.on("slidechange", function(event){
+                            var fire_change_event = function(event){
                                 var props = {
                                     'value': selector.slider('value')
                                 };
                                 socket.emit('fire_change_event', props);
-                            });
+                            };
+                            selector.on("slidechange", %s);
 
-                            socket.on('sync_properties_%s', function(props){
-                                var cmd = props['cmd'];
-                                var value = props['value'];
-                                selector.slider('option', cmd, value);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    var cmd = props['cmd'];
+                                    var value = props['value'];
+                                    selector.slider('option', cmd, value);
+                                }
                             });
                         });
                     </script>
-                """ % (self._name, self._namespace, self._name)
+                """ % (rate_limit_script(self._rate_limit), self._name, self._namespace,
+                       rate_limited('fire_change_event', self._rate_limit), self._name)
         return script
 
     def on_fire_click_event(self, props):
@@ -1870,7 +1929,7 @@ class Slider(Widget, Namespace):
             if val is not None:
                 self._value = val
         if self._onclick_callback is not None:
-            self._onclick_callback(self._name, props)
+            self._run_callback(self._onclick_callback, self._name, props)
 
     def on_fire_change_event(self, props):
         if props.__len__() > 0:
@@ -1878,7 +1937,7 @@ class Slider(Widget, Namespace):
             if val is not None:
                 self._value = val
         if self._onchange_callback is not None:
-            self._onchange_callback(self._name, props)
+            self._run_coalesced(self._onchange_callback, self._name, props)
 
     def on_slider_clicked(self, onclick_callback):
         """Adds an event handler to on_click event of the widget. The event handler can be
@@ -1998,8 +2057,8 @@ class Slider(Widget, Namespace):
         return css
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def render(self):
         """Renders the slider widget under parent widget
@@ -2218,8 +2277,8 @@ class Spinner(Widget, Namespace):
         self._sync_properties('step', val)
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def _attach_script(self):
         script = ""
@@ -2252,8 +2311,12 @@ class Spinner(Widget, Namespace):
                                 socket.emit('fire_spinner_changed', props);
                             });
 
-                            socket.on('sync_properties_%s', function(props){
-                                selector.spinner('option', props['cmd'], props['value']);
+                            socket.on('sync_properties_%s', function(data){
+                                var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                for(var i = 0; i < batch.length; i++){
+                                    var props = batch[i];
+                                    selector.spinner('option', props['cmd'], props['value']);
+                                }
                             });
                         });
                     </script>
@@ -2267,7 +2330,7 @@ class Spinner(Widget, Namespace):
             if val is not None:
                 self._value = val
         if self._onchange_callback is not None:
-            self._onchange_callback(self._name, props)
+            self._run_callback(self._onchange_callback, self._name, props)
 
     def render(self):
         content = self._render_pre_content('input')
@@ -2526,21 +2589,25 @@ class Tab(Widget, Namespace):
                                     socket.emit('fire_tab_activated', props);
                                 });
 
-                                socket.on('sync_properties_%s', function(props){
-                                    var cmd = props['cmd'];
-                                    var value = props['value'];
-                                    if(cmd === 'sortable' && value){
-                                        selector.find( ".ui-tabs-nav" ).sortable({
-                                            axis: "x",
-                                            stop: function() {
-                                                selector.tabs( "refresh" );
-                                            }
-                                        });
-                                    } else if (cmd === 'v_orient' && value){
-                                        selector.tabs().addClass( "ui-tabs-vertical ui-helper-clearfix" );
-                                        selector.removeClass( "ui-corner-top" ).addClass( "ui-corner-left" );
-                                    } else {
-                                        selector.tabs('option', cmd, value);
+                                socket.on('sync_properties_%s', function(data){
+                                    var batch = (data['cmd'] == 'batch') ? data['value'] : [data];
+                                    for(var i = 0; i < batch.length; i++){
+                                        var props = batch[i];
+                                        var cmd = props['cmd'];
+                                        var value = props['value'];
+                                        if(cmd === 'sortable' && value){
+                                            selector.find( ".ui-tabs-nav" ).sortable({
+                                                axis: "x",
+                                                stop: function() {
+                                                    selector.tabs( "refresh" );
+                                                }
+                                            });
+                                        } else if (cmd === 'v_orient' && value){
+                                            selector.tabs().addClass( "ui-tabs-vertical ui-helper-clearfix" );
+                                            selector.removeClass( "ui-corner-top" ).addClass( "ui-corner-left" );
+                                        } else {
+                                            selector.tabs('option', cmd, value);
+                                        }
                                     }
                                 });
                             });
@@ -2556,7 +2623,7 @@ class Tab(Widget, Namespace):
             if val is not None:
                 self._active = val
         if self._tab_activated_callback is not None:
-            self._tab_activated_callback(self._name, props)
+            self._run_callback(self._tab_activated_callback, self._name, props)
 
     def _attach_css(self):
         css = ""
@@ -2573,8 +2640,8 @@ class Tab(Widget, Namespace):
         return css
 
     def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=cmd)
 
     def render(self):
         content = self._attach_css() + "\n"
@@ -0,0 +1,129 @@
+"""This module contains the client side rate limiting of the events fired by the widgets
+with a continuous input, e.g. sliders, range sliders and flip switches, which otherwise
+send an event to the server for every step of a drag
+"""
+from flask import json
+
+
+RATE_LIMIT_SCRIPT = """
+                function widgets4py_rate_limit(fn, opts){
+                    var timer = null;
+                    var max_timer = null;
+                    var args = null;
+                    var pending = false;
+                    var last = 0;
+
+                    function invoke(){
+                        pending = false;
+                        last = Date.now();
+                        fn.apply(null, args);
+                    }
+
+                    function flush(){
+                        clearTimeout(timer);
+                        clearTimeout(max_timer);
+                        timer = null;
+                        max_timer = null;
+                        if(pending && opts.trailing){
+                            invoke();
+                        }
+                        pending = false;
+                    }
+
+                    return function(){
+                        args = arguments;
+                        var idle = (timer === null && max_timer === null);
+                        if(idle && opts.leading && Date.now() - last >= opts.wait){
+                            invoke();
+                        } else {
+                            pending = true;
+                        }
+                        clearTimeout(timer);
+                        timer = setTimeout(flush, opts.wait);
+                        if(opts.maxWait !== null && max_timer === null){
+                            max_timer = setTimeout(flush, opts.maxWait);
+                        }
+                    };
+                }
+"""
+
+
+class RateLimit:
+    """Limits the rate at which a client side event is sent to the server. The event is
+    debounced, i.e. sent once no further event followed within `wait` seconds, and it can be
+    sent on the leading edge, the trailing edge or both. With `max_wait` the event is sent at
+    least once every `max_wait` seconds while the events keep coming, which turns the debounce
+    into a throttle, see `throttle` and `debounce`
+    """
+
+    _wait = None
+    _leading = None
+    _trailing = None
+    _max_wait = None
+
+    def __init__(self, wait, leading=True, trailing=True, max_wait=None):
+        """Below are the parameters of this class
+
+            Args:
+                wait (float): Seconds without events before the trailing event is sent
+                leading (boolean): Sends the first event of a burst right away
+                trailing (boolean): Sends the last event of a burst once the burst is over
+                max_wait (float, optional): Maximum seconds an event is held back
+        """
+        self._wait = wait
+        self._leading = leading
+        self._trailing = trailing
+        self._max_wait = max_wait
+
+    @classmethod
+    def throttle(cls, interval, leading=True, trailing=True):
+        """Sends at most one event every `interval` seconds, i.e. a maximum rate of
+        1 / `interval` events per second"""
+        return cls(interval, leading=leading, trailing=trailing, max_wait=interval)
+
+    @classmethod
+    def debounce(cls, wait, leading=False, trailing=True, max_wait=None):
+        """Sends an event once the events stopped for `wait` seconds"""
+        return cls(wait, leading=leading, trailing=trailing, max_wait=max_wait)
+
+    @property
+    def wait(self):
+        return self._wait
+
+    @property
+    def leading(self):
+        return self._leading
+
+    @property
+    def trailing(self):
+        return self._trailing
+
+    @property
+    def max_wait(self):
+        return self._max_wait
+
+    def render(self):
+        """Renders the options of the rate limit as a JS object"""
+        return json.dumps({'wait': int(self._wait * 1000),
+                           'leading': self._leading,
+                           'trailing': self._trailing,
+                           'maxWait': int(self._max_wait * 1000) if self._max_wait is not None else None})
+
+
+def rate_limit_script(rate_limit):
+    """Returns the JS function implementing the rate limit, empty if no rate limit is used"""
+    if rate_limit is None:
+        return ""
+    return RATE_LIMIT_SCRIPT
+
+
+def rate_limited(function, rate_limit):
+    """Returns the JS expression of the event handler `function` limited to the rate limit
+
+        Args:
+            function (string): Name of the JS function handling the event
+            rate_limit (RateLimit): The rate limit to be applied, None for no limit
+    """
+    if rate_limit is None:
+        return function
+    return "widgets4py_rate_limit(" + function + ", " + rate_limit.render() + ")"
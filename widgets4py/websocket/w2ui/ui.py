@@ -12,6 +12,10 @@ from flask_socketio import Namespace, emit
 from widgets4py.base import Widget  # noqa
 from flask import json, request  # noqa
 from enum import Enum
+from bisect import bisect_left
+from collections import OrderedDict
+from threading import Lock
+import time
 
 
 class GridColumn:
@@ -25,8 +29,10 @@ class GridColumn:
     _render = None
     _attributes = None
     _sortable = None
+    _summary = None
 
-    def __init__(self, field_name, caption, size, render=None, attributes=None, sortable=None):
+    def __init__(self, field_name, caption, size, render=None, attributes=None, sortable=None,
+                 summary=None):
         """Below are the parameters of this class
 
             Args:
@@ -35,6 +41,8 @@ class GridColumn:
                 size (int): Size of the column in percentage %% of total grid width
                 render (string): A format string to render cell contents like, money, date,etc
                 attributes (string): A key value pair to format the row eg, align=center
+                summary (string): Aggregate of the column to be shown in the summary row of
+                                    the grid, one of 'sum', 'count', 'min', 'max' or 'mean'
         """
         self._field_name = field_name
         self._caption = caption
@@ -42,6 +50,7 @@ class GridColumn:
         self._render = render
         self._attributes = attributes
         self._sortable = sortable
+        self._summary = summary
 
     @property
     def field_name(self):
@@ -98,6 +107,11 @@ class GridColumn:
     def sortable(self, val):
         self._sortable = val
 
+    @property
+    def summary(self):
+        """Aggregate of the column to be shown in the summary row"""
+        return self._summary
+
     def render(self):
         """Renders the GridColumn as `dict` object which will be converted to JSON
         for final rendering on the browser
@@ -244,13 +258,109 @@ class SummaryGridRecord(GridRecord):
         return obj
 
 
+class GridColumnSummary:
+    """Aggregate (sum, count, min, max or mean) of a `GridColumn` which is shown in the
+    summary row of the Grid. The aggregate is maintained incrementally by the
+    `GridRecordCollection` as records are added, updated or removed. Only the removal
+    of the current minimum or maximum value requires the column to be scanned again
+    """
+
+    _field = None
+    _func = None
+    _sum = None
+    _count = None
+    _min = None
+    _max = None
+    _stale = None
+
+    def __init__(self, field, func):
+        """Below are the parameters of this class
+
+            Args:
+                field (string): Name of the column to be aggregated
+                func (string): One of the 'sum', 'count', 'min', 'max' or 'mean'
+        """
+        self._field = field
+        self._func = func
+        self.rebuild([])
+
+    @property
+    def field(self):
+        """Name of the column being aggregated"""
+        return self._field
+
+    def add(self, value):
+        """Includes the value of an added record in the aggregate"""
+        if value is None:
+            return
+        self._count += 1
+        if self._func == 'count':
+            return
+        self._sum += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def remove(self, value):
+        """Excludes the value of a removed record from the aggregate"""
+        if value is None:
+            return
+        self._count -= 1
+        if self._func == 'count':
+            return
+        self._sum -= value
+        if value == self._min or value == self._max:
+            self._stale = True
+
+    def rebuild(self, values):
+        """Computes the aggregate again from the whole column"""
+        values = [value for value in values if value is not None]
+        self._count = values.__len__()
+        self._stale = False
+        if self._func == 'count' or self._count == 0:
+            self._sum = 0
+            self._min = None
+            self._max = None
+        else:
+            self._sum = sum(values)
+            self._min = min(values)
+            self._max = max(values)
+
+    def value(self, records):
+        """Returns the current value of the aggregate
+
+            Args:
+                records (list): Records of the collection, used only if the min or max
+                                value needs to be computed again
+        """
+        if self._stale:
+            self.rebuild([rec.record.get(self._field) for rec in records if rec is not None])
+        if self._func == 'sum':
+            return self._sum
+        if self._func == 'count':
+            return self._count
+        if self._func == 'min':
+            return self._min
+        if self._func == 'max':
+            return self._max
+        if self._func == 'mean':
+            return self._sum / self._count if self._count > 0 else None
+        return None
+
+
 class GridRecordCollection:
     """A collection of rows or records of an Grid. All records should be added to
-    this class in order to be rendered under an Grid Widget
+    this class in order to be rendered under an Grid Widget. Every record gets an unique
+    and stable `recid` when added to the collection and records can be looked up, updated
+    and removed by their `recid` in constant time
     """
 
     _records = None
     _counter = None
+    _index = None
+    _removed = None
+    _summaries = None
 
     def __init__(self, records=None):
         """Default constructor of this class with below parameters
@@ -258,34 +368,85 @@ class GridRecordCollection:
             Args:
                 records (list): A list of records to be rendered in Grid widget
         """
+        self._counter = 1
+        self._summaries = []
         if records is not None:
-            self._records = records
+            self.records = records
         else:
-            self._records = []
-        self._counter = 1
+            self.records = []
 
     @property
     def records(self):
+        """The list of records of the collection. Tombstones of removed records are cleared
+        by `remove_records` & `compact`, until then a list without them is returned
+        """
+        if self._removed > 0:
+            return [rec for rec in self._records if rec is not None]
         return self._records
 
     @records.setter
     def records(self, val):
         self._records = val
+        self._index = {}
+        self._removed = 0
+        for pos, rec in enumerate(self._records):
+            recid = rec.record.get('recid')
+            if recid is None:
+                recid = self._counter
+                rec.add_cell('recid', recid)
+            if isinstance(recid, int):
+                # Records may carry their own recids of any type, only int ones can clash
+                self._counter = max(self._counter, recid + 1)
+            self._index[recid] = pos
+        for summary in self._summaries:
+            summary.rebuild([rec.record.get(summary.field) for rec in self._records])
+
+    def set_summary_columns(self, column_collection):
+        """Sets up the aggregates of the summary row for the columns of the passed
+        collection having a `summary` defined
+
+            Args:
+                column_collection (GridColumnCollection): Columns of the Grid
+        """
+        self._summaries = []
+        for col in column_collection.columns:
+            if col.summary is not None:
+                summary = GridColumnSummary(col.field_name, col.summary)
+                summary.rebuild([rec.record.get(col.field_name) for rec in self._records if rec is not None])
+                self._summaries.append(summary)
+
+    def get_summary(self):
+        """Returns the summary row as `SummaryGridRecord` or `None` if no column has a
+        summary defined
+        """
+        if self._summaries.__len__() == 0:
+            return None
+        record = SummaryGridRecord({'recid': 'summary'})
+        for summary in self._summaries:
+            record.add_cell(summary.field, summary.value(self._records))
+        return record
 
     @property
     def count(self):
         """Returns the number of records available in the collection"""
-        return self._records.__len__()
+        return self._records.__len__() - self._removed
+
+    def __len__(self):
+        return self.count
 
     def add(self, record):
-        """Adds an row or record in the collection
+        """Adds an row or record in the collection. The record gets the next available
+        `recid` which is never reused, even after the records are removed
 
             Args:
                 record (GridRecord): A gird record or row to be added
         """
         record.add_cell('recid', self._counter)
+        self._index[self._counter] = self._records.__len__()
         self._counter += 1
         self._records.append(record)
+        for summary in self._summaries:
+            summary.add(record.record.get(summary.field))
 
     def remove(self, record):
         """Removes an row from the rows collection
@@ -293,14 +454,72 @@ class GridRecordCollection:
             Args:
                 record: Record to be removed from the collection
         """
-        self._counter -= 1
-        self._records.pop(record)
+        self.remove_records([record.record.get('recid')])
+
+    def get(self, recid):
+        """Returns the record having the passed recid or `None` if no such record exists
+
+            Args:
+                recid (int): The recid of the record
+        """
+        pos = self._index.get(recid)
+        if pos is None:
+            return None
+        return self._records[pos]
+
+    def update(self, recid, cells):
+        """Updates the cells of the record having the passed recid
+
+            Args:
+                recid (int): The recid of the record to be updated
+                cells (dict): A dict of cell names and their new values
+        """
+        record = self.get(recid)
+        if record is not None:
+            for summary in self._summaries:
+                if summary.field in cells:
+                    summary.remove(record.record.get(summary.field))
+                    summary.add(cells.get(summary.field))
+            for cell in cells:
+                record.add_cell(cell, cells.get(cell))
+        return record
+
+    def remove_records(self, recids):
+        """Removes all the records having one of the passed recids from the collection.
+        Removed records leave a tombstone which is cleared once tombstones make up half
+        of the collection
+
+            Args:
+                recids (list): A list of recid of the records to be removed
+        """
+        for recid in recids:
+            pos = self._index.pop(recid, None)
+            if pos is not None:
+                for summary in self._summaries:
+                    summary.remove(self._records[pos].record.get(summary.field))
+                self._records[pos] = None
+                self._removed += 1
+        if self._removed > 32 and self._removed * 2 > self._records.__len__():
+            self.compact()
+
+    def compact(self):
+        """Clears the tombstones left by removed records and rebuilds the recid index"""
+        if self._removed > 0:
+            self._records = [rec for rec in self._records if rec is not None]
+            self._index = {}
+            for pos, rec in enumerate(self._records):
+                self._index[rec.record.get('recid')] = pos
+            self._removed = 0
 
     def render(self):
         """Function to render all the records in the JSON list format"""
         content = []
         for rec in self._records:
-            content.append(rec.render())
+            if rec is not None:
+                content.append(rec.render())
+        summary = self.get_summary()
+        if summary is not None:
+            content.append(summary.render())
         return json.dumps(content)
 
 
@@ -480,6 +699,12 @@ class Grid(Widget, Namespace):
     _multi_search = None
     _namespace = None
     _socket_io = None
+    _stream_rate = None
+    _stream_deltas = None
+    _stream_lock = None
+    _streaming = None
+    _stream_generation = None
+    _summary_sent = None
 
     @property
     def header(self):
@@ -506,7 +731,7 @@ class Grid(Widget, Namespace):
                  toolbar_add_client_script=None, toolbar_add_callback=None,
                  toolbar_delete_client_script=None, toolbar_delete_callback=None,
                  toolbar_save_client_script=None, toolbar_save_callback=None,
-                 toolbar_edit_client_script=None, toolbar_edit_callback=None):
+                 toolbar_edit_client_script=None, toolbar_edit_callback=None, stream_rate=None):
         """Default constructor of the Button widget class
 
             Args:
@@ -563,6 +788,8 @@ class Grid(Widget, Namespace):
                                                         executed on "edit" button click event
                 toolbar_edit_callback (callable): Same as `toolbar_add_callback` but is called on
                                                     "edit" button click event
+                stream_rate (int): Number of times per second the cell updates pushed through
+                                    `stream_cells` are flushed to the clients. Default is 10
         """
         Widget.__init__(self, name, desc=desc, prop=prop, style=style, attr=attr,
                         css_cls=css_cls)
@@ -573,6 +800,8 @@ class Grid(Widget, Namespace):
         self._header = header
         self._column_collection = column_collection
         self._row_collection = row_collection
+        if self._row_collection is not None:
+            self._row_collection.set_summary_columns(self._column_collection)
         self._search_collection = search_collection
         self.add_style("width", "100%")
         self.add_style("height", "100%")
@@ -649,6 +878,14 @@ class Grid(Widget, Namespace):
         else:
             self._toolbar_edit_client_script = ""
         self._toolbar_edit_callback = toolbar_edit_callback
+        if stream_rate is not None:
+            self._stream_rate = stream_rate
+        else:
+            self._stream_rate = 10
+        self._stream_deltas = {}
+        self._stream_lock = Lock()
+        self._streaming = False
+        self._stream_generation = 0
 
     def _attach_script(self):
         script = ""
@@ -719,6 +956,27 @@ class Grid(Widget, Namespace):
                                             if(cmd == "ADD-RECORD"){
                                                 w2ui[name].add(value);
                                             }
+                                            if(cmd == "ADD-RECORDS"){
+                                                w2ui[name].add(value);
+                                            }
+                                            if(cmd == "UPDATE-RECORDS"){
+                                                for(var i = 0; i < value.length; i++){
+                                                    w2ui[name].set(value[i].recid, value[i], true);
+                                                }
+                                                w2ui[name].refresh();
+                                            }
+                                            if(cmd == "REMOVE-RECORDS"){
+                                                w2ui[name].remove.apply(w2ui[name], value);
+                                            }
+                                            if(cmd == "MERGE-RECORDS"){
+                                                for(var i = 0; i < value.length; i++){
+                                                    w2ui[name].set(value[i][0], value[i][1]);
+                                                }
+                                            }
+                                            if(cmd == "SET-SUMMARY"){
+                                                w2ui[name].summary = [value];
+                                                w2ui[name].refresh();
+                                            }
                                             if(cmd == "SELECT-ALL"){
                                                 w2ui[name].selectAll();
                                             }
@@ -821,6 +1079,27 @@ class Grid(Widget, Namespace):
                                             if(cmd == "ADD-RECORD"){
                                                 w2ui[name].add(value);
                                             }
+                                            if(cmd == "ADD-RECORDS"){
+                                                w2ui[name].add(value);
+                                            }
+                                            if(cmd == "UPDATE-RECORDS"){
+                                                for(var i = 0; i < value.length; i++){
+                                                    w2ui[name].set(value[i].recid, value[i], true);
+                                                }
+                                                w2ui[name].refresh();
+                                            }
+                                            if(cmd == "REMOVE-RECORDS"){
+                                                w2ui[name].remove.apply(w2ui[name], value);
+                                            }
+                                            if(cmd == "MERGE-RECORDS"){
+                                                for(var i = 0; i < value.length; i++){
+                                                    w2ui[name].set(value[i][0], value[i][1]);
+                                                }
+                                            }
+                                            if(cmd == "SET-SUMMARY"){
+                                                w2ui[name].summary = [value];
+                                                w2ui[name].refresh();
+                                            }
                                             if(cmd == "SELECT-ALL"){
                                                 w2ui[name].selectAll();
                                             }
@@ -925,6 +1204,27 @@ class Grid(Widget, Namespace):
                                             if(cmd == "ADD-RECORD"){
                                                 w2ui[name].add(value);
                                             }
+                                            if(cmd == "ADD-RECORDS"){
+                                                w2ui[name].add(value);
+                                            }
+                                            if(cmd == "UPDATE-RECORDS"){
+                                                for(var i = 0; i < value.length; i++){
+                                                    w2ui[name].set(value[i].recid, value[i], true);
+                                                }
+                                                w2ui[name].refresh();
+                                            }
+                                            if(cmd == "REMOVE-RECORDS"){
+                                                w2ui[name].remove.apply(w2ui[name], value);
+                                            }
+                                            if(cmd == "MERGE-RECORDS"){
+                                                for(var i = 0; i < value.length; i++){
+                                                    w2ui[name].set(value[i][0], value[i][1]);
+                                                }
+                                            }
+                                            if(cmd == "SET-SUMMARY"){
+                                                w2ui[name].summary = [value];
+                                                w2ui[name].refresh();
+                                            }
                                             if(cmd == "SELECT-ALL"){
                                                 w2ui[name].selectAll();
                                             }
@@ -963,11 +1263,12 @@ class Grid(Widget, Namespace):
 
     def on_fire_click_event(self, props):
         if self._onclick_callback is not None:
-            self._onclick_callback(self._name, props)
+            self._run_callback(self._onclick_callback, self._name, props)
 
     def on_get_grid_records(self):
         record_collection = self._data_load_callback()
-        self._row_collection = record_collection
+        with self._stream_lock:
+            self._row_collection = record_collection
         result = {}
         result['total'] = record_collection.__len__()
         result['records'] = record_collection.render()
@@ -976,19 +1277,19 @@ class Grid(Widget, Namespace):
 
     def on_fire_add_event(self, props):
         if self._toolbar_add_callback is not None:
-            self._toolbar_add_callback(self._name, props)
+            self._run_callback(self._toolbar_add_callback, self._name, props)
 
     def on_fire_edit_event(self, props):
         if self._toolbar_edit_callback is not None:
-            self._toolbar_edit_callback(self._name, props)
+            self._run_callback(self._toolbar_edit_callback, self._name, props)
 
     def on_fire_delete_event(self, props):
         if self._toolbar_delete_callback is not None:
-            self._toolbar_delete_callback(self._name, props)
+            self._run_callback(self._toolbar_delete_callback, self._name, props)
 
     def on_fire_save_event(self, props):
         if self._toolbar_save_callback is not None:
-            self._toolbar_save_callback(self._name, props)
+            self._run_callback(self._toolbar_save_callback, self._name, props)
 
     def toggle_column(self, col_name):
         """Toggles the visibility of an column in the grid
@@ -1004,10 +1305,90 @@ class Grid(Widget, Namespace):
             Args:
                 record (GridRecord): An record of GridRecord type
         """
-        rec_count = self._row_collection.count
-        self._row_collection.add(record)
-        record.add_cell('recid', rec_count + 1)
+        with self._stream_lock:
+            self._get_row_collection().add(record)
         self._sync_properties('ADD-RECORD', record.render())
+        self._sync_summary()
+
+    def _get_row_collection(self):
+        # The grid may be created without records, the collection is then created on first use
+        if self._row_collection is None:
+            self._row_collection = GridRecordCollection()
+            self._row_collection.set_summary_columns(self._column_collection)
+        return self._row_collection
+
+    def add_records(self, records=None, columns=None):
+        """Adds multiple records to the grid in one go. The records are sent to the client
+        as a single message and are added to the grid with a single refresh
+
+            Args:
+                records (iterable): An iterable of records of GridRecord type
+                columns (dict): Alternatively, a dict of column name and list of cell values,
+                                one value per record e.g., {'fname': ['Jane', 'John']}
+        """
+        if columns is not None:
+            fields = list(columns.keys())
+            records = [GridRecord(dict(zip(fields, row))) for row in zip(*columns.values())]
+        content = []
+        with self._stream_lock:
+            row_collection = self._get_row_collection()
+            for record in records:
+                row_collection.add(record)
+                content.append(record.render())
+        self._sync_properties('ADD-RECORDS', content)
+        self._sync_summary()
+
+    def update_records(self, changes):
+        """Updates the cells of multiple records in place. All the changes are sent to the
+        client as a single message and the grid is refreshed once
+
+            Args:
+                changes (dict): A dict of recid and a dict of cells to be updated in that
+                                record e.g., {1: {'fname': 'Jane'}, 5: {'qty': 10}}
+        """
+        content = []
+        with self._stream_lock:
+            row_collection = self._get_row_collection()
+            for recid in changes:
+                cells = changes.get(recid)
+                row_collection.update(recid, cells)
+                change = dict(cells)
+                change['recid'] = recid
+                content.append(change)
+        self._sync_properties('UPDATE-RECORDS', content)
+        self._sync_summary()
+
+    def remove_records(self, recids):
+        """Removes multiple records from the grid in one go
+
+            Args:
+                recids (iterable): An iterable of recid of the records to be removed
+        """
+        recids = list(recids)
+        with self._stream_lock:
+            self._get_row_collection().remove_records(recids)
+        self._sync_properties('REMOVE-RECORDS', recids)
+        self._sync_summary()
+
+    def _get_summary_change(self):
+        """Returns the summary row as `dict` if its values changed since it was last sent
+        to the client, else returns `None`
+        """
+        if self._row_collection is None:
+            return None
+        summary = self._row_collection.get_summary()
+        if summary is None:
+            return None
+        summary = summary.render()
+        if summary == self._summary_sent:
+            return None
+        self._summary_sent = summary
+        return summary
+
+    def _sync_summary(self):
+        summary = self._get_summary_change()
+        if summary is not None:
+            self._sync_properties('SET-SUMMARY', summary, key='SET-SUMMARY')
 
     def select_all_records(self):
         """Selects all the records available in the Grid Widget"""
@@ -1035,11 +1416,69 @@ class Grid(Widget, Namespace):
         """
         self._sync_properties('UNSELECT', records)
 
-    def _sync_properties(self, cmd, value):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
-             namespace=self._namespace)
+    def stream_cells(self, recid, cells):
+        """Pushes a change of cell values of a record to all the clients displaying the grid.
+        Changes are not sent immediately but collected and flushed `stream_rate` times per
+        second as one message. Only the latest value of each cell is sent, so clients never
+        lag behind a high frequency feed. The flushing task ends once a round finds no changes
+        and is started again by the next call. This method can be called from any thread
+
+            Args:
+                recid (int): The recid of the record to be updated
+                cells (dict): A dict of cell names and their new values
+        """
+        with self._stream_lock:
+            if self._row_collection is not None:
+                self._row_collection.update(recid, cells)
+            delta = self._stream_deltas.get(recid)
+            if delta is None:
+                self._stream_deltas[recid] = dict(cells)
+            else:
+                delta.update(cells)
+            if not self._streaming:
+                self._streaming = True
+                # A task of an earlier generation still sleeping ends on its next round
+                self._stream_generation += 1
+                self._socket_io.start_background_task(self._flush_stream, self._stream_generation)
+
+    def stop_streaming(self):
+        """Stops the background task flushing the streamed cell updates. Any pending updates
+        are sent before the task ends and the task is started again on next `stream_cells`
+        """
+        with self._stream_lock:
+            self._streaming = False
+
+    def _flush_stream(self, generation):
+        streaming = True
+        while streaming:
+            self._socket_io.sleep(1.0 / self._stream_rate)
+            with self._stream_lock:
+                deltas = self._stream_deltas
+                self._stream_deltas = {}
+                streaming = self._streaming and self._stream_generation == generation
+                if streaming and deltas.__len__() == 0:
+                    # Nothing changed since the last round, the next change starts a new task
+                    self._streaming = False
+                    streaming = False
+                summary = self._get_summary_change() if deltas.__len__() > 0 else None
+            if deltas.__len__() > 0:
+                self._socket_io.emit('sync_properties_' + self._name,
+                                     {'cmd': 'MERGE-RECORDS',
+                                      'value': [[recid, deltas.get(recid)] for recid in deltas]},
+                                     namespace=self._namespace)
+            if summary is not None:
+                self._socket_io.emit('sync_properties_' + self._name,
+                                     {'cmd': 'SET-SUMMARY', 'value': summary},
+                                     namespace=self._namespace)
+
+    def _sync_properties(self, cmd, value, key=None):
+        # Only the commands replacing a state are passed with a key, the records and selection
+        # commands are applied one after the other and must never be collapsed
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value},
+                   namespace=self._namespace, key=key)
 
     def render(self):
+        self._get_summary_change()
         content = self._render_pre_content('div')
         content += self._render_post_content('div') + "\n"
         content += self._attach_script()
@@ -1054,6 +1493,9 @@ class ToolbarButton(Widget):
     _icon = None
     _type = None
     _group = None
+    _hidden = None
+    _disabled = None
+    _checked = None
 
     def __init__(self, name, title=None, icon=None, group=None):
         """Default constructor parameters
@@ -1069,6 +1511,9 @@ class ToolbarButton(Widget):
         self._icon = icon
         self._type = "button"
         self._group = group
+        self._hidden = False
+        self._disabled = False
+        self._checked = False
         if title is None and icon is None:
             raise ValueError("Either Title or Icon param should have value")
 
@@ -1108,6 +1553,45 @@ class ToolbarButton(Widget):
     def group(self, val):
         return self._group
 
+    @property
+    def hidden(self):
+        """Whether the item is hidden on the toolbar"""
+        return self._hidden
+
+    @hidden.setter
+    def hidden(self, val):
+        self._hidden = val
+
+    @property
+    def disabled(self):
+        """Whether the item is disabled on the toolbar"""
+        return self._disabled
+
+    @disabled.setter
+    def disabled(self, val):
+        self._disabled = val
+
+    @property
+    def checked(self):
+        """Whether the item is checked, used by check and radio items"""
+        return self._checked
+
+    @checked.setter
+    def checked(self, val):
+        self._checked = val
+
+    def get_state(self):
+        """Returns the hidden, disabled and checked flags of the item as tuple"""
+        return (self._hidden, self._disabled, self._checked)
+
+    def _render_state(self, obj):
+        if self._hidden:
+            obj['hidden'] = True
+        if self._disabled:
+            obj['disabled'] = True
+        if self._checked:
+            obj['checked'] = True
+
     def render(self):
         """Renders the widget under parent widget"""
         obj = {}
@@ -1119,6 +1603,7 @@ class ToolbarButton(Widget):
             obj['icon'] = self._icon
         if self._group is not None:
             obj['group'] = self._group
+        self._render_state(obj)
         return json.dumps(obj)
 
 
@@ -1220,6 +1705,7 @@ class ToolbarMenu(ToolbarButton):
             obj['count'] = self._count
         if self._items is not None:
             obj['items'] = self._items
+        self._render_state(obj)
         return json.dumps(obj)
 
 
@@ -1271,6 +1757,7 @@ class ToolbarMenuRadio(ToolbarMenu):
             obj['icon'] = self._icon
         if self._items is not None:
             obj['items'] = self._items
+        self._render_state(obj)
         return json.dumps(obj)
 
 
@@ -1345,6 +1832,7 @@ class ToolbarDropDown(ToolbarButton):
             obj['icon'] = self._icon
         if self._group is not None:
             obj['group'] = self._group
+        self._render_state(obj)
         return json.dumps(obj)
 
 
@@ -1369,6 +1857,119 @@ class ToolbarHTML(ToolbarDropDown):
         self._type = 'html'
 
 
+class ToolbarClientState:
+    """The state of the toolbar items known to one client, i.e., the state the client
+    acknowledged and the patches sent to the client which are not acknowledged yet. The
+    toolbar diffs the changed items against it so that every client gets a patch of the
+    items which changed for that client only
+    """
+
+    _acked = None
+    _sent = None
+    _dirty = None
+    _rev = None
+    _max_sent = None
+    _last_seen = None
+
+    def __init__(self, rendered, max_sent=None):
+        """
+            Args:
+                rendered (dict): Names of the items and their state the client rendered
+                max_sent (int): Maximum number of patches waiting for acknowledgement, older
+                                patches are taken as acknowledged once there are more
+        """
+        self._acked = dict(rendered)
+        self._sent = OrderedDict()
+        # Items may have changed since the client rendered them, all get diffed once
+        self._dirty = set(rendered)
+        self._rev = 0
+        if max_sent is not None:
+            self._max_sent = max_sent
+        else:
+            self._max_sent = 16
+        self._last_seen = time.monotonic()
+
+    @property
+    def last_seen(self):
+        """The `time.monotonic` time the client was last heard from"""
+        return self._last_seen
+
+    def touch(self):
+        self._last_seen = time.monotonic()
+
+    def mark_dirty(self, item_name):
+        self._dirty.add(item_name)
+
+    def add_item(self, item_name, state):
+        """Sets the state of an item the client got rendered with the item"""
+        self._acked[item_name] = state
+        self._dirty.discard(item_name)
+
+    def remove_item(self, item_name):
+        self._acked.pop(item_name, None)
+        self._dirty.discard(item_name)
+        for sent in self._sent.values():
+            sent.pop(item_name, None)
+
+    def _get_baseline(self, item_name):
+        # The state the client has, or will have once the patches on their way are applied
+        state = self._acked.get(item_name, (False, False, False))
+        for sent in self._sent.values():
+            state = sent.get(item_name, state)
+        return state
+
+    def next_patch(self, item_index):
+        """Diffs the state of the changed items against the state known to the client and
+        returns the compact patch, or `None` if nothing changed for the client
+
+            Args:
+                item_index (dict): Names and items of the toolbar
+        """
+        patch = {}
+        sent = {}
+        for item_name in self._dirty:
+            item = item_index.get(item_name)
+            if item is None:
+                continue
+            state = item.get_state()
+            baseline = self._get_baseline(item_name)
+            for flag, keys in enumerate((('show', 'hide'), ('enable', 'disable'),
+                                         ('uncheck', 'check'))):
+                if state[flag] != baseline[flag]:
+                    key = keys[1] if state[flag] else keys[0]
+                    if key not in patch:
+                        patch[key] = []
+                    patch[key].append(item_name)
+            if state != baseline:
+                sent[item_name] = state
+        self._dirty.clear()
+        if patch.__len__() == 0:
+            return None
+        self._rev += 1
+        self._sent[self._rev] = sent
+        if self._sent.__len__() > self._max_sent:
+            # A client which stopped acknowledging must not make the patches pile up
+            self._acked.update(self._sent.popitem(last=False)[1])
+        patch['rev'] = self._rev
+        return patch
+
+    def ack(self, rev, resend=False):
+        """Marks the patch of the given revision and the older ones as applied by the client
+
+            Args:
+                rev (int): Revision of the last patch applied by the client
+                resend (boolean): If True, the newer patches are taken as lost and their items
+                                    are diffed again for the next patch
+        """
+        for sent_rev in list(self._sent):
+            if sent_rev > rev:
+                break
+            self._acked.update(self._sent.pop(sent_rev))
+        if resend:
+            for sent_rev in list(self._sent):
+                self._dirty.update(self._sent.pop(sent_rev))
+
+
 class Toolbar(Widget, Namespace):
     """A toolbar having collection of buttons, chexkbox,
     radio buttons, separaters, etc. An toolbar item can
@@ -1380,6 +1981,9 @@ class Toolbar(Widget, Namespace):
     _clicked_item = None
     _namespace = None
     _socket_io = None
+    _item_index = None
+    _rendered = None
+    _clients = None
 
     def __init__(self, name, socket_io, items=None, desc=None,
                  prop=None, style=None, attr=None, css_cls=None,
@@ -1412,6 +2016,8 @@ class Toolbar(Widget, Namespace):
             self._onclick_client_script = onclick_client_script
         else:
             self._onclick_client_script = ""
+        self._clients = {}
+        self._build_index()
 
     @property
     def namespace(self):
@@ -1435,12 +2041,35 @@ class Toolbar(Widget, Namespace):
         the mouse click event)"""
         return self._clicked_item
 
+    def _build_index(self):
+        # The clients rendering the toolbar from now on start with the current state
+        self._item_index = {}
+        self._rendered = {}
+        for item in self._child_widgets:
+            self._index_item(item)
+
+    def _index_item(self, item):
+        self._item_index[item.name] = item
+        self._rendered[item.name] = item.get_state()
+
+    def get_item(self, item_name):
+        """Returns the toolbar item having the specified name or `None`
+
+            Args:
+                item_name (string): Name or Id of the toolbar item
+        """
+        return self._item_index.get(item_name)
+
     def add_item(self, item):
         """Adds a new item to the toolbar passed as argument
 
             Args:
                 item (ToolbarButton): An instance of ToolbarButton or its subclasses
         """
+        self._child_widgets.append(item)
+        self._index_item(item)
+        for client in self._clients.values():
+            client.add_item(item.name, item.get_state())
         self._sync_properties('ADD-ITEM', item.render())
 
     def insert_item(self, item, ref_item):
@@ -1451,6 +2080,15 @@ class Toolbar(Widget, Namespace):
                 ref_item (string): Id or name of the item after which new item should be
                                     inserted
         """
+        ref = self._item_index.get(ref_item)
+        if ref is not None:
+            pos = self._child_widgets.index(ref)
+            self._child_widgets.insert(pos, item)
+        else:
+            self._child_widgets.append(item)
+        self._index_item(item)
+        for client in self._clients.values():
+            client.add_item(item.name, item.get_state())
         self._sync_properties('INSERT-ITEM', item.render(), ref_item)
 
     def remove_item(self, index_of_item):
@@ -1459,15 +2097,55 @@ class Toolbar(Widget, Namespace):
             Args:
                 index_of_item (int): Index of item that needs to be removed from toolbar
         """
+        item = self._item_index.pop(index_of_item, None)
+        if item is not None:
+            self._child_widgets.remove(item)
+            self._rendered.pop(index_of_item, None)
+            for client in self._clients.values():
+                client.remove_item(index_of_item)
         self._sync_properties('REMOVE-ITEM', index_of_item)
 
+    def update_items(self, show=None, hide=None, enable=None, disable=None, check=None,
+                     uncheck=None):
+        """Changes the state of a number of toolbar items at once. The new state is
+        diffed against the state last acknowledged by each client and only the items
+        which actually changed for the client are sent to it as one patch
+
+            Args:
+                show (list): Names of the items to be set visible
+                hide (list): Names of the items to be set hidden
+                enable (list): Names of the items to be enabled
+                disable (list): Names of the items to be disabled
+                check (list): Names of the items to be checked
+                uncheck (list): Names of the items to be unchecked
+
+            The items not known to the toolbar, e.g. the items of a menu ("menu:item"), are
+            sent to the client one by one as they are
+        """
+        for names, flag, val, cmd in ((show, 'hidden', False, 'SHOW-ITEM'),
+                                      (hide, 'hidden', True, 'HIDE-ITEM'),
+                                      (enable, 'disabled', False, 'ENABLE-ITEM'),
+                                      (disable, 'disabled', True, 'DISABLE-ITEM'),
+                                      (check, 'checked', True, 'CHECK-ITEM'),
+                                      (uncheck, 'checked', False, 'UNCHECK-ITEM')):
+            if names is not None:
+                for item_name in names:
+                    item = self._item_index.get(item_name)
+                    if item is not None:
+                        setattr(item, flag, val)
+                        for client in self._clients.values():
+                            client.mark_dirty(item_name)
+                    else:
+                        self._sync_properties(cmd, item_name)
+        self._sync_patch()
+
     def show_item(self, item_name):
         """Shows an item which was in hidden state previously
 
             Args:
                 item_name (string): Name or Id of the toolbar item that needs to be set visible
         """
-        self._sync_properties('SHOW-ITEM', item_name)
+        self.update_items(show=[item_name])
 
     def hide_item(self, item_name):
         """Hides an visible item available on the toolbar
@@ -1475,7 +2153,7 @@ class Toolbar(Widget, Namespace):
             Args:
                 item_name (string): Name or Id of the toolbar item that needs to be set as hidden
         """
-        self._sync_properties('HIDE-ITEM', item_name)
+        self.update_items(hide=[item_name])
 
     def enable_item(self, item_name):
         """Enables an visible toollbar item if its has been set as disiabled
@@ -1483,7 +2161,7 @@ class Toolbar(Widget, Namespace):
             Args:
                 item_name (string): Name or Id of item that needs to be enabled
         """
-        self._sync_properties('ENABLE-ITEM', item_name)
+        self.update_items(enable=[item_name])
 
     def disable_item(self, item_name):
         """Disable an visible toolbar item which is already in enabled state
@@ -1491,11 +2169,49 @@ class Toolbar(Widget, Namespace):
             Args:
                 item_name (string): Name or Id of the item that needs to be disabled
         """
-        self._sync_properties('DISABLE-ITEM', item_name)
+        self.update_items(disable=[item_name])
+
+    def check_item(self, item_name):
+        """Checks an check or radio item of the toolbar
+
+            Args:
+                item_name (string): Name or Id of the item that needs to be checked
+        """
+        self.update_items(check=[item_name])
+
+    def uncheck_item(self, item_name):
+        """Unchecks an checked item of the toolbar
+
+            Args:
+                item_name (string): Name or Id of the item that needs to be unchecked
+        """
+        self.update_items(uncheck=[item_name])
+
+    def _sync_patch(self):
+        # Every client gets the patch of the items which changed for it
+        for sid, client in list(self._clients.items()):
+            patch = client.next_patch(self._item_index)
+            if patch is not None:
+                self._socket_io.emit('sync_properties_' + self._name,
+                                     {'cmd': 'PATCH-ITEMS', 'value': patch, 'ref_item': None},
+                                     namespace=self._namespace, to=sid)
+
+    def on_connect(self, auth=None):
+        Widget.on_connect(self, auth)
+        self._clients[request.sid] = ToolbarClientState(self._rendered)
+
+    def on_disconnect(self):
+        Widget.on_disconnect(self)
+        self._clients.pop(request.sid, None)
+
+    def on_ack_patch(self, props):
+        client = self._clients.get(request.sid)
+        if client is not None:
+            client.ack(props['rev'])
 
     def _sync_properties(self, cmd, value, ref_item=None):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value, 'ref_item': ref_item},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value, 'ref_item': ref_item},
+                   namespace=self._namespace)
 
     def _attach_script(self):
         child_widgets = "[\n"
@@ -1519,6 +2235,17 @@ class Toolbar(Widget, Namespace):
                         socket.on("sync_properties_%s", function(props){
                             if(name != undefined){
                                 if(props.cmd != undefined){
+                                    if(props.cmd == "PATCH-ITEMS"){
+                                        var keys = ['show', 'hide', 'enable', 'disable',
+                                                    'check', 'uncheck'];
+                                        for(var i = 0; i < keys.length; i++){
+                                            if(props.value[keys[i]] != undefined){
+                                                w2ui[name][keys[i]].apply(w2ui[name],
+                                                                          props.value[keys[i]]);
+                                            }
+                                        }
+                                        socket.emit("ack_patch", {"rev": props.value.rev});
+                                    }
                                     if(props.cmd == "HIDE-ITEM"){
                                         w2ui[name].hide(props.value);
                                     }
@@ -1531,6 +2258,12 @@ class Toolbar(Widget, Namespace):
                                     if(props.cmd == "DISABLE-ITEM"){
                                         w2ui[name].disable(props.value);
                                     }
+                                    if(props.cmd == "CHECK-ITEM"){
+                                        w2ui[name].check(props.value);
+                                    }
+                                    if(props.cmd == "UNCHECK-ITEM"){
+                                        w2ui[name].uncheck(props.value);
+                                    }
                                     if(props.cmd == "ADD-ITEM"){
                                         w2ui[name].add(JSON.parse(props.value));
                                     }
@@ -1557,7 +2290,7 @@ class Toolbar(Widget, Namespace):
             if val is not None:
                 self._clicked_item = val
         if self._onclick_callback is not None:
-            self._onclick_callback(self._name, props)
+            self._run_callback(self._onclick_callback, self._name, props)
 
     def on_click(self, onclick_callback):
         """Adds an event handler to on_click event of the widget. The event handler can be
@@ -1569,6 +2302,7 @@ class Toolbar(Widget, Namespace):
         self._onclick_callback = onclick_callback
 
     def render(self):
+        self._build_index()
         content = self._render_pre_content('div')
         content += self._render_post_content('div')
         content += "\n" + self._attach_script()
@@ -1591,6 +2325,8 @@ class SidebarNode(Widget):
     _img = None
     _group = None
     _count = None
+    _hidden = None
+    _disabled = None
 
     def __init__(self, name, text=None, icon=None, is_leaf=None, expanded=None,
                  img=None, group=None, count=None, nodes=None):
@@ -1643,10 +2379,51 @@ class SidebarNode(Widget):
     def is_leaf(self, val):
         self._is_leaf = val
 
-    def render(self):
+    @property
+    def expanded(self):
+        """Whether the node is displayed as expanded"""
+        return self._expanded
+
+    @expanded.setter
+    def expanded(self, val):
+        self._expanded = val
+
+    @property
+    def hidden(self):
+        """Whether the node is hidden in the sidebar"""
+        return self._hidden
+
+    @hidden.setter
+    def hidden(self, val):
+        self._hidden = val
+
+    @property
+    def disabled(self):
+        """Whether the node is disabled in the sidebar"""
+        return self._disabled
+
+    @disabled.setter
+    def disabled(self, val):
+        self._disabled = val
+
+    @property
+    def nodes(self):
+        """The child nodes of the current node"""
+        return self._child_widgets
+
+    def render(self, lazy=False):
         """Renders an node or leaf depending upon the value of `is_leaf' attribute
+
+            Args:
+                lazy (boolean): If True, the child nodes of a collapsed node are not rendered
+                                and the node is marked with a plus so that its children can
+                                be fetched once it gets expanded
         """
         obj = {}
+        if self._hidden:
+            obj['hidden'] = True
+        if self._disabled:
+            obj['disabled'] = True
         if self._is_leaf:
             obj['id'] = self._name
             if self._text is not None:
@@ -1670,8 +2447,11 @@ class SidebarNode(Widget):
                 obj['expanded'] = self._expanded
             if self._child_widgets is not None:
                 obj['nodes'] = []
+                if lazy and not self._expanded and self._child_widgets.__len__() > 0:
+                    obj['plus'] = True
+                    return obj
                 for child in self._child_widgets:
-                    obj['nodes'].append(child.render())
+                    obj['nodes'].append(child.render(lazy))
             return obj
 
 
@@ -1689,11 +2469,14 @@ class Sidebar(Widget, Namespace):
     _clicked_item = None
     _namespace = None
     _socket_io = None
+    _lazy_load = None
+    _node_index = None
+    _parent_index = None
 
     def __init__(self, name, socket_io, nodes=None, desc=None, prop=None,
                  style=None, attr=None, css_cls=None, onclick_callback=None,
                  onclick_client_script=None, topHTML=None, bottomHTML=None,
-                 flatButton=None):
+                 flatButton=None, lazy_load=None):
         """
             Args:
                 name (string): Name or Id for internal use
@@ -1708,6 +2491,9 @@ class Sidebar(Widget, Namespace):
                 topHTML (string): HTML to show at the top of the sidebar
                 bottomHTML (string): HTML to be shown on the bottom of sidebar
                 flatButton (boolean): If true, it will show button to minimize or flat the sidebar
+                lazy_load (boolean): If true, only the headers of collapsed nodes are rendered
+                                    and their child nodes are fetched from the server once the
+                                    node gets expanded
         """
         Widget.__init__(self, name, desc=desc, prop=prop, style=style, attr=attr,
                         css_cls=css_cls)
@@ -1736,6 +2522,11 @@ class Sidebar(Widget, Namespace):
             self._flatButton = flatButton
         else:
             self._flatButton = False
+        if lazy_load is not None:
+            self._lazy_load = lazy_load
+        else:
+            self._lazy_load = False
+        self._build_index()
 
     @property
     def namespace(self):
@@ -1782,17 +2573,75 @@ class Sidebar(Widget, Namespace):
     def clicked_item(self, val):
         self._clicked_item = val
 
-    def add_items(self, items):
+    @property
+    def lazy_load(self):
+        """Whether the child nodes of collapsed nodes are fetched on expand"""
+        return self._lazy_load
+
+    def _build_index(self):
+        self._node_index = {}
+        self._parent_index = {}
+        for child in self._child_widgets:
+            self._index_node(child, None)
+
+    def _index_node(self, node, parent):
+        self._node_index[node.get_name()] = node
+        self._parent_index[node.get_name()] = parent
+        for child in node.nodes:
+            self._index_node(child, node)
+
+    def _unindex_node(self, node):
+        self._node_index.pop(node.get_name(), None)
+        self._parent_index.pop(node.get_name(), None)
+        for child in node.nodes:
+            self._unindex_node(child)
+
+    def _render_items(self, items):
+        content = []
+        for item in items:
+            content.append(item.render(self._lazy_load))
+        return content
+
+    def get_node(self, item):
+        """Returns the `SidebarNode` having the specified name, `None` if there is no such node
+
+            Args:
+                item (string): Name or Id of the node
+        """
+        return self._node_index.get(item)
+
+    def get_children(self, item):
+        """Returns the rendered child nodes of the specified node which are sent to the
+        client once a collapsed node is expanded in the lazy mode. Which nodes are expanded
+        or loaded is left to each client, the server side nodes are not changed
+
+            Args:
+                item (string): Name or Id of the node
+        """
+        node = self._node_index.get(item)
+        if node is None:
+            return []
+        return self._render_items(node.nodes)
+
+    def add_items(self, items, parent=None):
         """Adds items to sidebar which are passed as list of items to
         this method
 
             Args:
                 items (list): List of SidebarNode items
-        """
-        content = []
+                parent (string): Name of the node to which the items are added as child nodes,
+                                    if None the items are added at the root level
+        """
+        parent_node = None
+        siblings = self._child_widgets
+        if parent is not None:
+            parent_node = self._node_index.get(parent)
+            if parent_node is not None:
+                siblings = parent_node.nodes
         for item in items:
-            content.append(item.render())
-        self._sync_properties('ADD-ITEMS', content)
+            siblings.append(item)
+            self._index_node(item, parent_node)
+        self._sync_properties('ADD-ITEMS', self._render_items(items), parent)
 
     def insert_items(self, items, ref_item):
         """Insert specified items after the item passed for reference
@@ -1801,10 +2650,15 @@ class Sidebar(Widget, Namespace):
                 items (list): List of sidebar nodes
                 ref_item (string): Name of the referenced item
         """
-        content = []
-        for item in items:
-            content.append(item.render())
-        self._sync_properties('INSERT-ITEMS', content, ref_item)
+        ref_node = self._node_index.get(ref_item)
+        if ref_node is not None:
+            parent_node = self._parent_index.get(ref_item)
+            siblings = parent_node.nodes if parent_node is not None else self._child_widgets
+            pos = siblings.index(ref_node)
+            siblings[pos:pos] = items
+            for item in items:
+                self._index_node(item, parent_node)
+        self._sync_properties('INSERT-ITEMS', self._render_items(items), ref_item)
 
     def remove_items(self, items):
         """Removes all items from the toolbar passed as arg to this method
@@ -1812,14 +2666,30 @@ class Sidebar(Widget, Namespace):
             Args:
                 items (list): A list of item names to be removed from toolbar
         """
+        for item in items:
+            node = self._node_index.get(item)
+            if node is not None:
+                parent_node = self._parent_index.get(item)
+                siblings = parent_node.nodes if parent_node is not None else self._child_widgets
+                siblings.remove(node)
+                self._unindex_node(node)
         self._sync_properties('REMOVE-ITEMS', json.dumps(items))
 
+    def _set_flag(self, items, flag, val):
+        # Updates the flag of the nodes on the server, a client applies the command only to
+        # the nodes it has loaded and gets the others with the flag set once they load
+        for item in items:
+            node = self._node_index.get(item)
+            if node is not None:
+                setattr(node, flag, val)
+
     def show_items(self, items):
         """Shows the hidden items passed as list of item names
 
             Args:
                 items (list): List of names of items
         """
+        self._set_flag(items, 'hidden', False)
         self._sync_properties('SHOW-ITEMS', json.dumps(items))
 
     def hide_items(self, items):
@@ -1828,6 +2698,7 @@ class Sidebar(Widget, Namespace):
             Args:
                 items (list): List of item names
         """
+        self._set_flag(items, 'hidden', True)
         self._sync_properties('HIDE-ITEMS', json.dumps(items))
 
     def enable_item(self, item):
@@ -1836,6 +2707,7 @@ class Sidebar(Widget, Namespace):
             Args:
                 item (string): Name or Id of the item that needs to be enabled
         """
+        self._set_flag([item], 'disabled', False)
         self._sync_properties('ENABLE-ITEM', item)
 
     def disable_item(self, item):
@@ -1844,6 +2716,7 @@ class Sidebar(Widget, Namespace):
             Args:
                 item (string): Name or Id of the item that needs to be enabled
         """
+        self._set_flag([item], 'disabled', True)
         self._sync_properties('DISABLE-ITEM', item)
 
     def expand_item(self, item):
@@ -1852,6 +2725,7 @@ class Sidebar(Widget, Namespace):
             Args:
                 item (string): Name or Id of the node that needs to be expanded
         """
+        self._set_flag([item], 'expanded', True)
         self._sync_properties('EXPAND-ITEM', item)
 
     def collapse_item(self, item):
@@ -1860,6 +2734,7 @@ class Sidebar(Widget, Namespace):
             Args:
                 item (string): Collapse the provided node
         """
+        self._set_flag([item], 'expanded', False)
         self._sync_properties('COLLAPSE-ITEM', item)
 
     def select_item(self, item):
@@ -1896,14 +2771,15 @@ class Sidebar(Widget, Namespace):
         self._onclick_callback = click_callback
 
     def _sync_properties(self, cmd, value, ref_item=None):
-        emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value,
-             'ref_item': ref_item},
-             namespace=self._namespace)
+        self._emit('sync_properties_' + self._name, {'cmd': cmd, 'value': value,
+                   'ref_item': ref_item},
+                   namespace=self._namespace)
 
     def _attach_script(self):
+        self._build_index()
         child_widgets = "[\n"
-        for child in self._child_widgets:
-            child_widgets += json.dumps(child.render()) + ",\n"
+        for child in self._render_items(self._child_widgets):
+            child_widgets += json.dumps(child) + ",\n"
         child_widgets += "\n]"
         script = """<script>
                     $2(document).ready(function(){
@@ -1926,19 +2802,41 @@ class Sidebar(Widget, Namespace):
                                         w2ui[name].disable(props.value);
                                     }
                                     if(props.cmd == "ADD-ITEMS"){
-                                        w2ui[name].add(props.value);
+                                        if(props.ref_item != undefined && props.ref_item != null){
+                                            var parent = w2ui[name].get(props.ref_item);
+                                            // Children of a parent not loaded yet come with its expand
+                                            if(parent != null && !(parent.plus && parent.nodes.length == 0)){
+                                                w2ui[name].add(props.ref_item, props.value);
+                                            }
+                                        } else {
+                                            w2ui[name].add(props.value);
+                                        }
+                                    }
+                                    if(props.cmd == "LOAD-ITEMS"){
+                                        var node = w2ui[name].get(props.ref_item);
+                                        if(node != null){
+                                            node.plus = false;
+                                            w2ui[name].add(props.ref_item, props.value);
+                                            w2ui[name].expand(props.ref_item);
+                                        }
                                     }
                                     if(props.cmd == "INSERT-ITEMS"){
-                                        w2ui[name].insert(props.ref_item, props.value);
+                                        if(w2ui[name].get(props.ref_item) != null){
+                                            w2ui[name].insert(props.ref_item, props.value);
+                                        }
                                     }
                                     if(props.cmd == "REMOVE-ITEMS"){
                                         w2ui[name].remove(JSON.parse(props.value));
                                     }
                                     if(props.cmd == "COLLAPSE-ITEM"){
-                                        w2ui[name].collapse(props.value);
+                                        if(w2ui[name].get(props.value) != null){
+                                            w2ui[name].collapse(props.value);
+                                        }
                                     }
                                     if(props.cmd == "EXPAND-ITEM"){
-                                        w2ui[name].expand(props.value);
+                                        if(w2ui[name].get(props.value) != null){
+                                            w2ui[name].expand(props.value);
+                                        }
                                     }
                                     if(props.cmd == "SELECT-ITEM"){
                                         w2ui[name].select(props.value);
@@ -1964,6 +2862,13 @@ class Sidebar(Widget, Namespace):
                                 onFlat: function(event){
                                     $2('#%s').css('width', (event.goFlat ? '35px' : '200px'));
                                 },
+                                onExpand: function(event){
+                                    var node = this.get(event.target);
+                                    if(node != null && node.plus && node.nodes.length == 0){
+                                        event.preventDefault();
+                                        socket.emit('fire_expand_event', {'id': event.target});
+                                    }
+                                },
                                 onClick: function(event){
                                     %s
                                     var props = {'target': event.target};
@@ -1978,6 +2883,11 @@ class Sidebar(Widget, Namespace):
                        self._onclick_client_script)
         return script
 
+    def on_fire_expand_event(self, props):
+        # Only the client expanding the node gets its children
+        emit('sync_properties_' + self._name, {'cmd': 'LOAD-ITEMS', 'value': self.get_children(props['id']),
+             'ref_item': props['id']}, namespace=self._namespace)
+
     def on_fire_click_event(self, props):
         if props.__len__() > 0:
             val = props['target']
@@ -1985,7 +2895,7 @@ class Sidebar(Widget, Namespace):
                 self._clicked_item = val
         print('Fire Click Event: ' + val)
         if self._onclick_callback is not None:
-            self._onclick_callback()
+            self._run_callback(self._onclick_callback)
 
     def render(self):
         """Renders the sidebar with its nodes and subnodes"""
@@ -1995,6 +2905,86 @@ class Sidebar(Widget, Namespace):
         return content
 
 
+class FormFieldOptionStore:
+    """An indexed store of the options of list, enum and select fields which are searched
+    on the server instead of being embedded into the form. The options are kept sorted
+    by their lower cased text so that a prefix search is a binary search followed by a
+    scan of the matching options only. The results of recent searches are cached
+    """
+
+    _keys = None
+    _options = None
+    _max_results = None
+    _cache = None
+    _cache_size = None
+
+    def __init__(self, items=None, max_results=None, cache_size=None):
+        """
+            Args:
+                items (list): Options as strings or as dicts having 'id' and 'text' keys
+                max_results (int): Maximum number of options returned by a search
+                cache_size (int): Number of recent searches to be cached
+        """
+        if max_results is not None:
+            self._max_results = max_results
+        else:
+            self._max_results = 50
+        if cache_size is not None:
+            self._cache_size = cache_size
+        else:
+            self._cache_size = 128
+        self.items = items if items is not None else []
+
+    @property
+    def items(self):
+        """The options of the store in sorted order"""
+        return self._options
+
+    @items.setter
+    def items(self, val):
+        options = []
+        for item in val:
+            if isinstance(item, dict):
+                options.append((str(item.get('text')).lower(), item))
+            else:
+                options.append((str(item).lower(), {'id': item, 'text': item}))
+        options.sort(key=lambda option: option[0])
+        self._keys = [option[0] for option in options]
+        self._options = [option[1] for option in options]
+        self._cache = OrderedDict()
+
+    @property
+    def max_results(self):
+        """Maximum number of options returned by a search"""
+        return self._max_results
+
+    def search(self, prefix, max_results=None):
+        """Returns the options whose text starts with the passed prefix, ignoring the case
+
+            Args:
+                prefix (string): Text typed by the user
+                max_results (int): Maximum number of options to be returned, defaults to the
+                                    `max_results` of the store
+        """
+        if max_results is None or max_results > self._max_results:
+            max_results = self._max_results
+        key = (prefix.lower(), max_results)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        result = []
+        pos = bisect_left(self._keys, key[0])
+        while pos < self._keys.__len__() and result.__len__() < max_results:
+            if not self._keys[pos].startswith(key[0]):
+                break
+            result.append(self._options[pos])
+            pos += 1
+        self._cache[key] = result
+        if self._cache.__len__() > self._cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+
 class FormFieldText(Widget):
     """A most basic form of field in an form. It allows user to enter any kind of text as input"""
 
@@ -2004,6 +2994,8 @@ class FormFieldText(Widget):
     _items = None
     _caption = None
     _attributes = None
+    _store = None
+    _search_url = None
 
     def __init__(self, name, required=None, options=None, items=None,
                  caption=None, attributes=None):
@@ -2036,12 +3028,49 @@ class FormFieldText(Widget):
             self._caption = name
         self._attributes = attributes
 
+    @property
+    def option_store(self):
+        """The `FormFieldOptionStore` searched on the server, `None` if the options are
+        embedded into the form
+        """
+        return self._store
+
+    @property
+    def search_url(self):
+        """URL from which the options are fetched by the client in remote mode"""
+        return self._search_url
+
+    @search_url.setter
+    def search_url(self, val):
+        self._search_url = val
+
+    def _set_remote(self, remote, items, max_results, cache_size):
+        if remote:
+            self._store = FormFieldOptionStore(items, max_results, cache_size)
+            self._items = None
+
+    def _process_search_callback(self):
+        search = ''
+        max_results = None
+        if 'request' in request.args:
+            # w2ui sends the search parameters as JSON
+            req = json.loads(request.args['request'])
+            search = req.get('search', '')
+            max_results = req.get('max')
+        elif 'search' in request.args:
+            search = request.args['search']
+        return json.dumps({'status': 'success',
+                           'records': self._store.search(str(search), max_results)})
+
     def render(self):
         content = "{ "
         content += "field: '" + self._name + "', "
         content += "type: '" + self._type + "', "
         content += "required: " + json.dumps(self._required) + ", "
-        if self._options is not None and self._options:
+        if self._store is not None and self._search_url is not None:
+            content += "options: {url: '/" + self._search_url + "', "
+            content += "cacheMax: " + str(self._store.max_results) + "}, "
+        elif self._options is not None and self._options:
             content += "options: {items: ["
             if self._items is not None:
                 for item in self._items:
@@ -2100,20 +3129,38 @@ class FormFieldList(FormFieldText):
     """Field which can hold list of values and display them as dropdown widget """
 
     def __init__(self, name, required=None, options=None, items=None,
-                 caption=None, attributes=None):
+                 caption=None, attributes=None, remote=None, max_results=None,
+                 cache_size=None):
+        """
+            Args:
+                remote (boolean): If True, the items are not embedded into the form but
+                                    are searched on the server as the user types
+                max_results (int): Maximum number of items sent for a search in remote mode
+                cache_size (int): Number of recent searches cached in remote mode
+        """
         FormFieldText.__init__(self, name, required, options, items,
                                caption, attributes)
         self._type = 'list'
+        self._set_remote(remote, items, max_results, cache_size)
 
 
 class FormFieldEnum(FormFieldText):
     """Field which to select multiple options and display it as tokens in the textfield widget"""
 
     def __init__(self, name, required=None, options=None, items=None,
-                 caption=None, attributes=None):
+                 caption=None, attributes=None, remote=None, max_results=None,
+                 cache_size=None):
+        """
+            Args:
+                remote (boolean): If True, the items are not embedded into the form but
+                                    are searched on the server as the user types
+                max_results (int): Maximum number of items sent for a search in remote mode
+                cache_size (int): Number of recent searches cached in remote mode
+        """
         FormFieldText.__init__(self, name, required, options, items,
                                caption, attributes)
         self._type = 'enum'
+        self._set_remote(remote, items, max_results, cache_size)
 
 
 class FormFieldSelect(FormFieldText):
@@ -2122,10 +3169,22 @@ class FormFieldSelect(FormFieldText):
     """
 
     def __init__(self, name, required=None, options=None, items=None,
-                 caption=None, attributes=None):
+                 caption=None, attributes=None, remote=None, max_results=None,
+                 cache_size=None):
+        """
+            Args:
+                remote (boolean): If True, the items are not embedded into the form but
+                                    are searched on the server as the user types. As the
+                                    native select can't search, the field is rendered as list
+                max_results (int): Maximum number of items sent for a search in remote mode
+                cache_size (int): Number of recent searches cached in remote mode
+        """
         FormFieldText.__init__(self, name, required, options, items,
                                caption, attributes)
         self._type = 'select'
+        self._set_remote(remote, items, max_results, cache_size)
+        if remote:
+            self._type = 'list'
 
 
 class FormFieldCheckbox(FormFieldText):
@@ -2295,17 +3354,29 @@ class Form(Widget, Namespace):
         self._form_data = request.form
         if self._submit_callback is not None:
             try:
-                self._submit_callback(request.form)
+                self._run_callback(self._submit_callback, request.form)
             except Exception as err:
                 return json.dumps({'status': 'error', 'message': str(err)})
         return json.dumps({'status': 'success'})
 
     def on_reset_click_event(self):
         if self._reset_callback is not None:
-            self._reset_callback()
+            self._run_callback(self._reset_callback)
 
     def _attach_script(self):
         # Prepare the fields to be added to form
+        for field in self._child_widgets:
+            if field.option_store is not None and self._app is not None:
+                search_url = str(__name__ + "_" + self._name + "_" + field.get_name() +
+                                 "_search").replace('.', '_')
+                found = False
+                for rule in self._app.url_map.iter_rules():
+                    if rule.endpoint == search_url:
+                        found = True
+                if not found:
+                    self._app.add_url_rule('/' + search_url, search_url,
+                                           field._process_search_callback)
+                field.search_url = search_url
         fields = "[\n"
         for field in self._child_widgets:
             fields += field.render() + ",\n"